@@ -11,6 +11,9 @@ import copy
 import abc
 import six
 import warnings
+from collections import OrderedDict
+from . import arrays
+from . import elements
 from . import utilities
 
 
@@ -27,9 +30,12 @@ class Curve(six.with_metaclass(abc.ABCMeta, object)):
     these properties.
 
     The Curve ABC allows users to set the *FindSpan* function to be used in evaluations with ``find_span_func`` keyword
-    as an input to the class constructor. NURBS-Python includes a binary and a linear search variation of the FindSpan
-    function in the ``helpers`` module.
+    as an input to the class constructor. NURBS-Python includes binary search, bisection and linear search variations
+    of the FindSpan function in the ``helpers`` module.
     You may also implement and use your own *FindSpan* function. Please see the ``helpers`` module for details.
+
+    The control points and the evaluated points can be stored in a compact form by setting ``compact`` keyword argument
+    to True. Please see :py:attr:`~compact` property for details.
     """
 
     def __init__(self, **kwargs):
@@ -49,6 +55,7 @@ class Curve(six.with_metaclass(abc.ABCMeta, object)):
         self._evaluator = None  # evaluator instance
         self._precision = 6  # number of decimal places to round to
         self._span_func = kwargs.get('find_span_func', None)  # "find_span" function
+        self._compact = kwargs.get('compact', False)  # compact storage mode
         self._cache = {}  # cache dictionary
 
     def __copy__(self):
@@ -100,6 +107,27 @@ class Curve(six.with_metaclass(abc.ABCMeta, object)):
     def name(self, value):
         self._name = value
 
+    @property
+    def compact(self):
+        """ Compact storage mode.
+
+        In the compact storage mode, the control points and the evaluated points are stored in a single contiguous
+        buffer of double precision floating point numbers using :py:class:`.arrays.PointArray` class, instead of a list
+        of Python lists. The individual points are returned as zero-copy views of the buffer. Setting this property
+        converts the existing control points and evaluated points.
+
+        :getter: Gets the compact storage mode flag
+        :setter: Sets the compact storage mode flag
+        :type: bool
+        """
+        return self._compact
+
+    @compact.setter
+    def compact(self, value):
+        self._compact = bool(value)
+        self._control_points = self._store_points(self._control_points)
+        self._curve_points = self._store_points(self._curve_points)
+
     @property
     def evaluator(self):
         """ Curve evaluator.
@@ -169,8 +197,9 @@ class Curve(six.with_metaclass(abc.ABCMeta, object)):
         if val < 0:
             raise ValueError("Degree cannot be less than zero")
 
-        # Clean up the curve points list
+        # Clean up the curve points list and the arc length table
         self.reset(evalpts=True)
+        self._cache['arc_length'] = None
 
         # Set degree
         self._degree = val
@@ -193,8 +222,9 @@ class Curve(six.with_metaclass(abc.ABCMeta, object)):
         if not utilities.check_knot_vector(self._degree, value, len(self._control_points)):
             raise ValueError("Input is not a valid knot vector")
 
-        # Clean up the curve points lists
+        # Clean up the curve points lists and the arc length table
         self.reset(evalpts=True)
+        self._cache['arc_length'] = None
 
         # Set knot vector
         self._knot_vector = value
@@ -374,7 +404,20 @@ class Curve(six.with_metaclass(abc.ABCMeta, object)):
             # Convert to list of floats
             ctrlpts_float[idx] = [float(coord) for coord in cpt]
 
-        self._control_points = ctrlpts_float
+        self._control_points = self._store_points(ctrlpts_float)
+
+    def _store_points(self, points):
+        """ Converts the input points to the storage type defined by the compact storage mode.
+
+        :param points: input points
+        :type points: list, arrays.PointArray
+        :return: points in the storage type
+        """
+        if self._compact and isinstance(points, list) and len(points) > 0:
+            return arrays.PointArray(points)
+        if not self._compact and isinstance(points, arrays.PointArray):
+            return points.tolist()
+        return points
 
     # Runs visualization component to render the surface
     def render(self, **kwargs):
@@ -429,6 +472,7 @@ class Curve(six.with_metaclass(abc.ABCMeta, object)):
         if reset_ctrlpts:
             self._control_points = self._init_var(self._array_type)
             self._bounding_box = self._init_var(self._array_type)
+            self._cache['arc_length'] = None
 
         if reset_evalpts:
             self._curve_points = self._init_var(self._array_type)
@@ -500,6 +544,21 @@ class Curve(six.with_metaclass(abc.ABCMeta, object)):
         # Should implement the derivatives functionality
         pass
 
+    def derivatives_list(self, u_list, order=0, **kwargs):
+        """ Evaluates the derivatives of the curve for an input list of parameters.
+
+        The default implementation calls :py:meth:`derivatives` for each parameter. The subclasses may override this
+        method to evaluate the derivatives in batch.
+
+        :param u_list: list of parameters
+        :type u_list: list, tuple
+        :param order: derivative order
+        :type order: int
+        :return: derivatives at the input parameters
+        :rtype: list
+        """
+        return [self.derivatives(u, order, **kwargs) for u in u_list]
+
 
 class Surface(six.with_metaclass(abc.ABCMeta, object)):
     """ Abstract base class (ABC) for all surfaces.
@@ -514,9 +573,12 @@ class Surface(six.with_metaclass(abc.ABCMeta, object)):
     these properties.
 
     The Surface ABC allows users to set the *FindSpan* function to be used in evaluations with ``find_span_func``
-    keyword as an input to the class constructor. NURBS-Python includes a binary and a linear search variation of the
-    FindSpan function in the ``helpers`` module.
+    keyword as an input to the class constructor. NURBS-Python includes binary search, bisection and linear search
+    variations of the FindSpan function in the ``helpers`` module.
     You may also implement and use your own *FindSpan* function. Please see the ``helpers`` module for details.
+
+    The control points and the evaluated points can be stored in a compact form by setting ``compact`` keyword argument
+    to True. Please see :py:attr:`~compact` property for details.
     """
 
     def __init__(self, **kwargs):
@@ -545,6 +607,7 @@ class Surface(six.with_metaclass(abc.ABCMeta, object)):
         self._evaluator = None  # evaluator instance
         self._precision = 6  # number of decimal places to round to
         self._span_func = kwargs.get('find_span_func', None)  # "find_span" function
+        self._compact = kwargs.get('compact', False)  # compact storage mode
         self._cache = {}  # cache dictionary
         # Advanced functionality
         self._trims = self._init_var(self._array_type)  # trim curves
@@ -598,6 +661,29 @@ class Surface(six.with_metaclass(abc.ABCMeta, object)):
     def name(self, value):
         self._name = value
 
+    @property
+    def compact(self):
+        """ Compact storage mode.
+
+        In the compact storage mode, the control points and the evaluated points are stored in a single contiguous
+        buffer of double precision floating point numbers using :py:class:`.arrays.PointArray` class, instead of a list
+        of Python lists. The individual points are returned as zero-copy views of the buffer and the 2-dimensional
+        control points array contains the views of the 1-dimensional one. Setting this property converts the existing
+        control points and evaluated points.
+
+        :getter: Gets the compact storage mode flag
+        :setter: Sets the compact storage mode flag
+        :type: bool
+        """
+        return self._compact
+
+    @compact.setter
+    def compact(self, value):
+        self._compact = bool(value)
+        if len(self._control_points) > 0:
+            self._store_ctrlpts(self._control_points, self._control_points_size_u, self._control_points_size_v)
+        self._surface_points = self._store_points(self._surface_points)
+
     @property
     def evaluator(self):
         """ Curve evaluator.
@@ -1151,6 +1237,42 @@ class Surface(six.with_metaclass(abc.ABCMeta, object)):
         self._control_points_size_u = size_u
         self._control_points_size_v = size_v
 
+        # Convert to compact storage, if necessary
+        if self._compact:
+            self._store_ctrlpts(ctrlpts_float, size_u, size_v)
+
+    def _store_points(self, points):
+        """ Converts the input points to the storage type defined by the compact storage mode.
+
+        :param points: input points
+        :type points: list, arrays.PointArray
+        :return: points in the storage type
+        """
+        if self._compact and isinstance(points, list) and len(points) > 0:
+            return arrays.PointArray(points)
+        if not self._compact and isinstance(points, arrays.PointArray):
+            return points.tolist()
+        return points
+
+    def _store_ctrlpts(self, ctrlpts, size_u, size_v):
+        """ Stores the 1-dimensional control points and generates the 2-dimensional control points array.
+
+        :param ctrlpts: control points in v-order
+        :type ctrlpts: list, arrays.PointArray
+        :param size_u: size of the control points grid on the u-direction
+        :type size_u: int
+        :param size_v: size of the control points grid on the v-direction
+        :type size_v: int
+        """
+        self._control_points = self._store_points(ctrlpts)
+        self._control_points_size_u = size_u
+        self._control_points_size_v = size_v
+        if isinstance(self._control_points, arrays.PointArray):
+            self._control_points2D = self._control_points.reshape(size_u, size_v)
+        else:
+            self._control_points2D = [[self._control_points[v + (u * size_v)] for v in range(size_v)]
+                                      for u in range(size_u)]
+
     # Runs visualization component to render the surface
     def render(self, **kwargs):
         """ Renders the surface using the loaded visualization component.
@@ -1231,6 +1353,13 @@ class Surface(six.with_metaclass(abc.ABCMeta, object)):
                                     size=[self.sample_size_u, self.sample_size_v],
                                     name=self.name, color=evalcolor, plot_type='evalpts')
 
+        # Add surface points as vertex coordinates and triangle vertex indices
+        if self._vis_component.plot_types['evalpts'] == 'triangle_indices':
+            vertices, triangles, _ = self._tessellate_index_array()
+            self._vis_component.add(ptsarr=[vertices, triangles],
+                                    size=[self.sample_size_u, self.sample_size_v],
+                                    name=self.name, color=evalcolor, plot_type='evalpts')
+
         # Visualize the trim curve
         for idx, trim in enumerate(self._trims):
             self._vis_component.add(ptsarr=self.evaluate_list(trim.evalpts),
@@ -1255,6 +1384,27 @@ class Surface(six.with_metaclass(abc.ABCMeta, object)):
         for idx in range(len(self._tsl_component.vertices)):
             self._tsl_component.vertices[idx].data = self.evaluate_single(self._tsl_component.vertices[idx].uv)
 
+    def _tessellate_index_array(self, **kwargs):
+        """ Tessellates the surface and returns the mesh as index arrays.
+
+        Keyword arguments are directly passed to the tessellation component. If the tessellation component does not
+        support index arrays, the surface is tessellated via :py:meth:`tessellate()` and the index arrays are generated
+        from the vertex and triangle objects.
+
+        :return: a tuple containing the vertex coordinates, the zero-indexed vertex indices of the triangles and the
+            parametric coordinates of the vertices
+        :rtype: tuple
+        """
+        try:
+            return self._tsl_component.tessellate_index_array(self.evalpts, self.sample_size_u, self.sample_size_v,
+                                                              trims=self.trims, **kwargs)
+        except NotImplementedError:
+            self.tessellate(**kwargs)
+            mesh = self._tsl_component.mesh
+            if mesh is None:
+                mesh = elements.TriangleMesh.from_elements(self._tsl_component.vertices, self._tsl_component.triangles)
+            return mesh.points, mesh.triangle_indices, mesh.uvs
+
     def reset(self, **kwargs):
         """ Resets control points and/or evaluated points.
 
@@ -1354,6 +1504,21 @@ class Surface(six.with_metaclass(abc.ABCMeta, object)):
         # Should implement the derivatives functionality here
         pass
 
+    def derivatives_list(self, uv_list, order=0, **kwargs):
+        """ Evaluates the derivatives of the surface for an input list of (u,v) parameter pairs.
+
+        The default implementation calls :py:meth:`derivatives` for each parameter pair. The subclasses may override
+        this method to evaluate the derivatives in batch.
+
+        :param uv_list: list of parameter pairs (u, v)
+        :type uv_list: list, tuple
+        :param order: derivative order
+        :type order: int
+        :return: derivatives at the input parameter pairs
+        :rtype: list
+        """
+        return [self.derivatives(uv[0], uv[1], order, **kwargs) for uv in uv_list]
+
 
 class Multi(six.with_metaclass(abc.ABCMeta, object)):
     """ Abstract class for curve and surface containers.
@@ -1447,11 +1612,39 @@ class Evaluator(six.with_metaclass(abc.ABCMeta, object)):
 
     Please note that this class requires the keyword argument ``find_span_func`` to be set to a valid find_span
     function implementation. Please see ``helpers`` module for details.
+
+    The evaluators keep the spans and the basis functions computed over a range of parameters in a cache with a
+    least recently used (LRU) eviction policy, so that the repeated evaluations over the same knot vector and the
+    same parameter range only compute the weighted sums. The maximum number of cached entries can be set using the
+    ``basis_cache_size`` keyword argument and setting it to zero disables the cache. The cache statistics are
+    available via :py:attr:`basis_cache_info` property.
     """
 
     def __init__(self, **kwargs):
         self._name = kwargs.get('name', self.__class__.__name__)
         self._span_func = kwargs.get('find_span_func', None)
+        self._basis_cache = OrderedDict()  # LRU cache for the spans and the basis functions
+        self._basis_cache_size = kwargs.get('basis_cache_size', 32)  # maximum number of cached entries
+        self._basis_cache_hits = 0
+        self._basis_cache_misses = 0
+
+    def __deepcopy__(self, memo):
+        # Don't copy self reference
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        # Don't copy the cache
+        memo[id(self._basis_cache)] = self._basis_cache.__class__()
+        # Copy all other attributes
+        for k, v in self.__dict__.items():
+            setattr(result, k, copy.deepcopy(v, memo))
+        return result
+
+    def __getstate__(self):
+        # Don't pickle the cache
+        state = self.__dict__.copy()
+        state['_basis_cache'] = self._basis_cache.__class__()
+        return state
 
     @property
     def name(self):
@@ -1462,6 +1655,49 @@ class Evaluator(six.with_metaclass(abc.ABCMeta, object)):
         """
         return self._name
 
+    @property
+    def basis_cache_info(self):
+        """ Basis function cache statistics.
+
+        The returned dictionary contains the number of cache hits and misses, the current number of cached entries
+        and the maximum number of cached entries with the keys ``hits``, ``misses``, ``size`` and ``maxsize``.
+
+        :getter: Gets the basis function cache statistics
+        :type: dict
+        """
+        return dict(hits=self._basis_cache_hits, misses=self._basis_cache_misses,
+                    size=len(self._basis_cache), maxsize=self._basis_cache_size)
+
+    def clear_basis_cache(self):
+        """ Clears the basis function cache and resets the cache statistics. """
+        self._basis_cache.clear()
+        self._basis_cache_hits = 0
+        self._basis_cache_misses = 0
+
+    def _basis_cache_get(self, key, func, *args):
+        """ Gets the cached value for the key or computes and caches it using the input function.
+
+        :param key: cache key
+        :type key: tuple
+        :param func: function to compute the value on a cache miss
+        :param args: arguments of the function
+        :return: cached or computed value
+        """
+        try:
+            value = self._basis_cache.pop(key)
+            self._basis_cache_hits += 1
+        except KeyError:
+            value = func(*args)
+            self._basis_cache_misses += 1
+            if self._basis_cache_size <= 0:
+                return value
+            # Evict the least recently used entry
+            if len(self._basis_cache) >= self._basis_cache_size:
+                self._basis_cache.popitem(last=False)
+        # Move the entry to the most recently used position
+        self._basis_cache[key] = value
+        return value
+
     @abc.abstractmethod
     def evaluate_single(self, **kwargs):
         """ Abstract method for computation of a single point at a single parameter. """
@@ -1511,6 +1747,14 @@ class SurfaceEvaluator(six.with_metaclass(abc.ABCMeta, object)):
         """ Abstract method for implementation of knot insertion algorithm on the v-direction. """
         pass
 
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the surface points at a list of (u, v) parameter pairs.
+
+        The default implementation calls ``evaluate_single`` for each parameter pair in the ``knots`` keyword argument.
+        """
+        knots = kwargs.pop('knots')
+        return [self.evaluate_single(knot_u=knot_u, knot_v=knot_v, **kwargs) for knot_u, knot_v in knots]
+
 
 class Tessellate(six.with_metaclass(abc.ABCMeta, object)):
     """ Abstract base class for tessellation algorithms. """
@@ -1518,6 +1762,7 @@ class Tessellate(six.with_metaclass(abc.ABCMeta, object)):
     def __init__(self, **kwargs):
         self._vertices = None
         self._triangles = None
+        self._mesh = None
         self._arguments = None
 
     @property
@@ -1528,6 +1773,18 @@ class Tessellate(six.with_metaclass(abc.ABCMeta, object)):
         """
         return self._vertices
 
+    @property
+    def mesh(self):
+        """ Compact triangle mesh generated after tessellation.
+
+        The tessellation algorithms storing the results in a :py:class:`.elements.TriangleMesh` instance should set
+        this property. In that case, :py:attr:`~vertices` and :py:attr:`~triangles` properties return the views of the
+        vertices and the triangles of the mesh.
+
+        :getter: Gets the mesh, None if the tessellation algorithm does not generate a compact mesh
+        """
+        return self._mesh
+
     @property
     def triangles(self):
         """ Triangle objects generated after tessellation.
@@ -1553,10 +1810,37 @@ class Tessellate(six.with_metaclass(abc.ABCMeta, object)):
     def arguments(self, value):
         self._arguments = value
 
+    @property
+    def vertices_evaluated(self):
+        """ Checks if the tessellation algorithm computes the final vertex coordinates.
+
+        If False, the surfaces update the vertex coordinates using the evaluated surface points after tessellation.
+
+        :getter: Gets the flag
+        :type: bool
+        """
+        return False
+
     def reset(self):
         """ Clears stored vertices and triangles. """
         self._vertices = None
         self._triangles = None
+        self._mesh = None
+
+    def tessellate_index_array(self, points, size_u, size_v, **kwargs):
+        """ Generates the mesh as index arrays without generating the vertex and triangle objects.
+
+        The tessellation algorithms may implement this method to skip generation of the vertex and triangle objects.
+        The return value should be a tuple containing the vertex coordinates, the zero-indexed vertex indices of the
+        triangles and the parametric coordinates of the vertices, e.g. the arrays of a
+        :py:class:`.elements.TriangleMesh` instance.
+
+        :param points: 1-dimensional array of surface points
+        :param size_u: number of surface points on the u-direction
+        :param size_v: number of surface points on the v-direction
+        :raises NotImplementedError: the tessellation algorithm does not support index arrays
+        """
+        raise NotImplementedError("The tessellation algorithm does not support index arrays")
 
     @abc.abstractmethod
     def tessellate(self, points, size_u, size_v, **kwargs):
@@ -1564,6 +1848,10 @@ class Tessellate(six.with_metaclass(abc.ABCMeta, object)):
 
         This algorithm should update :py:attr:`~vertices` and :py:attr:`~triangles` properties.
 
+        The B-Spline and NURBS surfaces pass their evaluator and the keyword arguments of the evaluator via
+        ``evaluator`` and ``eval_args`` keyword arguments, which allows evaluation of the surface at arbitrary
+        parameters.
+
         :param points: 1-dimensional array of surface points
         :param size_u: number of surface points on the u-direction
         :param size_v: number of surface points on the v-direction
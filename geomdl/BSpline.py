@@ -22,13 +22,13 @@ class Curve(Abstract.Curve):
 
     Notes:
         * Please see the :py:class:`.Abstract.Curve()` documentation for details.
-        * This class sets the *FindSpan* implementation to Linear Search by default.
+        * This class sets the *FindSpan* implementation to :py:func:`.helpers.find_span_bisect` by default.
     """
 
     def __init__(self, **kwargs):
         super(Curve, self).__init__(**kwargs)
         # self._name = "B-Spline Curve"
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
         self._evaluator = evaluators.CurveEvaluator(find_span_func=self._span_func)
 
     @property
@@ -101,7 +101,7 @@ class Curve(Abstract.Curve):
         self._degree = impdata['degree']
         self._knot_vector = impdata['knotvector']
         self._dimension = impdata['dimension']
-        self._control_points = impdata['ctrlpts']
+        self._control_points = self._store_points(impdata['ctrlpts'])
 
     def curvept(self, u):
         """ Evaluates the curve at the given parameter.
@@ -145,6 +145,77 @@ class Curve(Abstract.Curve):
         # Call parent method
         super(Curve, self).evaluate(**kwargs)
 
+        # Generate the evaluator arguments
+        eval_args = self._evaluate_args(**kwargs)
+
+        # Clean up the curve points
+        self.reset(evalpts=True)
+
+        # Evaluate
+        cpts = self._evaluator.evaluate(**eval_args)
+
+        self._set_evalpts(cpts, eval_args)
+
+    def evaluate_adaptive(self, **kwargs):
+        """ Evaluates the curve by adaptive sampling.
+
+        **The evaluated curve points are stored in :py:attr:`~evalpts` property.**
+
+        Instead of sampling the curve uniformly using :py:attr:`~sample_size`, this method subdivides the parameter
+        intervals until the distance between the curve and the polyline generated from the evaluated points is within
+        the given tolerance. Therefore, the flat regions of the curve are represented with fewer points than the
+        regions with high curvature.
+
+        Keyword arguments:
+            * ``tol``: chordal deviation tolerance. *Default: 0.001*
+            * ``max_points``: maximum number of evaluated points. *Default: no limit*
+            * ``start``: start parameter
+            * ``stop``: stop parameter
+
+        .. code-block:: python
+
+            # Evaluate the curve with a chordal deviation of 0.01 using at most 100 points
+            curve.evaluate_adaptive(tol=0.01, max_points=100)
+
+            # Get the evaluated points
+            curve_points = curve.evalpts
+
+        :return: parameters of the evaluated points
+        :rtype: list
+        """
+        # Call parent method
+        super(Curve, self).evaluate(**kwargs)
+
+        tol = kwargs.get('tol', 0.001)
+        max_points = kwargs.get('max_points', None)
+        if tol <= 0:
+            raise ValueError("Tolerance value must be bigger than zero")
+        if max_points is not None and max_points < 2:
+            raise ValueError("Maximum number of points must be bigger than 1")
+
+        # Generate the evaluator arguments
+        eval_args = self._evaluate_args(**kwargs)
+
+        # Clean up the curve points
+        self.reset(evalpts=True)
+
+        # Evaluate
+        knots, cpts = self._evaluator.evaluate_adaptive(tol=tol, max_points=max_points, **eval_args)
+        self._curve_points = self._store_points(cpts)
+
+        # The evaluated points are not uniformly sampled, i.e. the local re-evaluation does not apply
+        self._cache['evalpts_range'] = None
+
+        return knots
+
+    def _evaluate_args(self, **kwargs):
+        """ Generates the keyword arguments of the evaluator for the curve evaluation.
+
+        Please see :py:meth:`evaluate()` for the keyword arguments.
+
+        :return: keyword arguments of the evaluator
+        :rtype: dict
+        """
         # Find evaluation start and stop parameter values
         start = kwargs.get('start', self.knotvector[self.degree])
         stop = kwargs.get('stop', self.knotvector[-(self.degree+1)])
@@ -153,19 +224,27 @@ class Curve(Abstract.Curve):
         utilities.check_uv(start)
         utilities.check_uv(stop)
 
-        # Clean up the curve points
-        self.reset(evalpts=True)
-
-        # Evaluate
-        cpts = self._evaluator.evaluate(start_u=start, stop_u=stop,
-                                        degree=self.degree,
-                                        knotvector=self.knotvector,
-                                        ctrlpts=self._control_points,
-                                        sample_size=self.sample_size,
-                                        dimension=self._dimension,
-                                        precision=self._precision)
+        return dict(start_u=start, stop_u=stop,
+                    degree=self.degree,
+                    knotvector=self.knotvector,
+                    ctrlpts=self._control_points,
+                    sample_size=self.sample_size,
+                    dimension=self._dimension,
+                    precision=self._precision)
+
+    def _set_evalpts(self, points, eval_args):
+        """ Stores the curve points evaluated using the input evaluator arguments.
+
+        :param points: evaluated curve points
+        :type points: list
+        :param eval_args: keyword arguments of the evaluator
+        :type eval_args: dict
+        """
+        self._curve_points = self._store_points(points)
 
-        self._curve_points = cpts
+        # Store the evaluation parameters for the local re-evaluation
+        self._cache['evalpts_range'] = (eval_args['start_u'], eval_args['stop_u'], eval_args['sample_size'],
+                                        eval_args['knotvector'])
 
     def evaluate_single(self, u):
         """ Evaluates the curve at the given parameter.
@@ -231,6 +310,77 @@ class Curve(Abstract.Curve):
                                                   ctrlpts=self._control_points,
                                                   dimension=self._dimension)
 
+    def derivatives_list(self, u_list, order=0, **kwargs):
+        """ Evaluates n-th order curve derivatives for an input list of parameters.
+
+        The spans and the basis function derivatives are computed in a single pass over the sorted parameters.
+
+        :param u_list: list of parameters
+        :type u_list: list, tuple
+        :param order: derivative order
+        :type order: int
+        :return: a list containing up to {order}-th derivatives of the curve for each input parameter
+        :rtype: list
+        """
+        # Check all parameters are set before the curve evaluation
+        self._check_variables()
+
+        # Check u parameters are correct
+        for u in u_list:
+            utilities.check_uv(u)
+
+        # Evaluate and return the derivatives at the input knots
+        return self._evaluator.derivatives(knots=u_list,
+                                           deriv_order=order,
+                                           degree=self.degree,
+                                           knotvector=self.knotvector,
+                                           ctrlpts=self._control_points,
+                                           dimension=self._dimension)
+
+    def update_ctrlpt(self, idx, value):
+        """ Updates a single control point and re-evaluates the affected curve points.
+
+        A control point :math:`P_{i}` only affects the curve on its support, i.e. in the parameter range
+        :math:`[u_{i}, u_{i+p+1}]`. Therefore, instead of resetting the evaluated points, this method updates the
+        control point in place and re-evaluates only the evaluated points inside the support of the control point.
+
+        The input must be in the same format with the control points stored in the class, e.g. weighted control
+        points for the NURBS curves. Please see :py:meth:`set_ctrlpts()` for details.
+
+        :param idx: index of the control point
+        :type idx: int
+        :param value: new coordinates of the control point
+        :type value: list, tuple
+        """
+        if not 0 <= idx < len(self._control_points):
+            raise ValueError("Control point index " + str(idx) + " is out of range")
+        if len(value) != self._dimension:
+            raise ValueError("The input must be " + str(self._dimension) + " dimensional list - " + str(value) +
+                             " is not a valid control point")
+
+        # Update the control point
+        self._control_points[idx] = [float(coord) for coord in value]
+        self._bounding_box = self._init_var(self._array_type)
+        self._cache['arc_length'] = None
+
+        # No need to re-evaluate if the curve has not been evaluated
+        if self._curve_points is None or len(self._curve_points) == 0:
+            return
+
+        # Fall back to resetting the evaluated points if the curve has changed after the last evaluation
+        eval_range = self._cache.get('evalpts_range')
+        if eval_range is None or eval_range[2:] != (self.sample_size, self.knotvector):
+            self.reset(evalpts=True)
+            return
+
+        # Re-evaluate the curve points inside the support of the control point
+        u_min = self._knot_vector[idx]
+        u_max = self._knot_vector[idx + self._degree + 1]
+        knots = utilities.linspace(eval_range[0], eval_range[1], self.sample_size, decimals=self._precision)
+        for i, u in enumerate(knots):
+            if u_min <= u <= u_max:
+                self._curve_points[i] = self.evaluate_single(u)
+
     # Knot insertion
     def insert_knot(self, u, r=1, check_r=True):
         """ Inserts the given knot and updates the control points array and the knot vector.
@@ -268,10 +418,39 @@ class Curve(Abstract.Curve):
 
         # Update class variables
         self._knot_vector = UQ
-        self._control_points = Q
+        self._control_points = self._store_points(Q)
 
         # Evaluate curve again if it has already been evaluated before knot insertion
-        if check_r and self._curve_points:
+        if check_r and self._curve_points is not None and len(self._curve_points) > 0:
+            self.evaluate()
+
+    def refine_knotvector(self, knots):
+        """ Inserts the given knots and updates the control points array and the knot vector in a single pass.
+
+        This method is equivalent to calling :py:meth:`insert_knot()` for each knot, but updates the control points
+        only once. Please note that the multiplicity of a knot cannot exceed the degree after the refinement.
+
+        :param knots: list of knots to be inserted
+        :type knots: list, tuple
+        """
+        # Check all parameters are set before the curve evaluation
+        self._check_variables()
+
+        knots = _check_refine_knots(knots, self.degree, self.knotvector)
+        if not knots:
+            return
+
+        UQ, Q = self._evaluator.refine_knotvector(knots=knots,
+                                                  degree=self.degree,
+                                                  knotvector=self.knotvector,
+                                                  ctrlpts=self._control_points)
+
+        # Update class variables
+        self._knot_vector = UQ
+        self._control_points = self._store_points(Q)
+
+        # Evaluate curve again if it has already been evaluated before knot refinement
+        if self._curve_points is not None and len(self._curve_points) > 0:
             self.evaluate()
 
     def tangent(self, param, **kwargs):
@@ -337,19 +516,33 @@ class Curve(Abstract.Curve):
         """
         return operations.binormal(self, parpos, **kwargs)
 
+    def evaluate_at_lengths(self, lengths, **kwargs):
+        """ Evaluates the curve at the input arc lengths measured from the start of the curve.
+
+        The parameters at the arc lengths are found using a lookup table of the cumulative arc lengths, which is
+        generated once and kept until the control points, the degree or the knot vector change. Please see
+        :py:func:`.operations.params_at_lengths()` for the keyword arguments.
+
+        :param lengths: arc lengths
+        :type lengths: list, tuple
+        :return: evaluated points
+        :rtype: list
+        """
+        return operations.evaluate_at_lengths(self, lengths, **kwargs)
+
 
 class Surface(Abstract.Surface):
     """ Data storage and evaluation class for B-Spline (non-rational) surfaces.
 
     Notes:
         * Please see the :py:class:`.Abstract.Surface()` documentation for details.
-        * This class sets the *FindSpan* implementation to Linear Search by default.
+        * This class sets the *FindSpan* implementation to :py:func:`.helpers.find_span_bisect` by default.
     """
 
     def __init__(self, **kwargs):
         super(Surface, self).__init__(**kwargs)
         # self._name = "B-Spline Surface"
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
         self._evaluator = evaluators.SurfaceEvaluator(find_span_func=self._span_func)
         self._tsl_component = tessellate.TriangularTessellate()
 
@@ -457,19 +650,13 @@ class Surface(Abstract.Surface):
         self._dimension = len(value[0][0])
 
         # Make sure that all numbers are float type
-        ctrlpts2d = [[[] for _ in range(0, self._control_points_size_v)]
-                     for _ in range(0, self._control_points_size_u)]
+        ctrlpts = []
         for u in range(0, self._control_points_size_u):
             for v in range(0, self._control_points_size_v):
-                ctrlpts2d[u][v] = [float(coord) for coord in value[u][v]]
+                ctrlpts.append([float(coord) for coord in value[u][v]])
 
-        # Set 2D control points
-        self._control_points2D = ctrlpts2d
-
-        # Set 1D control points
-        for u in self._control_points2D:
-            for v in u:
-                self._control_points.append(v)
+        # Set 1D and 2D control points
+        self._store_ctrlpts(ctrlpts, self._control_points_size_u, self._control_points_size_v)
 
     @property
     def knotvector_u(self):
@@ -548,10 +735,8 @@ class Surface(Abstract.Surface):
         self._degree_v = impdata['degree_v']
         self._knot_vector_u = impdata['knotvector_u']
         self._knot_vector_v = impdata['knotvector_v']
-        self._control_points_size_u = impdata['ctrlpts_size_u']
-        self._control_points_size_v = impdata['ctrlpts_size_v']
         self._dimension = impdata['dimension']
-        self._control_points = impdata['ctrlpts']
+        self._store_ctrlpts(impdata['ctrlpts'], impdata['ctrlpts_size_u'], impdata['ctrlpts_size_v'])
 
     def transpose(self):
         """ Transposes the surface by swapping u- and v-directions. """
@@ -570,9 +755,10 @@ class Surface(Abstract.Surface):
         ctrlpts_new_size_u = self._control_points_size_v
         ctrlpts_new_size_v = self._control_points_size_u
 
+        # 1-dimensional control points are in v-order
         ctrlpts_new = []
-        for v in range(0, ctrlpts_new_size_v):
-            for u in range(0, ctrlpts_new_size_u):
+        for u in range(0, ctrlpts_new_size_u):
+            for v in range(0, ctrlpts_new_size_v):
                 ctrlpts_new.append(ctrlpts2d_new[u][v])
 
         # Clean up the surface points
@@ -588,6 +774,10 @@ class Surface(Abstract.Surface):
         self._control_points_size_v = ctrlpts_new_size_v
         self._control_points2D = ctrlpts2d_new
 
+        # Convert to compact storage, if necessary
+        if self._compact:
+            self._store_ctrlpts(ctrlpts_new, ctrlpts_new_size_u, ctrlpts_new_size_v)
+
     def surfpt(self, u, v):
         """ Evaluates the surface at the given (u,v) parameter pair.
 
@@ -632,6 +822,54 @@ class Surface(Abstract.Surface):
         # Call parent method
         super(Surface, self).evaluate(**kwargs)
 
+        # Generate the evaluator arguments
+        eval_args = self._evaluate_args(**kwargs)
+
+        # Clean up the surface points
+        self.reset(evalpts=True)
+
+        # Evaluate
+        spts = self._evaluator.evaluate(**eval_args)
+
+        self._set_evalpts(spts, eval_args)
+
+    def tessellate(self, **kwargs):
+        """ Tessellates the surface.
+
+        Keyword arguments are directly passed to the tessellation component.
+
+        The vertices lying on the evaluation grid reuse the evaluated surface points and only the vertices generated
+        by the tessellation component, e.g. via trimming, are evaluated.
+        """
+        # No need to re-tessellate if we have already tessellated the surface
+        if self._tsl_component.vertices is not None and self._tsl_component.triangles is not None:
+            return
+
+        # Evaluate the surface, if necessary
+        evalpts = self.evalpts
+        eval_range = self._cache.get('evalpts_range')
+        if eval_range is None:
+            super(Surface, self).tessellate(**kwargs)
+            return
+
+        # Call tessellation component for vertex and triangle generation
+        eval_args = self._evaluate_args(start_u=eval_range[0], stop_u=eval_range[1],
+                                        start_v=eval_range[2], stop_v=eval_range[3])
+        self._tsl_component.tessellate(evalpts, self.sample_size_u, self.sample_size_v, trims=self.trims,
+                                       evaluator=self._evaluator, eval_args=eval_args, **kwargs)
+
+        # Update vertex coordinates
+        if not self._tsl_component.vertices_evaluated:
+            utilities._update_vertices(self._tsl_component.vertices, evalpts, self._evaluator, eval_args)
+
+    def _evaluate_args(self, **kwargs):
+        """ Generates the keyword arguments of the evaluator for the surface evaluation.
+
+        Please see :py:meth:`evaluate()` for the keyword arguments.
+
+        :return: keyword arguments of the evaluator
+        :rtype: dict
+        """
         # Find evaluation start and stop parameter values
         start_u = kwargs.get('start_u', self.knotvector_u[self.degree_u])
         stop_u = kwargs.get('stop_u', self.knotvector_u[-(self.degree_u+1)])
@@ -642,20 +880,29 @@ class Surface(Abstract.Surface):
         utilities.check_uv(start_u, stop_u)
         utilities.check_uv(start_v, stop_v)
 
-        # Clean up the surface points
-        self.reset(evalpts=True)
-
-        # Evaluate
-        spts = self._evaluator.evaluate(start_u=start_u, stop_u=stop_u, start_v=start_v, stop_v=stop_v,
-                                        degree_u=self.degree_u, degree_v=self.degree_v,
-                                        knotvector_u=self.knotvector_u, knotvector_v=self.knotvector_v,
-                                        ctrlpts_size_u=self.ctrlpts_size_u, ctrlpts_size_v=self.ctrlpts_size_v,
-                                        ctrlpts=self._control_points2D,
-                                        sample_size=self.sample_size,
-                                        dimension=self._dimension,
-                                        precision=self._precision)
+        return dict(start_u=start_u, stop_u=stop_u, start_v=start_v, stop_v=stop_v,
+                    degree_u=self.degree_u, degree_v=self.degree_v,
+                    knotvector_u=self.knotvector_u, knotvector_v=self.knotvector_v,
+                    ctrlpts_size_u=self.ctrlpts_size_u, ctrlpts_size_v=self.ctrlpts_size_v,
+                    ctrlpts=self._control_points2D,
+                    sample_size=self.sample_size,
+                    dimension=self._dimension,
+                    precision=self._precision)
+
+    def _set_evalpts(self, points, eval_args):
+        """ Stores the surface points evaluated using the input evaluator arguments.
+
+        :param points: evaluated surface points
+        :type points: list
+        :param eval_args: keyword arguments of the evaluator
+        :type eval_args: dict
+        """
+        self._surface_points = self._store_points(points)
 
-        self._surface_points = spts
+        # Store the evaluation parameters for the local re-evaluation
+        self._cache['evalpts_range'] = (eval_args['start_u'], eval_args['stop_u'],
+                                        eval_args['start_v'], eval_args['stop_v'], eval_args['sample_size'],
+                                        eval_args['knotvector_u'], eval_args['knotvector_v'])
 
     def evaluate_single(self, uv):
         """ Evaluates the surface at the given (u,v) parameter pair.
@@ -731,6 +978,103 @@ class Surface(Abstract.Surface):
                                                   ctrlpts=self._control_points2D,
                                                   dimension=self._dimension)
 
+    def derivatives_list(self, uv_list, order=0, **kwargs):
+        """ Evaluates n-th order surface derivatives for an input list of (u, v) parameter pairs.
+
+        The spans and the basis function derivatives are computed in a single pass over the sorted parameters of
+        each parametric direction.
+
+        :param uv_list: list of parameter pairs (u, v)
+        :type uv_list: list, tuple
+        :param order: derivative order
+        :type order: integer
+        :return: a list of SKL for each input parameter pair; see :py:meth:`derivatives`
+        :rtype: list
+        """
+        # Check all parameters are set before the evaluation
+        self._check_variables()
+
+        # Check u and v parameters are correct
+        for uv in uv_list:
+            utilities.check_uv(uv[0], uv[1])
+
+        # Evaluate and return the derivatives at the input (u, v) pairs
+        return self._evaluator.derivatives(knots=uv_list, deriv_order=order,
+                                           degree_u=self.degree_u, degree_v=self.degree_v,
+                                           knotvector_u=self.knotvector_u, knotvector_v=self.knotvector_v,
+                                           ctrlpts_size_u=self.ctrlpts_size_u,
+                                           ctrlpts_size_v=self.ctrlpts_size_v,
+                                           ctrlpts=self._control_points2D,
+                                           dimension=self._dimension)
+
+    def update_ctrlpt(self, idx_u, idx_v, value):
+        """ Updates a single control point and re-evaluates the affected surface points.
+
+        A control point :math:`P_{i,j}` only affects the surface on its support, i.e. in the parameter range
+        :math:`[u_{i}, u_{i+p+1}] \\times [v_{j}, v_{j+q+1}]`. Therefore, instead of resetting the evaluated points and
+        the tessellation, this method updates the control point in place and re-evaluates only the evaluated points and
+        the tessellation vertices inside the support of the control point.
+
+        The input must be in the same format with the control points stored in the class, e.g. weighted control
+        points for the NURBS surfaces. Please see :py:meth:`set_ctrlpts()` for details.
+
+        :param idx_u: index of the control point on the u-direction
+        :type idx_u: int
+        :param idx_v: index of the control point on the v-direction
+        :type idx_v: int
+        :param value: new coordinates of the control point
+        :type value: list, tuple
+        """
+        if not 0 <= idx_u < self._control_points_size_u or not 0 <= idx_v < self._control_points_size_v:
+            raise ValueError("Control point index (" + str(idx_u) + ", " + str(idx_v) + ") is out of range")
+        if len(value) != self._dimension:
+            raise ValueError("The input must be " + str(self._dimension) + " dimensional list - " + str(value) +
+                             " is not a valid control point")
+
+        # Update the control point on both 1- and 2-dimensional arrays
+        cpt = [float(coord) for coord in value]
+        self._control_points[idx_v + (idx_u * self._control_points_size_v)] = cpt
+        self._control_points2D[idx_u][idx_v] = cpt
+        self._bounding_box = self._init_var(self._array_type)
+
+        # No need to re-evaluate if the surface has not been evaluated
+        if self._surface_points is None or len(self._surface_points) == 0:
+            return
+
+        # Fall back to resetting the evaluated points if the surface has changed after the last evaluation
+        eval_range = self._cache.get('evalpts_range')
+        if eval_range is None or eval_range[4:] != (self.sample_size, self.knotvector_u, self.knotvector_v):
+            self.reset(evalpts=True)
+            return
+
+        # Support of the control point
+        u_min = self._knot_vector_u[idx_u]
+        u_max = self._knot_vector_u[idx_u + self._degree_u + 1]
+        v_min = self._knot_vector_v[idx_v]
+        v_max = self._knot_vector_v[idx_v + self._degree_v + 1]
+
+        # Re-evaluate the surface points inside the support of the control point
+        knots_u = utilities.linspace(eval_range[0], eval_range[1], self.sample_size_u, decimals=self._precision)
+        knots_v = utilities.linspace(eval_range[2], eval_range[3], self.sample_size_v, decimals=self._precision)
+        for i, u in enumerate(knots_u):
+            if not u_min <= u <= u_max:
+                continue
+            for j, v in enumerate(knots_v):
+                if v_min <= v <= v_max:
+                    self._surface_points[j + (i * self.sample_size_v)] = self.evaluate_single((u, v))
+
+        # Re-evaluate the tessellation vertices inside the support of the control point
+        if self._tsl_component.vertices is not None:
+            if self._tsl_component.vertices_evaluated:
+                # The tessellation depends on the surface shape
+                self._tsl_component.reset()
+                return
+            vertices = [vertex for vertex in self._tsl_component.vertices
+                        if u_min <= vertex.uv[0] <= u_max and v_min <= vertex.uv[1] <= v_max]
+            eval_args = self._evaluate_args(start_u=eval_range[0], stop_u=eval_range[1],
+                                            start_v=eval_range[2], stop_v=eval_range[3])
+            utilities._update_vertices(vertices, self._surface_points, self._evaluator, eval_args)
+
     # Insert knot 'r' times at the given (u, v) parametric coordinates
     def insert_knot(self, u=None, v=None, ru=1, rv=1, check_r=True):
         """ Inserts the knot in single dimension, with only u or v input, or multi-dimensions, with a (u,v) pair input.
@@ -779,13 +1123,10 @@ class Surface(Abstract.Surface):
 
                 # Update class variables after knot insertion
                 self._knot_vector_u = UQ
-                self._control_points2D = Q
                 self._control_points_size_u += ru
-                # Update 1D control points
-                self._control_points[:] = []
-                for dir_u in self._control_points2D:
-                    for dir_v in dir_u:
-                        self._control_points.append(dir_v)
+                # Update 1D and 2D control points
+                self._store_ctrlpts([dir_v for dir_u in Q for dir_v in dir_u],
+                                    self._control_points_size_u, self._control_points_size_v)
 
         if v:
             s_v = helpers.find_multiplicity(v, self.knotvector_v)
@@ -804,16 +1145,65 @@ class Surface(Abstract.Surface):
 
                 # Update class variables after knot insertion
                 self._knot_vector_v = VQ
-                self._control_points2D = Q
                 self._control_points_size_v += rv
-                # Update 1D control points
-                self._control_points[:] = []
-                for dir_u in self._control_points2D:
-                    for dir_v in dir_u:
-                        self._control_points.append(dir_v)
+                # Update 1D and 2D control points
+                self._store_ctrlpts([dir_v for dir_u in Q for dir_v in dir_u],
+                                    self._control_points_size_u, self._control_points_size_v)
 
         # Evaluate surface again if it has already been evaluated before knot insertion
-        if check_r and self._surface_points:
+        if check_r and self._surface_points is not None and len(self._surface_points) > 0:
+            self.evaluate()
+
+    def refine_knotvector(self, knots_u=None, knots_v=None):
+        """ Inserts the given knots on the u- and/or v-directions in a single pass for each direction.
+
+        This method is equivalent to calling :py:meth:`insert_knot()` for each knot, but updates the control points
+        only once for each direction. Please note that the multiplicity of a knot cannot exceed the degree after the
+        refinement.
+
+        :param knots_u: list of knots to be inserted on the u-direction
+        :type knots_u: list, tuple
+        :param knots_v: list of knots to be inserted on the v-direction
+        :type knots_v: list, tuple
+        """
+        # Check all parameters are set before the surface evaluation
+        self._check_variables()
+
+        # Check the knots on both directions before updating the surface
+        knots_u = _check_refine_knots(knots_u, self.degree_u, self.knotvector_u) if knots_u else []
+        knots_v = _check_refine_knots(knots_v, self.degree_v, self.knotvector_v) if knots_v else []
+
+        # Algorithm A5.5
+        if knots_u:
+            UQ, Q = self._evaluator.refine_knotvector_u(knots=knots_u, degree=self.degree_u,
+                                                        knotvector=self.knotvector_u,
+                                                        ctrlpts_size_u=self.ctrlpts_size_u,
+                                                        ctrlpts_size_v=self.ctrlpts_size_v,
+                                                        ctrlpts=self._control_points2D)
+
+            # Update class variables after knot refinement
+            self._knot_vector_u = UQ
+            self._control_points_size_u += len(knots_u)
+            # Update 1D and 2D control points
+            self._store_ctrlpts([dir_v for dir_u in Q for dir_v in dir_u],
+                                self._control_points_size_u, self._control_points_size_v)
+
+        if knots_v:
+            VQ, Q = self._evaluator.refine_knotvector_v(knots=knots_v, degree=self.degree_v,
+                                                        knotvector=self.knotvector_v,
+                                                        ctrlpts_size_u=self.ctrlpts_size_u,
+                                                        ctrlpts_size_v=self.ctrlpts_size_v,
+                                                        ctrlpts=self._control_points2D)
+
+            # Update class variables after knot refinement
+            self._knot_vector_v = VQ
+            self._control_points_size_v += len(knots_v)
+            # Update 1D and 2D control points
+            self._store_ctrlpts([dir_v for dir_u in Q for dir_v in dir_u],
+                                self._control_points_size_u, self._control_points_size_v)
+
+        # Evaluate surface again if it has already been evaluated before knot refinement
+        if self._surface_points is not None and len(self._surface_points) > 0:
             self.evaluate()
 
     def tangent(self, parpos, **kwargs):
@@ -906,3 +1296,31 @@ def read_pickle(file_name):
         raise e
     except Exception:
         raise
+
+
+def _check_refine_knots(knots, degree, knot_vector):
+    """ Checks and sorts the knots to be inserted by the knot refinement algorithm.
+
+    :param knots: list of knots to be inserted
+    :type knots: list, tuple
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :return: sorted list of knots
+    :rtype: list
+    :raises ValueError: a knot is out of the interval [0, 1] or its multiplicity exceeds the degree
+    """
+    if not isinstance(knots, (list, tuple)):
+        raise TypeError("The input must be a list or tuple")
+
+    knots = sorted(float(knot) for knot in knots)
+    for knot in knots:
+        utilities.check_uv(knot)
+
+    # Check if it is possible add that many number of knots
+    for knot in set(knots):
+        if helpers.find_multiplicity(knot, knot_vector) + knots.count(knot) > degree:
+            raise ValueError("Cannot insert knot " + str(knot) + " " + str(knots.count(knot)) + " times")
+
+    return knots
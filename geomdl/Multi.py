@@ -8,6 +8,8 @@
 """
 
 import warnings
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
 from . import Abstract
 from . import utilities
 
@@ -46,6 +48,26 @@ class MultiCurve(Abstract.Multi):
     def sample_size(self, value):
         self._sample_size = value
 
+    def evaluate_all(self, workers=None, backend='process'):
+        """ Evaluates all curves contained in the container in parallel.
+
+        Only the evaluator and its arguments, i.e. the degree, the knot vector and the control points, are sent to the
+        workers. The evaluated points are stored in :py:attr:`~evalpts` property of each curve.
+
+        Please note that the process backend requires the ``if __name__ == '__main__':`` guard in the main script on
+        the platforms which spawn new processes, e.g. Windows.
+
+        :param workers: number of workers; defaults to the number of CPUs
+        :type workers: int
+        :param backend: type of the worker pool, 'process' or 'thread'
+        :type backend: str
+        """
+        for elem in self._elements:
+            if self._sample_size != 0:
+                elem.sample_size = self._sample_size
+
+        _evaluate_elements(self._elements, workers, backend)
+
     def render(self, **kwargs):
         """ Renders the curve the using the visualization component.
 
@@ -180,6 +202,32 @@ class MultiSurface(Abstract.Multi):
         self.sample_size_u = value
         self.sample_size_v = value
 
+    def evaluate_all(self, workers=None, backend='process', tessellate=False):
+        """ Evaluates all surfaces contained in the container in parallel.
+
+        Only the evaluator and its arguments, i.e. the degrees, the knot vectors and the control points, are sent to
+        the workers. The evaluated points are stored in :py:attr:`~evalpts` property of each surface. If
+        ``tessellate`` is True, the surfaces are also tessellated by the workers and the vertices and the triangles are
+        stored in the tessellation component of each surface.
+
+        Please note that the process backend requires the ``if __name__ == '__main__':`` guard in the main script on
+        the platforms which spawn new processes, e.g. Windows.
+
+        :param workers: number of workers; defaults to the number of CPUs
+        :type workers: int
+        :param backend: type of the worker pool, 'process' or 'thread'
+        :type backend: str
+        :param tessellate: enables/disables tessellation of the surfaces
+        :type tessellate: bool
+        """
+        for elem in self._elements:
+            if self._sample_size_u != 0:
+                elem.sample_size_u = self.sample_size_u
+            if self._sample_size_v != 0:
+                elem.sample_size_v = self.sample_size_v
+
+        _evaluate_elements(self._elements, workers, backend, tessellate)
+
     def render(self, **kwargs):
         """ Renders the surface the using the visualization component.
 
@@ -286,6 +334,14 @@ class MultiSurface(Abstract.Multi):
                                         name=elem.name,
                                         color=color[1], plot_type='evalpts')
 
+            # Add surface points as vertex coordinates and triangle vertex indices
+            if self._vis_component.plot_types['evalpts'] == 'triangle_indices':
+                vertices, triangles, _ = elem._tessellate_index_array()
+                self._vis_component.add(ptsarr=[vertices, triangles],
+                                        size=[elem.sample_size_u, elem.sample_size_v],
+                                        name=elem.name,
+                                        color=color[1], plot_type='evalpts')
+
             # Visualize the trim curve
             for idx, trim in enumerate(elem.trims):
                 self._vis_component.add(ptsarr=elem.evaluate_list(trim.evalpts),
@@ -327,3 +383,71 @@ def _select_color(cpcolor, evalcolor, idx=0):
         color[1] = evalcolor[idx]
 
     return color
+
+
+def _evaluate_elements(elements, workers, backend, tessellate=False):
+    """ Evaluates the shapes using a pool of workers and stores the results in the shapes.
+
+    :param elements: list of shapes
+    :type elements: list
+    :param workers: number of workers
+    :type workers: int
+    :param backend: type of the worker pool, 'process' or 'thread'
+    :type backend: str
+    :param tessellate: enables/disables tessellation of the surfaces
+    :type tessellate: bool
+    """
+    if backend == 'process':
+        pool_type = Pool
+    elif backend == 'thread':
+        pool_type = ThreadPool
+    else:
+        raise ValueError("The backend must be 'process' or 'thread'")
+
+    # Prepare the evaluation tasks
+    tasks = []
+    eval_args = []
+    for elem in elements:
+        # Checks all parameters are set before the evaluation
+        elem._check_variables()
+        elem.reset(evalpts=True)
+        eval_args.append(elem._evaluate_args())
+        tsl_args = None
+        if tessellate:
+            tsl_args = (elem.tessellator, elem.sample_size_u, elem.sample_size_v, elem.trims)
+        tasks.append((elem.evaluator, eval_args[-1], tsl_args))
+
+    # Evaluate the shapes
+    pool = pool_type(workers)
+    try:
+        results = pool.map(_evaluate_task, tasks)
+    finally:
+        pool.close()
+        pool.join()
+
+    # Store the results
+    for elem, args, (points, tsl) in zip(elements, eval_args, results):
+        elem._set_evalpts(points, args)
+        if tsl is not None:
+            elem.tessellator = tsl
+
+
+def _evaluate_task(task):
+    """ Evaluates a single shape using the input evaluator and tessellates it, if necessary.
+
+    :param task: evaluator, evaluator arguments and tessellation arguments
+    :type task: tuple
+    :return: evaluated points and the tessellation component
+    :rtype: tuple
+    """
+    evaluator, eval_args, tsl_args = task
+    points = evaluator.evaluate(**eval_args)
+    if tsl_args is None:
+        return points, None
+
+    # Tessellate the surface and update the vertex coordinates
+    tsl, size_u, size_v, trims = tsl_args
+    tsl.tessellate(points, size_u, size_v, trims=trims, evaluator=evaluator, eval_args=eval_args)
+    if not tsl.vertices_evaluated:
+        utilities._update_vertices(tsl.vertices, points, evaluator, eval_args)
+    return points, tsl
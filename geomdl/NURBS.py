@@ -8,6 +8,7 @@
 """
 
 from . import BSpline
+from . import arrays
 from . import compatibility
 from . import evaluators
 
@@ -27,7 +28,8 @@ class Curve(BSpline.Curve):
 
     Notes:
         * Please see the :py:class:`.Abstract.Surface()` documentation for details.
-        * This class sets the *FindSpan* implementation to Linear Search by default.
+        * This class sets the *FindSpan* implementation to :py:func:`.helpers.find_span_bisect` by default.
+        * In the compact storage mode, ``ctrlptsw`` and ``weights`` return zero-copy views of the control points buffer.
     """
 
     def __init__(self, **kwargs):
@@ -48,6 +50,19 @@ class Curve(BSpline.Curve):
         self._cache['ctrlpts'] = self._init_var(self._array_type)
         self._cache['weights'] = self._init_var(self._array_type)
 
+    def _populate_cache(self):
+        """ Generates the unweighted control points and the weights from the weighted control points.
+
+        In the compact storage mode, only the unweighted control points are cached. The weights are a zero-copy view of
+        the weighted control points, which is generated by the getter since memoryview objects cannot be pickled.
+        """
+        c, w = compatibility.separate_ctrlpts_weights(self._control_points)
+        if isinstance(self._control_points, arrays.PointArray):
+            self._cache['ctrlpts'] = arrays.PointArray(c)
+        else:
+            self._cache['ctrlpts'] = [tuple(crd) for crd in c]
+            self._cache['weights'] = w
+
     @property
     def ctrlptsw(self):
         """ Weighted control points (Pw).
@@ -73,9 +88,9 @@ class Curve(BSpline.Curve):
         """
         # Populate the cache, if necessary
         if not self._cache['ctrlpts']:
-            c, w = compatibility.separate_ctrlpts_weights(self._control_points)
-            self._cache['ctrlpts'] = [tuple(crd) for crd in c]
-            self._cache['weights'] = w
+            self._populate_cache()
+        if self._compact:
+            return self._cache['ctrlpts']
         return tuple(self._cache['ctrlpts'])
 
     @ctrlpts.setter
@@ -100,11 +115,14 @@ class Curve(BSpline.Curve):
         :setter: Sets the weights vector
         :type: list
         """
+        # Generate a zero-copy view in the compact storage mode
+        if isinstance(self._control_points, arrays.PointArray):
+            return self._control_points.column(-1)
         # Populate the cache, if necessary
         if not self._cache['weights']:
-            c, w = compatibility.separate_ctrlpts_weights(self._control_points)
-            self._cache['ctrlpts'] = [tuple(crd) for crd in c]
-            self._cache['weights'] = w
+            self._populate_cache()
+        if self._compact:
+            return self._cache['weights']
         return tuple(self._cache['weights'])
 
     @weights.setter
@@ -118,6 +136,38 @@ class Curve(BSpline.Curve):
         # Set new weighted control points
         self.set_ctrlpts(ctrlptsw)
 
+    def update_ctrlpt(self, idx, value):
+        """ Updates a single weighted control point and re-evaluates the affected curve points.
+
+        Please see :py:meth:`.BSpline.Curve.update_ctrlpt()` for details.
+
+        :param idx: index of the control point
+        :type idx: int
+        :param value: new coordinates of the weighted control point
+        :type value: list, tuple
+        """
+        # Call parent function
+        super(Curve, self).update_ctrlpt(idx, value)
+
+        # Delete the caches
+        self._cache['ctrlpts'] = self._init_var(self._array_type)
+        self._cache['weights'] = self._init_var(self._array_type)
+
+    def refine_knotvector(self, knots):
+        """ Refines the knot vector by inserting the input knots and updates the weighted control points.
+
+        Please see :py:meth:`.BSpline.Curve.refine_knotvector()` for details.
+
+        :param knots: knots to be inserted
+        :type knots: list, tuple
+        """
+        # Call parent function
+        super(Curve, self).refine_knotvector(knots)
+
+        # Delete the caches
+        self._cache['ctrlpts'] = self._init_var(self._array_type)
+        self._cache['weights'] = self._init_var(self._array_type)
+
     def reset(self, **kwargs):
         """ Resets control points and/or evaluated points.
 
@@ -136,7 +186,7 @@ class Curve(BSpline.Curve):
         if reset_ctrlpts:
             # Delete the caches
             self._cache['ctrlpts'] = self._init_var(self._array_type)
-            self._cache['weights'][:] = self._init_var(self._array_type)
+            self._cache['weights'] = self._init_var(self._array_type)
 
 
 class Surface(BSpline.Surface):
@@ -155,7 +205,8 @@ class Surface(BSpline.Surface):
 
     Notes:
         * Please see the :py:class:`.Abstract.Surface()` documentation for details.
-        * This class sets the *FindSpan* implementation to Linear Search by default.
+        * This class sets the *FindSpan* implementation to :py:func:`.helpers.find_span_bisect` by default.
+        * In the compact storage mode, ``ctrlptsw`` and ``weights`` return zero-copy views of the control points buffer.
     """
 
     def __init__(self, **kwargs):
@@ -176,6 +227,19 @@ class Surface(BSpline.Surface):
         self._cache['ctrlpts'] = self._init_var(self._array_type)
         self._cache['weights'] = self._init_var(self._array_type)
 
+    def _populate_cache(self):
+        """ Generates the unweighted control points and the weights from the weighted control points.
+
+        In the compact storage mode, only the unweighted control points are cached. The weights are a zero-copy view of
+        the weighted control points, which is generated by the getter since memoryview objects cannot be pickled.
+        """
+        c, w = compatibility.separate_ctrlpts_weights(self._control_points)
+        if isinstance(self._control_points, arrays.PointArray):
+            self._cache['ctrlpts'] = arrays.PointArray(c)
+        else:
+            self._cache['ctrlpts'] = [tuple(crd) for crd in c]
+            self._cache['weights'] = w
+
     @property
     def ctrlptsw(self):
         """ 1-dimensional array of weighted control points (Pw).
@@ -187,6 +251,8 @@ class Surface(BSpline.Surface):
         :getter: Gets weighted control points
         :setter: Sets weighted control points
         """
+        if self._compact:
+            return self._control_points
         ret_list = []
         for pt in self._control_points:
             ret_list.append(tuple(pt))
@@ -210,9 +276,9 @@ class Surface(BSpline.Surface):
         :type: list
         """
         if not self._cache['ctrlpts']:
-            c, w = compatibility.separate_ctrlpts_weights(self._control_points)
-            self._cache['ctrlpts'] = [tuple(crd) for crd in c]
-            self._cache['weights'] = w
+            self._populate_cache()
+        if self._compact:
+            return self._cache['ctrlpts']
         return tuple(self._cache['ctrlpts'])
 
     @ctrlpts.setter
@@ -240,10 +306,13 @@ class Surface(BSpline.Surface):
         :setter: Sets the weights vector
         :type: list
         """
+        # Generate a zero-copy view in the compact storage mode
+        if isinstance(self._control_points, arrays.PointArray):
+            return self._control_points.column(-1)
         if not self._cache['weights']:
-            c, w = compatibility.separate_ctrlpts_weights(self._control_points)
-            self._cache['ctrlpts'] = [tuple(crd) for crd in c]
-            self._cache['weights'] = w
+            self._populate_cache()
+        if self._compact:
+            return self._cache['weights']
         return tuple(self._cache['weights'])
 
     @weights.setter
@@ -257,6 +326,42 @@ class Surface(BSpline.Surface):
         # Set weighted control points
         self.set_ctrlpts(ctrlptsw, self._control_points_size_u, self._control_points_size_v)
 
+    def update_ctrlpt(self, idx_u, idx_v, value):
+        """ Updates a single weighted control point and re-evaluates the affected surface points.
+
+        Please see :py:meth:`.BSpline.Surface.update_ctrlpt()` for details.
+
+        :param idx_u: index of the control point on the u-direction
+        :type idx_u: int
+        :param idx_v: index of the control point on the v-direction
+        :type idx_v: int
+        :param value: new coordinates of the weighted control point
+        :type value: list, tuple
+        """
+        # Call parent function
+        super(Surface, self).update_ctrlpt(idx_u, idx_v, value)
+
+        # Delete the caches
+        self._cache['ctrlpts'] = self._init_var(self._array_type)
+        self._cache['weights'] = self._init_var(self._array_type)
+
+    def refine_knotvector(self, knots_u=None, knots_v=None):
+        """ Refines the knot vectors by inserting the input knots and updates the weighted control points.
+
+        Please see :py:meth:`.BSpline.Surface.refine_knotvector()` for details.
+
+        :param knots_u: knots to be inserted on the u-direction
+        :type knots_u: list, tuple
+        :param knots_v: knots to be inserted on the v-direction
+        :type knots_v: list, tuple
+        """
+        # Call parent function
+        super(Surface, self).refine_knotvector(knots_u, knots_v)
+
+        # Delete the caches
+        self._cache['ctrlpts'] = self._init_var(self._array_type)
+        self._cache['weights'] = self._init_var(self._array_type)
+
     def reset(self, **kwargs):
         """ Resets control points and/or evaluated points.
 
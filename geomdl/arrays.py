@@ -0,0 +1,205 @@
+"""
+.. module:: arrays
+    :platform: Unix, Windows
+    :synopsis: Provides compact array types for storing points
+
+.. moduleauthor:: Onur Rauf Bingol <orbingol@gmail.com>
+
+"""
+
+import copy
+from array import array
+from itertools import chain
+
+
+class PointArray(object):
+    """ Compact storage for an array of points with the same dimension.
+
+    The coordinates of all points are stored in a single contiguous buffer of double precision floating point numbers
+    (i.e. ``array.array('d')``) by default, instead of a list of Python lists of Python floats. Indexing an instance of
+    this class returns a zero-copy view of the point coordinates as a ``memoryview``, which can be iterated, indexed and
+    assigned like a list. Slicing returns a list of point coordinates as lists, i.e. a copy.
+
+    The following example illustrates the usage of this class.
+
+    .. code-block:: python
+
+        from geomdl import arrays
+
+        pts = arrays.PointArray([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0], [10.0, 11.0, 12.0]])
+
+        # Get the 2nd point
+        pt = pts[1]  # pt[0] == 4.0
+
+        # Set the 1st point
+        pts[0] = [0.0, 0.0, 0.0]
+
+        # Generate 2x2 grid view, i.e. [u][v] indexing
+        pts2d = pts.reshape(2, 2)  # pts2d[1][0] == pts[2]
+
+        # Get the 3rd coordinates of all points
+        zs = pts.column(2)
+
+        # Use the buffer with NumPy (zero-copy)
+        arr = numpy.frombuffer(pts.data).reshape(-1, pts.dimension)
+
+    :param points: list of points
+    :type points: list, tuple
+    :param dimension: dimension of the points; required if the input list of points is empty
+    :type dimension: int
+    :param typecode: type code of the buffer, e.g. 'i' for storing indices
+    :type typecode: str
+    """
+    __slots__ = ('_data', '_dimension', '_offset', '_size')
+
+    def __init__(self, points=(), dimension=None, typecode='d'):
+        if dimension is None:
+            dimension = len(points[0]) if len(points) > 0 else 0
+        self._dimension = int(dimension)
+        self._data = array(typecode, chain.from_iterable(points))
+        self._offset = 0
+        self._size = len(self._data) // self._dimension if self._dimension > 0 else 0
+        if self._size * self._dimension != len(self._data):
+            raise ValueError("All points must be " + str(self._dimension) + " dimensional")
+
+    @classmethod
+    def _view(cls, data, dimension, offset, size):
+        """ Generates a view of the input buffer without copying it. """
+        result = cls.__new__(cls)
+        result._data = data
+        result._dimension = dimension
+        result._offset = offset
+        result._size = size
+        return result
+
+    def __copy__(self):
+        return self._view(self._data, self._dimension, self._offset, self._size)
+
+    def __deepcopy__(self, memo):
+        # The views sharing the same buffer will continue to share the copied buffer
+        return self._view(copy.deepcopy(self._data, memo), self._dimension, self._offset, self._size)
+
+    def __getstate__(self):
+        start = self._offset * self._dimension
+        return self._data[start:start + (self._size * self._dimension)], self._dimension
+
+    def __setstate__(self, state):
+        self._data, self._dimension = state
+        self._offset = 0
+        self._size = len(self._data) // self._dimension if self._dimension > 0 else 0
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [list(self[idx]) for idx in range(*key.indices(self._size))]
+        start = self._point_start(key)
+        return memoryview(self._data)[start:start + self._dimension]
+
+    def __setitem__(self, key, value):
+        if len(value) != self._dimension:
+            raise ValueError("The input must be " + str(self._dimension) + " dimensional")
+        start = self._point_start(key)
+        for idx, coord in enumerate(value):
+            self._data[start + idx] = coord
+
+    def __iter__(self):
+        data = memoryview(self._data)
+        dim = self._dimension
+        for start in range(self._offset * dim, (self._offset + self._size) * dim, dim):
+            yield data[start:start + dim]
+
+    def __eq__(self, other):
+        try:
+            if len(self) != len(other):
+                return False
+            return all(list(pt) == list(opt) for pt, opt in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        return self.__class__.__name__ + "(" + str(self.tolist()) + ")"
+
+    def _point_start(self, idx):
+        """ Finds the start index of the point on the buffer. """
+        if idx < 0:
+            idx += self._size
+        if not 0 <= idx < self._size:
+            raise IndexError("Point index out of range")
+        return (self._offset + idx) * self._dimension
+
+    @property
+    def data(self):
+        """ Underlying buffer.
+
+        The buffer is shared between the views generated from the same array.
+
+        :getter: Gets the buffer
+        :type: array.array
+        """
+        return self._data
+
+    @property
+    def dimension(self):
+        """ Dimension of the points.
+
+        :getter: Gets the dimension
+        :type: int
+        """
+        return self._dimension
+
+    @property
+    def nbytes(self):
+        """ Size of the stored coordinates in bytes.
+
+        :getter: Gets the size in bytes
+        :type: int
+        """
+        return self._size * self._dimension * self._data.itemsize
+
+    def reshape(self, size_u, size_v):
+        """ Generates a 2-dimensional view in [u][v] format.
+
+        The v index varies first, i.e. the returned list contains ``size_u`` rows of ``size_v`` points and each row is
+        a :py:class:`.PointArray` view sharing the same buffer.
+
+        :param size_u: number of points on the u-direction
+        :type size_u: int
+        :param size_v: number of points on the v-direction
+        :type size_v: int
+        :return: list of rows
+        :rtype: list
+        """
+        if size_u * size_v != self._size:
+            raise ValueError("Cannot reshape " + str(self._size) + " points into " + str(size_u) + "x" + str(size_v))
+        return [self._view(self._data, self._dimension, self._offset + (u * size_v), size_v) for u in range(size_u)]
+
+    def column(self, idx):
+        """ Generates a zero-copy view of the idx-th coordinates of all points.
+
+        :param idx: index of the coordinate, e.g. -1 for the weights of the weighted control points
+        :type idx: int
+        :return: strided view of the coordinates
+        :rtype: memoryview
+        """
+        if idx < 0:
+            idx += self._dimension
+        if not 0 <= idx < self._dimension:
+            raise IndexError("Coordinate index out of range")
+        start = self._offset * self._dimension
+        return memoryview(self._data)[start + idx:start + (self._size * self._dimension):self._dimension]
+
+    def tolist(self):
+        """ Converts the points to a list of lists.
+
+        :return: list of points
+        :rtype: list
+        """
+        return [list(pt) for pt in self]
@@ -0,0 +1,386 @@
+"""
+.. module:: bvh
+    :platform: Unix, Windows
+    :synopsis: Provides bounding volume hierarchy for spatial queries on curves and surfaces
+
+.. moduleauthor:: Onur Rauf Bingol <orbingol@gmail.com>
+
+"""
+
+import heapq
+from . import Abstract
+from . import operations
+from . import utilities
+
+
+class BVH(object):
+    """ Bounding volume hierarchy over the Bezier segments of curves and surfaces.
+
+    The input shapes are decomposed into Bezier curve segments or Bezier surface patches. A curve or a surface lies
+    inside the convex hull of its control points and the control points of a Bezier segment are much closer to the
+    shape than the control points of the whole shape. Therefore, the bounding boxes of the Bezier control points bound
+    the shapes tightly. The hierarchy is built top-down by splitting the segments at the median of their centers on the
+    longest axis.
+
+    The following example illustrates the usage of this class.
+
+    .. code-block:: python
+
+        from geomdl import bvh
+
+        # Build the hierarchy over the members of a MultiSurface instance
+        tree = bvh.BVH(multi_surf)
+
+        # Find the patches whose bounding boxes are hit by the ray, ordered by the entry distance
+        hits = tree.query_ray((0.0, 0.0, 10.0), (0.0, 0.0, -1.0))
+
+        # Find the closest point on the surfaces
+        shape_idx, uv, pt, dist = tree.closest_point((1.0, 2.0, 3.0))
+
+        # Update the bounding boxes after moving some control points of the 2nd surface
+        tree.refit(1)
+
+    :param shapes: a curve, a surface, a Multi container or a list of curves and surfaces
+    :type shapes: Abstract.Curve, Abstract.Surface, Abstract.Multi, list or tuple
+    """
+
+    def __init__(self, shapes):
+        if isinstance(shapes, (Abstract.Curve, Abstract.Surface)):
+            shapes = [shapes]
+        self._shapes = list(shapes)
+        if not self._shapes:
+            raise ValueError("The input must contain at least one shape")
+        for shape in self._shapes:
+            if not isinstance(shape, (Abstract.Curve, Abstract.Surface)):
+                raise TypeError("The input shapes must be instances of Abstract.Curve or Abstract.Surface")
+
+        self._patches = []  # Bezier segments
+        self._owners = []  # (shape index, parametric domain) pairs of the Bezier segments
+        self._patch_idx = []  # indices of the Bezier segments of each shape
+        for idx, shape in enumerate(self._shapes):
+            patches, domains = _decompose(shape)
+            self._patch_idx.append(list(range(len(self._patches), len(self._patches) + len(patches))))
+            self._patches += patches
+            self._owners += [(idx, domain) for domain in domains]
+
+        # Nodes are stored in pre-order, i.e. the children of a node always follow the node
+        self._node_bbox = []  # [bbmin, bbmax] of the nodes
+        self._node_children = []  # (left, right) for the internal nodes and (-1, patch index) for the leaves
+        self._leaf_node = [0 for _ in range(len(self._patches))]  # leaf node of each patch
+        boxes = [_bbox(patch) for patch in self._patches]
+        self._build(list(range(len(boxes))), boxes, [[0.5 * (b0 + b1) for b0, b1 in zip(*bb)] for bb in boxes])
+
+    def __len__(self):
+        return len(self._patches)
+
+    @property
+    def shapes(self):
+        """ Input shapes.
+
+        :getter: Gets the list of input shapes
+        :type: tuple
+        """
+        return tuple(self._shapes)
+
+    @property
+    def patches(self):
+        """ Bezier segments of the input shapes.
+
+        The Bezier segments are defined on the [0, 1] parametric domain. Please use :py:meth:`patch_shape` and
+        :py:meth:`shape_params` to find the input shape and the parameters on the input shape.
+
+        :getter: Gets the list of Bezier curves or surfaces
+        :type: tuple
+        """
+        return tuple(self._patches)
+
+    @property
+    def bbox(self):
+        """ Bounding box of all shapes.
+
+        :getter: Gets the bounding box
+        :type: tuple
+        """
+        return tuple(tuple(bb) for bb in self._node_bbox[0])
+
+    def patch_shape(self, idx):
+        """ Finds the index of the input shape which the Bezier segment belongs to.
+
+        :param idx: index of the Bezier segment
+        :type idx: int
+        :return: index of the input shape
+        :rtype: int
+        """
+        return self._owners[idx][0]
+
+    def patch_bbox(self, idx):
+        """ Gets the bounding box of the Bezier segment.
+
+        :param idx: index of the Bezier segment
+        :type idx: int
+        :return: bounding box
+        :rtype: tuple
+        """
+        return tuple(tuple(bb) for bb in self._node_bbox[self._leaf_node[idx]])
+
+    def shape_params(self, idx, params):
+        """ Converts the parameters on the Bezier segment to the parameters on the input shape.
+
+        :param idx: index of the Bezier segment
+        :type idx: int
+        :param params: parameter (curve) or parameter pair (surface) on the Bezier segment
+        :type params: float, list or tuple
+        :return: parameter (curve) or parameter pair (surface) on the input shape
+        :rtype: float or tuple
+        """
+        domain = self._owners[idx][1]
+        if len(domain) == 1:
+            return domain[0][0] + (params * (domain[0][1] - domain[0][0]))
+        return tuple(dom[0] + (t * (dom[1] - dom[0])) for t, dom in zip(params, domain))
+
+    def refit(self, *indices):
+        """ Updates the bounding boxes after changing the control points of the input shapes.
+
+        The input shapes are decomposed again but the hierarchy is not rebuilt, i.e. the bounding boxes of the nodes are
+        updated in a single pass from the leaves to the root. The knot vectors of the shapes should not change.
+
+        :param indices: indices of the changed shapes; all shapes will be updated, if not set
+        :type indices: int
+        """
+        for idx in (indices if indices else range(len(self._shapes))):
+            patches, domains = _decompose(self._shapes[idx])
+            if len(patches) != len(self._patch_idx[idx]):
+                raise ValueError("The number of the Bezier segments has changed, please build a new hierarchy")
+            for pidx, patch, domain in zip(self._patch_idx[idx], patches, domains):
+                self._patches[pidx] = patch
+                self._owners[pidx] = (idx, domain)
+                self._node_bbox[self._leaf_node[pidx]] = _bbox(patch)
+
+        # Update the internal nodes in reverse pre-order, i.e. the children are updated before their parents
+        for node in range(len(self._node_children) - 1, -1, -1):
+            left, right = self._node_children[node]
+            if left >= 0:
+                self._node_bbox[node] = _bbox_union(self._node_bbox[left], self._node_bbox[right])
+
+    def query_box(self, bbox):
+        """ Finds the Bezier segments whose bounding boxes overlap with the input bounding box.
+
+        :param bbox: bounding box as (bbmin, bbmax)
+        :type bbox: list, tuple
+        :return: indices of the Bezier segments
+        :rtype: list
+        """
+        bbmin, bbmax = bbox
+        result = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            nmin, nmax = self._node_bbox[node]
+            if any(n0 > b1 or n1 < b0 for n0, n1, b0, b1 in zip(nmin, nmax, bbmin, bbmax)):
+                continue
+            left, right = self._node_children[node]
+            if left < 0:
+                result.append(right)
+            else:
+                stack += [right, left]
+        return result
+
+    def query_ray(self, origin, direction, **kwargs):
+        """ Finds the Bezier segments whose bounding boxes are hit by the ray.
+
+        The ray is defined as ``origin + t * direction`` for ``t_min <= t <= t_max``.
+
+        Keyword Arguments:
+
+            * ``t_min``: start of the ray. *Default: 0.0*
+            * ``t_max``: end of the ray. *Default: infinity*
+
+        :param origin: origin of the ray
+        :type origin: list, tuple
+        :param direction: direction of the ray
+        :type direction: list, tuple
+        :return: list of (t, index) pairs of the entry parameters and the Bezier segments, sorted by the entry parameter
+        :rtype: list
+        """
+        t_min = kwargs.get('t_min', 0.0)
+        t_max = kwargs.get('t_max', float('inf'))
+
+        if utilities.vector_is_zero(direction):
+            raise ValueError("The ray direction cannot be a zero vector")
+
+        # Precompute the inverse of the direction for the slab tests
+        inv_dir = [1.0 / d if d != 0.0 else None for d in direction]
+
+        result = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            t_entry = _ray_box(origin, inv_dir, self._node_bbox[node], t_min, t_max)
+            if t_entry is None:
+                continue
+            left, right = self._node_children[node]
+            if left < 0:
+                result.append((t_entry, right))
+            else:
+                stack += [right, left]
+        return sorted(result)
+
+    def closest_point(self, point, **kwargs):
+        """ Finds the closest point on the shapes to the input point.
+
+        The nodes are visited in the order of their distances to the input point and the nodes farther than the
+        closest point found so far are skipped. The closest point on a Bezier segment is found using
+        :py:func:`.operations.closest_point`.
+
+        Keyword Arguments:
+
+            * ``sample_size``: size of the seed grid for each Bezier segment. *Default: 10*
+            * ``tol``: point coincidence and zero cosine tolerance. *Default: 10e-8*
+
+        :param point: input point
+        :type point: list, tuple
+        :return: shape index, parameter(s) on the shape, the closest point and the distance
+        :rtype: tuple
+        """
+        sample_size = kwargs.get('sample_size', 10)
+        tol = kwargs.get('tol', 10e-8)
+
+        best = None
+        queue = [(0.0, 0)]
+        while queue:
+            dist_sq, node = heapq.heappop(queue)
+            if best is not None and dist_sq >= best[3] ** 2:
+                break
+            left, right = self._node_children[node]
+            if left >= 0:
+                for child in (left, right):
+                    heapq.heappush(queue, (_box_distance_sq(point, self._node_bbox[child]), child))
+                continue
+
+            patch = self._patches[right]
+            size = sample_size if isinstance(patch, Abstract.Curve) else (sample_size, sample_size)
+            params, pt, dist = operations.closest_point(patch, point, sample_size=size, tol=tol)
+            if best is None or dist < best[3]:
+                best = (self._owners[right][0], self.shape_params(right, params), pt, dist)
+
+        return best
+
+    def _build(self, indices, boxes, centers):
+        """ Builds the subtree of the input Bezier segments.
+
+        :param indices: indices of the Bezier segments
+        :type indices: list
+        :param boxes: bounding boxes of all Bezier segments
+        :type boxes: list
+        :param centers: centers of the bounding boxes of all Bezier segments
+        :type centers: list
+        :return: index of the root node of the subtree
+        :rtype: int
+        """
+        node = len(self._node_bbox)
+        self._node_bbox.append(None)
+        self._node_children.append(None)
+
+        if len(indices) == 1:
+            self._node_bbox[node] = boxes[indices[0]]
+            self._node_children[node] = (-1, indices[0])
+            self._leaf_node[indices[0]] = node
+            return node
+
+        # Split the segments at the median of the centers on the longest axis
+        cmin, cmax = _bounding_box([centers[idx] for idx in indices])
+        axis = max(range(len(cmin)), key=lambda i: cmax[i] - cmin[i])
+        indices = sorted(indices, key=lambda idx: centers[idx][axis])
+        mid = len(indices) // 2
+
+        left = self._build(indices[:mid], boxes, centers)
+        right = self._build(indices[mid:], boxes, centers)
+        self._node_bbox[node] = _bbox_union(self._node_bbox[left], self._node_bbox[right])
+        self._node_children[node] = (left, right)
+        return node
+
+
+def _decompose(shape):
+    """ Decomposes the shape into Bezier segments and finds their parametric domains on the shape.
+
+    :param shape: curve or surface
+    :type shape: Abstract.Curve or Abstract.Surface
+    :return: list of Bezier segments and list of their parametric domains
+    :rtype: tuple
+    """
+    if isinstance(shape, Abstract.Curve):
+        knots = _distinct_knots(shape.degree, shape.knotvector)
+        return list(operations.decompose_curve(shape)), [((k0, k1),) for k0, k1 in zip(knots[:-1], knots[1:])]
+    knots_u = _distinct_knots(shape.degree_u, shape.knotvector_u)
+    knots_v = _distinct_knots(shape.degree_v, shape.knotvector_v)
+    domains = [((u0, u1), (v0, v1)) for u0, u1 in zip(knots_u[:-1], knots_u[1:])
+               for v0, v1 in zip(knots_v[:-1], knots_v[1:])]
+    return list(operations.decompose_surface(shape)), domains
+
+
+def _distinct_knots(degree, knot_vector):
+    """ Finds the distinct knots in the parametric domain defined by the knot vector. """
+    return sorted(set(knot_vector[degree:len(knot_vector) - degree]))
+
+
+def _bounding_box(points):
+    """ Computes the bounding box of the input points. """
+    return [min(coords) for coords in zip(*points)], [max(coords) for coords in zip(*points)]
+
+
+def _bbox(patch):
+    """ Computes the bounding box of the control points of the Bezier segment.
+
+    The control points of the rational segments are in Cartesian coordinates, i.e. not weighted.
+    """
+    return _bounding_box(patch.ctrlpts)
+
+
+def _bbox_union(bbox1, bbox2):
+    """ Computes the bounding box of two bounding boxes. """
+    return ([min(b1, b2) for b1, b2 in zip(bbox1[0], bbox2[0])],
+            [max(b1, b2) for b1, b2 in zip(bbox1[1], bbox2[1])])
+
+
+def _box_distance_sq(point, bbox):
+    """ Computes the squared distance between the point and the bounding box. """
+    dist = 0.0
+    for p, b0, b1 in zip(point, bbox[0], bbox[1]):
+        if p < b0:
+            dist += (b0 - p) ** 2
+        elif p > b1:
+            dist += (p - b1) ** 2
+    return dist
+
+
+def _ray_box(origin, inv_dir, bbox, t_min, t_max):
+    """ Applies the slab test to find the entry parameter of the ray into the bounding box.
+
+    :param origin: origin of the ray
+    :type origin: list, tuple
+    :param inv_dir: inverse of the ray direction, None for the zero components
+    :type inv_dir: list
+    :param bbox: bounding box
+    :type bbox: list, tuple
+    :param t_min: start of the ray
+    :type t_min: float
+    :param t_max: end of the ray
+    :type t_max: float
+    :return: entry parameter or None, if the ray misses the bounding box
+    :rtype: float
+    """
+    for o, inv, b0, b1 in zip(origin, inv_dir, bbox[0], bbox[1]):
+        if inv is None:
+            # The ray is parallel to the slab
+            if o < b0 or o > b1:
+                return None
+            continue
+        t0 = (b0 - o) * inv
+        t1 = (b1 - o) * inv
+        if t0 > t1:
+            t0, t1 = t1, t0
+        t_min = max(t_min, t0)
+        t_max = min(t_max, t1)
+        if t_min > t_max:
+            return None
+    return t_min
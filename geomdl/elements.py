@@ -8,6 +8,8 @@
 """
 
 import copy
+from array import array
+from . import arrays
 
 
 # Abstract base class for geometric entities
@@ -458,3 +460,405 @@ class Body(AbstractEntity):
             else:
                 raise TypeError("Input must be a Face object")
         self._data = res
+
+
+# Compact triangle mesh
+class TriangleMesh(object):
+    """ Compact storage for triangular meshes.
+
+    Instead of :py:class:`.Vertex` and :py:class:`.Triangle` object lists, this class stores the vertex coordinates,
+    the parametric coordinates of the vertices and the zero-indexed triangle vertex indices in contiguous buffers
+    (i.e. :py:class:`.arrays.PointArray` instances) and the inside-outside flags in byte arrays. The triangle vertex
+    indices are stored as 32-bit integers.
+
+    :py:attr:`~vertices` and :py:attr:`~triangles` properties provide lightweight :py:class:`.MeshVertex` and
+    :py:class:`.MeshTriangle` views for the code working with the vertex and triangle objects. The views are generated
+    on access and they read from and write to the buffers of the mesh.
+
+    :param points: vertex coordinates
+    :type points: list, tuple, arrays.PointArray
+    :param uvs: parametric coordinates of the vertices
+    :type uvs: list, tuple, arrays.PointArray
+    :param triangles: zero-indexed vertex indices of the triangles
+    :type triangles: list, tuple, arrays.PointArray
+    :param vertices_inside: inside-outside flags of the vertices
+    :type vertices_inside: list, tuple
+    :param triangles_inside: inside-outside flags of the triangles
+    :type triangles_inside: list, tuple
+    """
+    __slots__ = ('_points', '_uvs', '_triangles', '_vertices_inside', '_triangles_inside')
+
+    def __init__(self, points=(), uvs=(), triangles=(), vertices_inside=None, triangles_inside=None):
+        self._points = self._point_array(points, 3, 'd')
+        self._uvs = self._point_array(uvs, 2, 'd')
+        self._triangles = self._point_array(triangles, 3, 'i')
+        if len(self._uvs) != len(self._points):
+            raise ValueError("The number of parametric coordinates must be equal to the number of vertices")
+        self._vertices_inside = self._flag_array(vertices_inside, len(self._points))
+        self._triangles_inside = self._flag_array(triangles_inside, len(self._triangles))
+
+    @staticmethod
+    def _point_array(points, dimension, typecode):
+        """ Converts the input to a point array, if necessary. """
+        if isinstance(points, arrays.PointArray) and points.data.typecode == typecode:
+            return points
+        return arrays.PointArray(points, dimension=dimension, typecode=typecode)
+
+    @staticmethod
+    def _flag_array(flags, size):
+        """ Converts the input to a flag array, if necessary. """
+        if flags is None:
+            return array('b', [0]) * size
+        if len(flags) != size:
+            raise ValueError("The number of flags must be " + str(size))
+        return array('b', [1 if flag else 0 for flag in flags])
+
+    @classmethod
+    def from_elements(cls, vertices, triangles):
+        """ Generates a compact mesh from the lists of vertex and triangle objects.
+
+        The vertices must be numbered starting from 1 in the order of the input list, e.g. using the output of
+        :py:func:`.utilities.make_triangle_mesh()`.
+
+        :param vertices: list of vertices
+        :type vertices: list, tuple
+        :param triangles: list of triangles
+        :type triangles: list, tuple
+        :return: compact mesh
+        :rtype: TriangleMesh
+        """
+        return cls(points=[vertex.data for vertex in vertices], uvs=[vertex.uv for vertex in vertices],
+                   triangles=[tri.vertex_ids_zero for tri in triangles],
+                   vertices_inside=[vertex.inside for vertex in vertices],
+                   triangles_inside=[tri.inside for tri in triangles])
+
+    @property
+    def points(self):
+        """ Vertex coordinates.
+
+        :getter: Gets the vertex coordinates
+        :type: arrays.PointArray
+        """
+        return self._points
+
+    @property
+    def uvs(self):
+        """ Parametric coordinates of the vertices.
+
+        :getter: Gets the parametric coordinates
+        :type: arrays.PointArray
+        """
+        return self._uvs
+
+    @property
+    def triangle_indices(self):
+        """ Zero-indexed vertex indices of the triangles.
+
+        :getter: Gets the vertex indices
+        :type: arrays.PointArray
+        """
+        return self._triangles
+
+    @property
+    def vertices(self):
+        """ Vertex views.
+
+        :getter: Gets the vertices as a sequence of :py:class:`.MeshVertex` views
+        """
+        return _MeshEntityList(self, MeshVertex, len(self._points))
+
+    @property
+    def triangles(self):
+        """ Triangle views.
+
+        :getter: Gets the triangles as a sequence of :py:class:`.MeshTriangle` views
+        """
+        return _MeshEntityList(self, MeshTriangle, len(self._triangles))
+
+    @property
+    def nbytes(self):
+        """ Size of the stored mesh data in bytes.
+
+        :getter: Gets the size in bytes
+        :type: int
+        """
+        return self._points.nbytes + self._uvs.nbytes + self._triangles.nbytes + \
+            len(self._vertices_inside) + len(self._triangles_inside)
+
+
+class _MeshEntityList(object):
+    """ Sequence of the vertex or triangle views of a compact mesh. """
+    __slots__ = ('_mesh', '_view', '_size')
+
+    def __init__(self, mesh, view, size):
+        self._mesh = mesh
+        self._view = view
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._view(self._mesh, idx) for idx in range(*key.indices(self._size))]
+        if key < 0:
+            key += self._size
+        if not 0 <= key < self._size:
+            raise IndexError("Index out of range")
+        return self._view(self._mesh, key)
+
+    def __iter__(self):
+        for idx in range(self._size):
+            yield self._view(self._mesh, idx)
+
+
+class MeshVertex(object):
+    """ Lightweight view of a vertex stored in a :py:class:`.TriangleMesh`.
+
+    Provides the same properties as :py:class:`.Vertex`, except that the identifier is fixed by the position of the
+    vertex in the mesh.
+    """
+    __slots__ = ('_mesh', '_idx')
+
+    def __init__(self, mesh, idx):
+        self._mesh = mesh
+        self._idx = idx
+
+    def __str__(self):
+        return "Vertex " + str(self.id) + " " + str(list(self.data))
+
+    __repr__ = __str__
+
+    def __nonzero__(self):
+        # For Python 2 compatibility
+        return self.__bool__()
+
+    def __bool__(self):
+        # For Python 3 compatibility
+        return self.inside
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    @property
+    def id(self):
+        """ Vertex identifier, i.e. the vertex number starting from 1.
+
+        :getter: Gets the identifier
+        :type: int
+        """
+        return self._idx + 1
+
+    @property
+    def data(self):
+        """ (x,y,z) components of the vertex.
+
+        :getter: Gets the 3-dimensional components
+        :setter: Sets the 3-dimensional components
+        """
+        return tuple(self._mesh.points[self._idx])
+
+    @data.setter
+    def data(self, value):
+        if not isinstance(value, (list, tuple)):
+            raise TypeError("Vertex data must be a list or tuple")
+        if len(value) != 3:
+            raise ValueError("Vertex can only store 3 components")
+        self._mesh.points[self._idx] = value
+
+    @property
+    def x(self):
+        """ x-component of the vertex
+
+        :getter: Gets the x-component of the vertex
+        :type: float
+        """
+        return self._mesh.points[self._idx][0]
+
+    @property
+    def y(self):
+        """ y-component of the vertex
+
+        :getter: Gets the y-component of the vertex
+        :type: float
+        """
+        return self._mesh.points[self._idx][1]
+
+    @property
+    def z(self):
+        """ z-component of the vertex
+
+        :getter: Gets the z-component of the vertex
+        :type: float
+        """
+        return self._mesh.points[self._idx][2]
+
+    @property
+    def uv(self):
+        """ Parametric (u,v) pair of the vertex
+
+        :getter: Gets the uv-component of the vertex
+        :setter: Sets the uv-component of the vertex
+        """
+        return tuple(self._mesh.uvs[self._idx])
+
+    @uv.setter
+    def uv(self, value):
+        if not isinstance(value, (list, tuple)):
+            raise TypeError("UV data input must be a list or tuple")
+        if len(value) != 2:
+            raise ValueError("UV must have 2 components")
+        self._mesh.uvs[self._idx] = value
+
+    @property
+    def u(self):
+        """ Parametric u-component of the vertex
+
+        :getter: Gets the u-component of the vertex
+        :type: float
+        """
+        return self._mesh.uvs[self._idx][0]
+
+    @property
+    def v(self):
+        """ Parametric v-component of the vertex
+
+        :getter: Gets the v-component of the vertex
+        :type: float
+        """
+        return self._mesh.uvs[self._idx][1]
+
+    @property
+    def inside(self):
+        """ Inside-outside flag
+
+        :getter: Gets the flag
+        :setter: Sets the flag
+        :type: bool
+        """
+        return bool(self._mesh._vertices_inside[self._idx])
+
+    @inside.setter
+    def inside(self, value):
+        self._mesh._vertices_inside[self._idx] = 1 if value else 0
+
+
+class MeshTriangle(object):
+    """ Lightweight view of a triangle stored in a :py:class:`.TriangleMesh`.
+
+    Provides the same properties as :py:class:`.Triangle`, except that the identifier is fixed by the position of the
+    triangle in the mesh.
+    """
+    __slots__ = ('_mesh', '_idx')
+
+    def __init__(self, mesh, idx):
+        self._mesh = mesh
+        self._idx = idx
+
+    def __str__(self):
+        return "Triangle " + str(self.id)
+
+    __repr__ = __str__
+
+    def __len__(self):
+        return 3
+
+    def __getitem__(self, key):
+        return self.vertices[key]
+
+    def __iter__(self):
+        return iter(self.vertices)
+
+    @property
+    def id(self):
+        """ Triangle identifier, i.e. the triangle number starting from 1.
+
+        :getter: Gets the identifier
+        :type: int
+        """
+        return self._idx + 1
+
+    @property
+    def vertices(self):
+        """ Vertices of the triangle
+
+        :getter: Gets the list of vertices
+        :type: tuple
+        """
+        return tuple(MeshVertex(self._mesh, idx) for idx in self._mesh.triangle_indices[self._idx])
+
+    @property
+    def vertices_raw(self):
+        """ Vertices which generates a closed triangle
+
+        Adds the first vertex as a last element of the return value (good for plotting)
+
+        :getter: Gets the list of vertices
+        :type: list
+        """
+        points = self._mesh.points
+        v_raw = [tuple(points[idx]) for idx in self._mesh.triangle_indices[self._idx]]
+        v_raw.append(v_raw[0])
+        return v_raw
+
+    @property
+    def vertices_uv(self):
+        """ Parametric coordinates of the triangle vertices
+
+        :getter: Gets the parametric coordinates of the vertices
+        :type: list
+        """
+        uvs = self._mesh.uvs
+        return [tuple(uvs[idx]) for idx in self._mesh.triangle_indices[self._idx]]
+
+    @property
+    def edges(self):
+        """ Edges of the triangle
+
+        :getter: Gets the list of vertices that generates the edges of the triangle
+        :type: list
+        """
+        data = self.vertices_raw
+        return [[data[idx], data[idx + 1]] for idx in range(3)]
+
+    @property
+    def vertex_ids(self):
+        """ Vertex indices
+
+        Vertex numbering starts from 1.
+
+        :getter: Gets the vertex indices
+        :type: list
+        """
+        return [idx + 1 for idx in self._mesh.triangle_indices[self._idx]]
+
+    @property
+    def vertex_ids_zero(self):
+        """ Zero-indexed vertex indices
+
+        Vertex numbering starts from 0.
+
+        :getter: Gets the vertex indices
+        :type: list
+        """
+        return list(self._mesh.triangle_indices[self._idx])
+
+    @property
+    def inside(self):
+        """ Inside-outside flag
+
+        :getter: Gets the flag
+        :setter: Sets the flag
+        :type: bool
+        """
+        return bool(self._mesh._triangles_inside[self._idx])
+
+    @inside.setter
+    def inside(self, value):
+        self._mesh._triangles_inside[self._idx] = 1 if value else 0
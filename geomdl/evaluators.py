@@ -8,10 +8,18 @@
 """
 
 import copy
+import heapq
+import math
 from . import Abstract
 from . import helpers
 from . import utilities
 
+# NumPy is an optional dependency, only required by the NumPy-based evaluators
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class CurveEvaluator(Abstract.Evaluator, Abstract.CurveEvaluator):
     """ Sequential B-Spline curve evaluation algorithms.
@@ -23,13 +31,13 @@ class CurveEvaluator(Abstract.Evaluator, Abstract.CurveEvaluator):
     * Algorithm A5.1: CurveKnotIns
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_bisect`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(CurveEvaluator, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
 
     def evaluate_single(self, **kwargs):
         """ Evaluates a single curve point. """
@@ -68,9 +76,8 @@ class CurveEvaluator(Abstract.Evaluator, Abstract.CurveEvaluator):
         precision = kwargs.get('precision')
 
         # Algorithm A3.1
-        knots = utilities.linspace(start_u, stop_u, sample_size, decimals=precision)
-        spans = helpers.find_spans(degree, knot_vector, len(control_points), knots, self._span_func)
-        basis = helpers.basis_functions(degree, knot_vector, spans, knots)
+        knots, spans, basis = _sample_basis(self, degree, knot_vector, len(control_points), start_u, stop_u,
+                                            sample_size, precision)
 
         eval_points = []
         for idx in range(len(knots)):
@@ -83,6 +90,47 @@ class CurveEvaluator(Abstract.Evaluator, Abstract.CurveEvaluator):
 
         return eval_points
 
+    def evaluate_adaptive(self, **kwargs):
+        """ Evaluates the curve by adaptive sampling.
+
+        The knot spans in the evaluation range are subdivided until the chordal deviation of each parameter interval,
+        estimated at its midpoint and quarter points, is within the tolerance ``tol``. The intervals with the largest
+        deviations are subdivided first and the subdivision stops when the number of points reaches ``max_points``.
+        The span of each knot interval is found once and reused by all samples inside the interval.
+
+        :return: a tuple containing the sampled parameters and the evaluated curve points
+        :rtype: tuple
+        """
+        start_u = kwargs.get('start_u')
+        stop_u = kwargs.get('stop_u')
+        degree = kwargs.get('degree')
+        knot_vector = kwargs.get('knotvector')
+        control_points = kwargs.get('ctrlpts')
+        dimension = kwargs.get('dimension')
+        tol = kwargs.get('tol')
+        max_points = kwargs.get('max_points')
+
+        # Algorithm A3.1, using the span of the knot interval
+        def curve_point(span, knot):
+            basis = helpers.basis_function(degree, knot_vector, span, knot)
+            crvpt = [0.0 for _ in range(dimension)]
+            for i in range(0, degree + 1):
+                crvpt[:] = [crv_p + (basis[i] * ctl_p) for crv_p, ctl_p in
+                            zip(crvpt, control_points[span - degree + i])]
+            return self._cartesian(crvpt, dimension)
+
+        # Knot intervals in the evaluation range
+        knots = [start_u] + sorted(set(k for k in knot_vector if start_u < k < stop_u)) + [stop_u]
+        intervals = [(self._span_func(degree, knot_vector, len(control_points), 0.5 * (k1 + k2)), k1, k2)
+                     for k1, k2 in zip(knots[:-1], knots[1:])]
+
+        return _sample_adaptive(curve_point, intervals, tol, max_points)
+
+    @staticmethod
+    def _cartesian(point, dimension):
+        """ Converts the evaluated point to Cartesian coordinates. """
+        return point
+
     # Evaluates the curve derivative using "CurveDerivsAlg1" algorithm
     def derivatives_single(self, **kwargs):
         """ Evaluates n-th order curve derivatives at a single parameter. """
@@ -114,12 +162,47 @@ class CurveEvaluator(Abstract.Evaluator, Abstract.CurveEvaluator):
         return CK
 
     def derivatives(self, **kwargs):
-        """ Evaluates n-th order curve derivatives over a range of parameters. """
+        """ Evaluates n-th order curve derivatives over a range of parameters.
+
+        The parameters are taken from the ``knots`` keyword argument, if it is set. Otherwise, they are generated
+        from the ``start_u``, ``stop_u`` and ``sample_size`` keyword arguments, as in :py:meth:`evaluate`.
+        """
         # Call parent method
         super(CurveEvaluator, self).derivatives(**kwargs)
 
-        # Not implemented, yet...
-        raise NotImplementedError("This functionality is not implemented at the moment")
+        deriv_order = kwargs.get('deriv_order', 0)
+        degree = kwargs.get('degree')
+        knot_vector = kwargs.get('knotvector')
+        control_points = kwargs.get('ctrlpts')
+        dimension = kwargs.get('dimension')
+        knots = kwargs.get('knots')
+
+        # Algorithm A3.2
+        du = min(degree, deriv_order)
+
+        if knots is None:
+            # Parameter range uses the cached spans and basis function derivatives
+            knots, spans, bfunsders = _sample_basis(self, degree, knot_vector, len(control_points),
+                                                    kwargs.get('start_u'), kwargs.get('stop_u'),
+                                                    kwargs.get('sample_size'), kwargs.get('precision'), du)
+            knots_sorted = knots
+        else:
+            # Compute spans and basis function derivatives in a single pass over the sorted parameters
+            knots_sorted = sorted(set(knots))
+            spans = _find_spans_sorted(degree, knot_vector, len(control_points), knots_sorted, self._span_func)
+            bfunsders = helpers.basis_functions_ders(degree, knot_vector, spans, knots_sorted, du)
+
+        ders = {}
+        for knot, span, bfd in zip(knots_sorted, spans, bfunsders):
+            CK = [[0.0 for _ in range(dimension)] for _ in range(deriv_order + 1)]
+            for k in range(0, du + 1):
+                for j in range(0, degree + 1):
+                    CK[k][:] = [drv + (bfd[k][j] * ctl_pt) for drv, ctl_pt in
+                                zip(CK[k], control_points[span - degree + j])]
+            ders[knot] = CK
+
+        # Return the derivatives in the order of the input parameters
+        return [ders[knot] for knot in knots]
 
     def insert_knot(self, **kwargs):
         """ Insert knot multiple times at a single parameter. """
@@ -162,7 +245,7 @@ class CurveEvaluator(Abstract.Evaluator, Abstract.CurveEvaluator):
 
         # The algorithm uses R array to update control points
         for i in range(0, degree - s + 1):
-            R[i] = copy.deepcopy(control_points[k - degree + i])
+            R[i] = list(control_points[k - degree + i])
 
         # Insert the knot r times
         for j in range(1, r + 1):
@@ -181,6 +264,29 @@ class CurveEvaluator(Abstract.Evaluator, Abstract.CurveEvaluator):
         # Return updated knot vector and control points
         return UQ, Q
 
+    def refine_knotvector(self, **kwargs):
+        """ Inserts multiple knots in a single pass.
+
+        Implementation of Algorithm A5.4 from The NURBS Book by Piegl & Tiller.
+
+        Keyword Arguments:
+
+            * ``knots``: sorted list of knots to be inserted
+            * ``degree``: degree
+            * ``knotvector``: knot vector
+            * ``ctrlpts``: control points (may be weighted or not)
+
+        :return: updated knot vector and control points
+        :rtype: tuple
+        """
+        knots = kwargs.get('knots')
+        degree = kwargs.get('degree')
+        knot_vector = kwargs.get('knotvector')
+        control_points = kwargs.get('ctrlpts')
+
+        UQ, Q = _refine_knot_vector(degree, knot_vector, [control_points], knots, self._span_func)
+        return UQ, Q[0]
+
 
 class CurveEvaluator2(CurveEvaluator):
     """ Sequential B-Spline curve evaluation algorithms (alternative).
@@ -192,13 +298,13 @@ class CurveEvaluator2(CurveEvaluator):
     * Algorithm A5.1: CurveKnotIns
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_bisect`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(CurveEvaluator2, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
 
     # Computes the control points of all derivative curves up to and including the {degree}-th derivative
     @staticmethod
@@ -283,13 +389,13 @@ class NURBSCurveEvaluator(CurveEvaluator):
     * Algorithm A5.1: CurveKnotIns
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_bisect`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(NURBSCurveEvaluator, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
 
     def evaluate_single(self, **kwargs):
         """ Evaluates a single curve point. """
@@ -318,6 +424,11 @@ class NURBSCurveEvaluator(CurveEvaluator):
 
         return eval_points
 
+    @staticmethod
+    def _cartesian(point, dimension):
+        """ Divides the evaluated point by its weight. """
+        return [float(c / point[-1]) for c in point[0:(dimension - 1)]]
+
     def derivatives_single(self, **kwargs):
         """ Evaluates n-th order curve derivatives at a single parameter. """
         deriv_order = kwargs.get('deriv_order')
@@ -327,16 +438,175 @@ class NURBSCurveEvaluator(CurveEvaluator):
         CKw = super(NURBSCurveEvaluator, self).derivatives_single(**kwargs)
 
         # Algorithm A4.2
-        CK = [[0.0 for _ in range(dimension - 1)] for _ in range(deriv_order + 1)]
-        for k in range(0, deriv_order + 1):
-            v = [val for val in CKw[k][0:(dimension - 1)]]
-            for i in range(1, k + 1):
-                v[:] = [tmp - (utilities.binomial_coefficient(k, i) * CKw[i][-1] * drv) for tmp, drv in
-                        zip(v, CK[k - i])]
-            CK[k][:] = [tmp / CKw[0][-1] for tmp in v]
+        return _rational_curve_derivatives(CKw, deriv_order, dimension)
 
-        # Return C(u) derivatives
-        return CK
+    def derivatives(self, **kwargs):
+        """ Evaluates n-th order curve derivatives over a range of parameters. """
+        deriv_order = kwargs.get('deriv_order', 0)
+        dimension = kwargs.get('dimension')
+
+        # Call the parent function to evaluate A(u) and w(u) derivatives
+        CKw_list = super(NURBSCurveEvaluator, self).derivatives(**kwargs)
+
+        # Algorithm A4.2
+        return [_rational_curve_derivatives(CKw, deriv_order, dimension) for CKw in CKw_list]
+
+
+class CurveEvaluatorNumPy(CurveEvaluator):
+    """ Vectorized B-Spline curve evaluation algorithms (requires NumPy).
+
+    This evaluator replaces the curve evaluation over a range of parameters with an array-based implementation of the
+    following algorithms from **The NURBS Book**:
+
+    * Algorithm A2.1: FindSpan
+    * Algorithm A2.2: BasisFuns
+    * Algorithm A3.1: CurvePoint
+
+    The spans, the basis functions and the weighted sum of the control points are computed for all parameters at once
+    and :py:meth:`evaluate` returns the evaluated points as a contiguous NumPy array of shape *(sample_size, dimension)*.
+    The remaining methods are inherited from :py:class:`.CurveEvaluator`.
+
+    Please note that the span finding operation is computed using ``numpy.searchsorted`` during the evaluation of
+    a range of parameters and therefore, ``find_span_func`` keyword argument only applies to the inherited methods.
+
+    .. code-block:: python
+
+        from geomdl import BSpline
+        from geomdl import evaluators
+
+        curve = BSpline.Curve()
+
+        # Do degree, control points and knot vector assignments here
+
+        # Switch to the vectorized evaluator
+        curve.evaluator = evaluators.CurveEvaluatorNumPy()
+    """
+
+    def __init__(self, **kwargs):
+        if np is None:
+            raise ImportError("CurveEvaluatorNumPy requires NumPy")
+        super(CurveEvaluatorNumPy, self).__init__(**kwargs)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the curve. """
+        # Skip the sequential algorithm, only call the abstract method
+        super(CurveEvaluator, self).evaluate(**kwargs)
+
+        # Algorithm A3.1 (vectorized)
+        return _evaluate_curve_numpy(**kwargs)
+
+
+class NURBSCurveEvaluatorNumPy(NURBSCurveEvaluator):
+    """ Vectorized NURBS curve evaluation algorithms (requires NumPy).
+
+    Rational counterpart of :py:class:`.CurveEvaluatorNumPy`. The weighted control points are evaluated using the
+    vectorized algorithm and the resulting homogeneous points are divided by their weights as a single array
+    operation. The remaining methods are inherited from :py:class:`.NURBSCurveEvaluator`.
+    """
+
+    def __init__(self, **kwargs):
+        if np is None:
+            raise ImportError("NURBSCurveEvaluatorNumPy requires NumPy")
+        super(NURBSCurveEvaluatorNumPy, self).__init__(**kwargs)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the curve. """
+        # Skip the sequential algorithm, only call the abstract method
+        super(CurveEvaluator, self).evaluate(**kwargs)
+
+        # Algorithm A4.1 (vectorized)
+        crvptw = _evaluate_curve_numpy(**kwargs)
+
+        # Divide by weight
+        return np.ascontiguousarray(crvptw[:, :-1] / crvptw[:, -1:])
+
+
+def _evaluate_curve_numpy(**kwargs):
+    """ Evaluates a curve over a range of parameters using NumPy arrays.
+
+    Takes the same keyword arguments as :py:meth:`.CurveEvaluator.evaluate`.
+
+    :return: evaluated points
+    :rtype: numpy.ndarray
+    """
+    start_u = kwargs.get('start_u')
+    stop_u = kwargs.get('stop_u')
+    sample_size = kwargs.get('sample_size')
+    degree = kwargs.get('degree')
+    knot_vector = np.asarray(kwargs.get('knotvector'), dtype=np.float64)
+    control_points = np.asarray(kwargs.get('ctrlpts'), dtype=np.float64)
+    precision = kwargs.get('precision')
+
+    # Generate the parameters (same rounding as utilities.linspace)
+    knots = np.round(np.linspace(start_u, stop_u, sample_size), precision)
+
+    # Algorithm A2.1 (vectorized)
+    spans = _find_spans_numpy(degree, knot_vector, len(control_points), knots)
+
+    # Algorithm A2.2 (vectorized)
+    basis = _basis_functions_numpy(degree, knot_vector, spans, knots)
+
+    # Algorithm A3.1 (vectorized)
+    eval_points = np.zeros((len(knots), control_points.shape[1]), dtype=np.float64)
+    for i in range(0, degree + 1):
+        eval_points += basis[:, i, np.newaxis] * control_points[spans - degree + i]
+
+    return np.ascontiguousarray(eval_points)
+
+
+def _find_spans_numpy(degree, knot_vector, num_ctrlpts, knots):
+    """ Finds the spans of an array of knots over the knot vector using NumPy.
+
+    Vectorized version of Algorithm A2.1 from The NURBS Book by Piegl & Tiller. The output is consistent with
+    :py:func:`.helpers.find_span_bisect`.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: numpy.ndarray
+    :param num_ctrlpts: number of control points
+    :type num_ctrlpts: int
+    :param knots: knots
+    :type knots: numpy.ndarray
+    :return: spans
+    :rtype: numpy.ndarray
+    """
+    spans = np.searchsorted(knot_vector, knots, side='right') - 1
+    return np.clip(spans, degree, num_ctrlpts - 1)
+
+
+def _basis_functions_numpy(degree, knot_vector, spans, knots):
+    """ Computes the non-vanishing basis functions for an array of knots using NumPy.
+
+    Vectorized version of Algorithm A2.2 from The NURBS Book by Piegl & Tiller.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: numpy.ndarray
+    :param spans: spans
+    :type spans: numpy.ndarray
+    :param knots: knots
+    :type knots: numpy.ndarray
+    :return: basis functions as an array of shape *(len(knots), degree + 1)*
+    :rtype: numpy.ndarray
+    """
+    num_knots = len(knots)
+    left = np.zeros((degree + 1, num_knots), dtype=np.float64)
+    right = np.zeros((degree + 1, num_knots), dtype=np.float64)
+    N = np.ones((num_knots, degree + 1), dtype=np.float64)  # N[0] = 1.0 by definition
+
+    for j in range(1, degree + 1):
+        left[j] = knots - knot_vector[spans + 1 - j]
+        right[j] = knot_vector[spans + j] - knots
+        saved = np.zeros(num_knots, dtype=np.float64)
+        for r in range(0, j):
+            temp = N[:, r] / (right[r + 1] + left[j - r])
+            N[:, r] = saved + right[r + 1] * temp
+            saved = left[j - r] * temp
+        N[:, j] = saved
+
+    return N
 
 
 class SurfaceEvaluator(Abstract.Evaluator, Abstract.SurfaceEvaluator):
@@ -349,13 +619,13 @@ class SurfaceEvaluator(Abstract.Evaluator, Abstract.SurfaceEvaluator):
     * Algorithm A5.3: SurfaceKnotIns
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_bisect`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(SurfaceEvaluator, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
 
     def evaluate_single(self, **kwargs):
         """ Evaluates a single surface point. """
@@ -392,6 +662,46 @@ class SurfaceEvaluator(Abstract.Evaluator, Abstract.SurfaceEvaluator):
 
         return spt
 
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the surface points at a list of (u, v) parameter pairs.
+
+        The basis functions are computed once for each distinct parameter value on the u- and v-directions.
+        """
+        knots = kwargs.get('knots')
+        degree_u = kwargs.get('degree_u')
+        degree_v = kwargs.get('degree_v')
+        knot_vector_u = kwargs.get('knotvector_u')
+        knot_vector_v = kwargs.get('knotvector_v')
+        control_points2d = kwargs.get('ctrlpts')
+        ctrlpts_size_u = kwargs.get('ctrlpts_size_u')
+        ctrlpts_size_v = kwargs.get('ctrlpts_size_v')
+        dimension = kwargs.get('dimension')
+
+        # Spans and basis functions of the distinct parameter values
+        basis_u = {}
+        for knot_u in set(uv[0] for uv in knots):
+            span_u = self._span_func(degree_u, knot_vector_u, ctrlpts_size_u, knot_u)
+            basis_u[knot_u] = (span_u - degree_u, helpers.basis_function(degree_u, knot_vector_u, span_u, knot_u))
+        basis_v = {}
+        for knot_v in set(uv[1] for uv in knots):
+            span_v = self._span_func(degree_v, knot_vector_v, ctrlpts_size_v, knot_v)
+            basis_v[knot_v] = (span_v - degree_v, helpers.basis_function(degree_v, knot_vector_v, span_v, knot_v))
+
+        # Algorithm A3.5
+        eval_points = []
+        for knot_u, knot_v in knots:
+            idx_u, bfunc_u = basis_u[knot_u]
+            idx_v, bfunc_v = basis_v[knot_v]
+            spt = [0.0 for _ in range(dimension)]
+            for k in range(0, degree_u + 1):
+                temp = [0.0 for _ in range(dimension)]
+                for l in range(0, degree_v + 1):
+                    temp[:] = [tmp + (bfunc_v[l] * cp) for tmp, cp in zip(temp, control_points2d[idx_u + k][idx_v + l])]
+                spt[:] = [pt + (bfunc_u[k] * tmp) for pt, tmp in zip(spt, temp)]
+            eval_points.append(spt)
+
+        return eval_points
+
     def evaluate(self, **kwargs):
         """ Evaluates the surface. """
         # Call parent method
@@ -413,27 +723,36 @@ class SurfaceEvaluator(Abstract.Evaluator, Abstract.SurfaceEvaluator):
         precision = kwargs.get('precision')
 
         # Algorithm A3.5
-        knots_u = utilities.linspace(start_u, stop_u, sample_size[0], decimals=precision)
-        knots_v = utilities.linspace(start_v, stop_v, sample_size[1], decimals=precision)
-
-        spans_u = helpers.find_spans(degree_u, knot_vector_u, ctrlpts_size_u, knots_u, self._span_func)
-        spans_v = helpers.find_spans(degree_v, knot_vector_v, ctrlpts_size_v, knots_v, self._span_func)
-
-        basis_u = helpers.basis_functions(degree_u, knot_vector_u, spans_u, knots_u)
-        basis_v = helpers.basis_functions(degree_v, knot_vector_v, spans_v, knots_v)
-
+        knots_u, spans_u, basis_u = _sample_basis(self, degree_u, knot_vector_u, ctrlpts_size_u, start_u, stop_u,
+                                                  sample_size[0], precision)
+        knots_v, spans_v, basis_v = _sample_basis(self, degree_v, knot_vector_v, ctrlpts_size_v, start_v, stop_v,
+                                                  sample_size[1], precision)
+
+        # The sampled basis matrices Nu (Su x nu) and Nv (Sv x nv) are banded, i.e. each row contains (degree + 1)
+        # non-zero values starting from the column (span - degree). Spans and basis functions store them compactly.
+        # The surface points are computed as Nu * P * Nv^T using the banded storage in two passes.
+
+        # 1st pass: P * Nv^T, only for the rows of P used by the u-direction spans
+        ctrlpts_nv = [None for _ in range(ctrlpts_size_u)]
+        for idx_u in set(span_u - degree_u + k for span_u in spans_u for k in range(0, degree_u + 1)):
+            row = [[] for _ in range(len(knots_v))]
+            for j in range(len(knots_v)):
+                idx_v = spans_v[j] - degree_v
+                temp = [0.0 for _ in range(dimension)]
+                for l in range(0, degree_v + 1):
+                    temp[:] = [tmp + (basis_v[j][l] * cp) for tmp, cp in
+                               zip(temp, control_points2d[idx_u][idx_v + l])]
+                row[j] = temp
+            ctrlpts_nv[idx_u] = row
+
+        # 2nd pass: Nu * (P * Nv^T)
         eval_points = []
         for i in range(len(knots_u)):
             idx_u = spans_u[i] - degree_u
             for j in range(len(knots_v)):
-                idx_v = spans_v[j] - degree_v
                 spt = [0.0 for _ in range(dimension)]
                 for k in range(0, degree_u + 1):
-                    temp = [0.0 for _ in range(dimension)]
-                    for l in range(0, degree_v + 1):
-                        temp[:] = [tmp + (basis_v[j][l] * cp) for tmp, cp in
-                                   zip(temp, control_points2d[idx_u + k][idx_v + l])]
-                    spt[:] = [pt + (basis_u[i][k] * tmp) for pt, tmp in zip(spt, temp)]
+                    spt[:] = [pt + (basis_u[i][k] * tmp) for pt, tmp in zip(spt, ctrlpts_nv[idx_u + k][j])]
 
                 eval_points.append(spt)
 
@@ -485,12 +804,78 @@ class SurfaceEvaluator(Abstract.Evaluator, Abstract.SurfaceEvaluator):
         return SKL
 
     def derivatives(self, **kwargs):
-        """ Evaluates n-th order surface derivatives over a range of (u,v) parameters. """
+        """ Evaluates n-th order surface derivatives over a range of (u,v) parameters.
+
+        The (u,v) parameter pairs are taken from the ``knots`` keyword argument, if it is set. Otherwise, they are
+        generated as a grid from the ``start_u``, ``stop_u``, ``start_v``, ``stop_v`` and ``sample_size`` keyword
+        arguments, as in :py:meth:`evaluate`.
+        """
         # Call parent method
         super(SurfaceEvaluator, self).derivatives(**kwargs)
 
-        # Not implemented, yet
-        raise NotImplementedError("This functionality is not implemented at the moment")
+        deriv_order = kwargs.get('deriv_order', 0)
+        degree_u = kwargs.get('degree_u')
+        degree_v = kwargs.get('degree_v')
+        knot_vector_u = kwargs.get('knotvector_u')
+        knot_vector_v = kwargs.get('knotvector_v')
+        control_points2d = kwargs.get('ctrlpts')
+        ctrlpts_size_u = kwargs.get('ctrlpts_size_u')
+        ctrlpts_size_v = kwargs.get('ctrlpts_size_v')
+        dimension = kwargs.get('dimension')
+        knots = kwargs.get('knots')
+
+        # Algorithm A3.6
+        du = min(degree_u, deriv_order)
+        dv = min(degree_v, deriv_order)
+
+        if knots is None:
+            # Parameter grid uses the cached spans and basis function derivatives
+            sample_size = kwargs.get('sample_size')
+            precision = kwargs.get('precision')
+            knots_u, spans_u, bfunsders_u = _sample_basis(self, degree_u, knot_vector_u, ctrlpts_size_u,
+                                                          kwargs.get('start_u'), kwargs.get('stop_u'),
+                                                          sample_size[0], precision, du)
+            knots_v, spans_v, bfunsders_v = _sample_basis(self, degree_v, knot_vector_v, ctrlpts_size_v,
+                                                          kwargs.get('start_v'), kwargs.get('stop_v'),
+                                                          sample_size[1], precision, dv)
+            knots = [(u, v) for u in knots_u for v in knots_v]
+        else:
+            # Compute spans and basis function derivatives in a single pass over the sorted parameters
+            knots_u = sorted(set(uv[0] for uv in knots))
+            spans_u = _find_spans_sorted(degree_u, knot_vector_u, ctrlpts_size_u, knots_u, self._span_func)
+            bfunsders_u = helpers.basis_functions_ders(degree_u, knot_vector_u, spans_u, knots_u, du)
+
+            knots_v = sorted(set(uv[1] for uv in knots))
+            spans_v = _find_spans_sorted(degree_v, knot_vector_v, ctrlpts_size_v, knots_v, self._span_func)
+            bfunsders_v = helpers.basis_functions_ders(degree_v, knot_vector_v, spans_v, knots_v, dv)
+
+        basis_u = dict(zip(knots_u, zip(spans_u, bfunsders_u)))
+        basis_v = dict(zip(knots_v, zip(spans_v, bfunsders_v)))
+
+        ders = []
+        for knot_u, knot_v in knots:
+            span_u, bfd_u = basis_u[knot_u]
+            span_v, bfd_v = basis_v[knot_v]
+
+            SKL = [[[0.0 for _ in range(dimension)] for _ in range(deriv_order + 1)] for _ in range(deriv_order + 1)]
+            for k in range(0, du + 1):
+                temp = [[] for _ in range(degree_v + 1)]
+                for s in range(0, degree_v + 1):
+                    temp[s] = [0.0 for _ in range(dimension)]
+                    for r in range(0, degree_u + 1):
+                        cu = span_u - degree_u + r
+                        cv = span_v - degree_v + s
+                        temp[s][:] = [tmp + (bfd_u[k][r] * cp) for tmp, cp in
+                                      zip(temp[s], control_points2d[cu][cv])]
+
+                dd = min(deriv_order - k, dv)
+                for l in range(0, dd + 1):
+                    for s in range(0, degree_v + 1):
+                        SKL[k][l][:] = [elem + (bfd_v[l][s] * tmp) for elem, tmp in zip(SKL[k][l], temp[s])]
+
+            ders.append(SKL)
+
+        return ders
 
     def insert_knot_u(self, **kwargs):
         """ Inserts knot(s) in u-direction. """
@@ -539,7 +924,7 @@ class SurfaceEvaluator(Abstract.Evaluator, Abstract.SurfaceEvaluator):
                 Q[i + r][row] = control_points2d[i][row]
             # Load auxiliary control points
             for i in range(0, degree - s + 1):
-                R[i] = copy.deepcopy(control_points2d[span - degree + i][row])
+                R[i] = list(control_points2d[span - degree + i][row])
             # Insert the knot r times
             for j in range(1, r + 1):
                 L = span - degree + j
@@ -602,7 +987,7 @@ class SurfaceEvaluator(Abstract.Evaluator, Abstract.SurfaceEvaluator):
                 Q[col][i + r] = control_points2d[col][i]
             # Load auxiliary control points
             for i in range(0, degree - s + 1):
-                R[i] = copy.deepcopy(control_points2d[col][span - degree + i])
+                R[i] = list(control_points2d[col][span - degree + i])
             # Insert the knot r times
             for j in range(1, r + 1):
                 L = span - degree + j
@@ -618,6 +1003,66 @@ class SurfaceEvaluator(Abstract.Evaluator, Abstract.SurfaceEvaluator):
 
         return VQ, Q
 
+    def refine_knotvector_u(self, **kwargs):
+        """ Inserts multiple knots in u-direction in a single pass.
+
+        Implementation of Algorithm A5.5 from The NURBS Book by Piegl & Tiller.
+
+        Keyword Arguments:
+
+            * ``knots``: sorted list of knots to be inserted
+            * ``degree``: degree on the u-direction
+            * ``knotvector``: knot vector on the u-direction
+            * ``ctrlpts``: 2-dimensional control points in [u][v] format (may be weighted or not)
+            * ``ctrlpts_size_u``: number of control points on the u-direction
+            * ``ctrlpts_size_v``: number of control points on the v-direction
+
+        :return: updated knot vector and 2-dimensional control points
+        :rtype: tuple
+        """
+        knots = kwargs.get('knots')
+        degree = kwargs.get('degree')
+        knot_vector = kwargs.get('knotvector')
+        control_points2d = kwargs.get('ctrlpts')
+        ctrlpts_size_u = kwargs.get('ctrlpts_size_u')
+        ctrlpts_size_v = kwargs.get('ctrlpts_size_v')
+
+        # Refine the columns, i.e. the control points on the u-direction for each v
+        cols = [[control_points2d[u][v] for u in range(ctrlpts_size_u)] for v in range(ctrlpts_size_v)]
+        UQ, Qcols = _refine_knot_vector(degree, knot_vector, cols, knots, self._span_func)
+
+        # Convert the columns back to [u][v] format
+        Q = [[col[u] for col in Qcols] for u in range(ctrlpts_size_u + len(knots))]
+        return UQ, Q
+
+    def refine_knotvector_v(self, **kwargs):
+        """ Inserts multiple knots in v-direction in a single pass.
+
+        Implementation of Algorithm A5.5 from The NURBS Book by Piegl & Tiller.
+
+        Keyword Arguments:
+
+            * ``knots``: sorted list of knots to be inserted
+            * ``degree``: degree on the v-direction
+            * ``knotvector``: knot vector on the v-direction
+            * ``ctrlpts``: 2-dimensional control points in [u][v] format (may be weighted or not)
+            * ``ctrlpts_size_u``: number of control points on the u-direction
+            * ``ctrlpts_size_v``: number of control points on the v-direction
+
+        :return: updated knot vector and 2-dimensional control points
+        :rtype: tuple
+        """
+        knots = kwargs.get('knots')
+        degree = kwargs.get('degree')
+        knot_vector = kwargs.get('knotvector')
+        control_points2d = kwargs.get('ctrlpts')
+        ctrlpts_size_u = kwargs.get('ctrlpts_size_u')
+
+        # Refine the rows, i.e. the control points on the v-direction for each u
+        rows = [control_points2d[u] for u in range(ctrlpts_size_u)]
+        VQ, Q = _refine_knot_vector(degree, knot_vector, rows, knots, self._span_func)
+        return VQ, Q
+
 
 class SurfaceEvaluator2(SurfaceEvaluator):
     """ Sequential B-Spline surface evaluation algorithms.
@@ -630,13 +1075,13 @@ class SurfaceEvaluator2(SurfaceEvaluator):
     * Algorithm A5.3: SurfaceKnotIns
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_bisect`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(SurfaceEvaluator2, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
 
     @staticmethod
     def derivatives_ctrlpts(**kwargs):
@@ -768,13 +1213,13 @@ class NURBSSurfaceEvaluator(SurfaceEvaluator):
     * Algorithm A5.3: SurfaceKnotIns
 
     Please note that knot vector span finding function may be changed by setting ``find_span_func`` keyword argument
-    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_linear`.
+    during the initialization. By default, this function is set to :py:func:`.helpers.find_span_bisect`.
     Please see :doc:`Helpers Module Documentation <module_utilities>` for more details.
     """
 
     def __init__(self, **kwargs):
         super(NURBSSurfaceEvaluator, self).__init__(**kwargs)
-        self._span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+        self._span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
 
     def evaluate_single(self, **kwargs):
         """ Evaluates a single surface point. """
@@ -788,6 +1233,16 @@ class NURBSSurfaceEvaluator(SurfaceEvaluator):
 
         return cpt
 
+    def evaluate_list(self, **kwargs):
+        """ Evaluates the surface points at a list of (u, v) parameter pairs. """
+        dimension = kwargs.get('dimension')
+
+        # Algorithm A4.3
+        cptw = super(NURBSSurfaceEvaluator, self).evaluate_list(**kwargs)
+
+        # Divide by weight
+        return [[float(c / pt[-1]) for c in pt[0:(dimension - 1)]] for pt in cptw]
+
     def evaluate(self, **kwargs):
         """ Evaluates the surface. """
         dimension = kwargs.get('dimension')
@@ -811,28 +1266,386 @@ class NURBSSurfaceEvaluator(SurfaceEvaluator):
         # Call the parent function to evaluate A(u) and w(u) derivatives
         SKLw = super(NURBSSurfaceEvaluator, self).derivatives_single(**kwargs)
 
-        # Generate an empty list of derivatives
-        SKL = [[[0.0 for _ in range(dimension)] for _ in range(deriv_order + 1)] for _ in range(deriv_order + 1)]
+        # Algorithm A4.4
+        return _rational_surface_derivatives(SKLw, deriv_order, dimension)
+
+    def derivatives(self, **kwargs):
+        """ Evaluates n-th order surface derivatives over a range of (u, v) parameters. """
+        deriv_order = kwargs.get('deriv_order', 0)
+        dimension = kwargs.get('dimension')
+
+        # Call the parent function to evaluate A(u) and w(u) derivatives
+        SKLw_list = super(NURBSSurfaceEvaluator, self).derivatives(**kwargs)
 
         # Algorithm A4.4
-        for k in range(0, deriv_order + 1):
-            for l in range(0, deriv_order - k + 1):
-                # Deep copying might seem a little overkill but we also want to avoid same pointer issues too
-                v = copy.deepcopy(SKLw[k][l])
+        return [_rational_surface_derivatives(SKLw, deriv_order, dimension) for SKLw in SKLw_list]
+
+
+class SurfaceEvaluatorNumPy(SurfaceEvaluator):
+    """ Vectorized B-Spline surface evaluation algorithms (requires NumPy).
+
+    This evaluator replaces the surface evaluation over a range of parameters with the tensor product form of
+    Algorithm A3.5 from **The NURBS Book**. The sampled basis matrices :math:`N_u` *(sample_size_u x ctrlpts_size_u)*
+    and :math:`N_v` *(sample_size_v x ctrlpts_size_v)* are banded and they are stored as the spans and the
+    *(degree + 1)* non-zero basis functions of each row. The surface points are computed as :math:`N_u P N_v^T` for
+    all coordinates using the banded storage in two passes.
+
+    :py:meth:`evaluate` returns the evaluated points as a contiguous NumPy array of shape
+    *(sample_size_u * sample_size_v, dimension)* in the same (v-varies-first) order as :py:class:`.SurfaceEvaluator`.
+    The remaining methods are inherited from :py:class:`.SurfaceEvaluator`.
+    """
+
+    def __init__(self, **kwargs):
+        if np is None:
+            raise ImportError("SurfaceEvaluatorNumPy requires NumPy")
+        super(SurfaceEvaluatorNumPy, self).__init__(**kwargs)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the surface. """
+        # Skip the sequential algorithm, only call the abstract method
+        super(SurfaceEvaluator, self).evaluate(**kwargs)
+
+        # Algorithm A3.5 (tensor product form)
+        return _evaluate_surface_numpy(**kwargs)
+
+
+class NURBSSurfaceEvaluatorNumPy(NURBSSurfaceEvaluator):
+    """ Vectorized NURBS surface evaluation algorithms (requires NumPy).
+
+    Rational counterpart of :py:class:`.SurfaceEvaluatorNumPy`. The weighted control points are evaluated using
+    the basis matrix products and the resulting homogeneous points are divided by their weights as a single array
+    operation. The remaining methods are inherited from :py:class:`.NURBSSurfaceEvaluator`.
+    """
 
+    def __init__(self, **kwargs):
+        if np is None:
+            raise ImportError("NURBSSurfaceEvaluatorNumPy requires NumPy")
+        super(NURBSSurfaceEvaluatorNumPy, self).__init__(**kwargs)
+
+    def evaluate(self, **kwargs):
+        """ Evaluates the surface. """
+        # Skip the sequential algorithm, only call the abstract method
+        super(SurfaceEvaluator, self).evaluate(**kwargs)
+
+        # Algorithm A4.3 (tensor product form)
+        cptw = _evaluate_surface_numpy(**kwargs)
+
+        # Divide by weight
+        return np.ascontiguousarray(cptw[:, :-1] / cptw[:, -1:])
+
+
+def _evaluate_surface_numpy(**kwargs):
+    """ Evaluates a surface over a range of parameters using NumPy arrays.
+
+    Takes the same keyword arguments as :py:meth:`.SurfaceEvaluator.evaluate`.
+
+    :return: evaluated points
+    :rtype: numpy.ndarray
+    """
+    start_u = kwargs.get('start_u')
+    stop_u = kwargs.get('stop_u')
+    start_v = kwargs.get('start_v')
+    stop_v = kwargs.get('stop_v')
+    sample_size = kwargs.get('sample_size')
+    degree_u = kwargs.get('degree_u')
+    degree_v = kwargs.get('degree_v')
+    knot_vector_u = np.asarray(kwargs.get('knotvector_u'), dtype=np.float64)
+    knot_vector_v = np.asarray(kwargs.get('knotvector_v'), dtype=np.float64)
+    control_points2d = np.asarray(kwargs.get('ctrlpts'), dtype=np.float64)
+    ctrlpts_size_u = kwargs.get('ctrlpts_size_u')
+    ctrlpts_size_v = kwargs.get('ctrlpts_size_v')
+    precision = kwargs.get('precision')
+
+    # Generate the parameters (same rounding as utilities.linspace)
+    knots_u = np.round(np.linspace(start_u, stop_u, sample_size[0]), precision)
+    knots_v = np.round(np.linspace(start_v, stop_v, sample_size[1]), precision)
+
+    # The sampled basis matrices Nu (Su x nu) and Nv (Sv x nv) are banded, i.e. each row contains (degree + 1)
+    # non-zero values starting from the column (span - degree). Spans and basis functions store them compactly.
+    spans_u = _find_spans_numpy(degree_u, knot_vector_u, ctrlpts_size_u, knots_u)
+    basis_u = _basis_functions_numpy(degree_u, knot_vector_u, spans_u, knots_u)
+    spans_v = _find_spans_numpy(degree_v, knot_vector_v, ctrlpts_size_v, knots_v)
+    basis_v = _basis_functions_numpy(degree_v, knot_vector_v, spans_v, knots_v)
+
+    # 1st pass: P * Nv^T
+    ctrlpts_nv = np.zeros((ctrlpts_size_u, len(knots_v), control_points2d.shape[2]), dtype=np.float64)
+    for l in range(0, degree_v + 1):
+        ctrlpts_nv += basis_v[np.newaxis, :, l, np.newaxis] * control_points2d[:, spans_v - degree_v + l, :]
+
+    # 2nd pass: Nu * (P * Nv^T)
+    eval_points = np.zeros((len(knots_u), len(knots_v), control_points2d.shape[2]), dtype=np.float64)
+    for k in range(0, degree_u + 1):
+        eval_points += basis_u[:, k, np.newaxis, np.newaxis] * ctrlpts_nv[spans_u - degree_u + k]
+
+    return np.ascontiguousarray(eval_points.reshape(-1, control_points2d.shape[2]))
+
+
+def _find_spans_sorted(degree, knot_vector, num_ctrlpts, knots, span_func):
+    """ Finds spans of a sorted list of knots over the knot vector.
+
+    The span of the previous knot is reused while the knots stay inside its interval, so that the span finding
+    function is only called when the knots move to another span. The included span finding functions supported by
+    :py:func:`.helpers.find_spans()` use its single sweep implementation instead.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :param num_ctrlpts: number of control points
+    :type num_ctrlpts: int
+    :param knots: list of knots, sorted in ascending order
+    :type knots: list, tuple
+    :param span_func: function to evaluate span finding operation
+    :return: list of spans
+    :rtype: list
+    """
+    if span_func in (helpers.find_span_bisect, helpers.find_span_linear):
+        return helpers.find_spans(degree, knot_vector, num_ctrlpts, knots, span_func)
+
+    spans = []
+    span = -1
+    for knot in knots:
+        if span < 0 or not knot_vector[span] <= knot < knot_vector[span + 1]:
+            span = span_func(degree, knot_vector, num_ctrlpts, knot)
+        spans.append(span)
+    return spans
+
+
+def _refine_knot_vector(degree, knot_vector, ctrlpts_list, knots, span_func):
+    """ Inserts the knots into the knot vector and updates all input control point sequences in a single pass.
+
+    Implementation of Algorithm A5.4 from The NURBS Book by Piegl & Tiller. The knot vector operations and the alphas
+    are shared between the control point sequences, as described in Algorithm A5.5.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :param ctrlpts_list: list of control point sequences defined on the knot vector
+    :type ctrlpts_list: list
+    :param knots: sorted list of knots to be inserted
+    :type knots: list, tuple
+    :param span_func: function to find the knot spans
+    :return: updated knot vector and the list of updated control point sequences
+    :rtype: tuple
+    """
+    num_ctrlpts = len(ctrlpts_list[0])
+    n = num_ctrlpts - 1
+    m = n + degree + 1
+    r = len(knots) - 1
+
+    a = span_func(degree, knot_vector, num_ctrlpts, knots[0])
+    b = span_func(degree, knot_vector, num_ctrlpts, knots[r]) + 1
+
+    # Initialize new knot vector and control point arrays
+    UQ = [0.0 for _ in range(m + r + 2)]
+    Qs = [[[] for _ in range(num_ctrlpts + r + 1)] for _ in ctrlpts_list]
+
+    # Save unaltered control points and knots
+    for P, Q in zip(ctrlpts_list, Qs):
+        for j in range(0, a - degree + 1):
+            Q[j] = P[j]
+        for j in range(b - 1, n + 1):
+            Q[j + r + 1] = P[j]
+    for j in range(0, a + 1):
+        UQ[j] = knot_vector[j]
+    for j in range(b + degree, m + 1):
+        UQ[j + r + 1] = knot_vector[j]
+
+    i = b + degree - 1
+    k = b + degree + r
+    for j in range(r, -1, -1):
+        while knots[j] <= knot_vector[i] and i > a:
+            for P, Q in zip(ctrlpts_list, Qs):
+                Q[k - degree - 1] = P[i - degree - 1]
+            UQ[k] = knot_vector[i]
+            k -= 1
+            i -= 1
+        for Q in Qs:
+            Q[k - degree - 1] = Q[k - degree]
+        for l in range(1, degree + 1):
+            ind = k - degree + l
+            alpha = UQ[k + l] - knots[j]
+            if abs(alpha) == 0.0:
+                for Q in Qs:
+                    Q[ind - 1] = Q[ind]
+            else:
+                alpha = alpha / (UQ[k + l] - knot_vector[i - degree + l])
+                for Q in Qs:
+                    Q[ind - 1] = [alpha * elem1 + (1.0 - alpha) * elem2 for elem1, elem2 in zip(Q[ind - 1], Q[ind])]
+        UQ[k] = knots[j]
+        k -= 1
+
+    return UQ, Qs
+
+
+def _sample_adaptive(curve_point, intervals, tol, max_points):
+    """ Samples the curve adaptively on the input parameter intervals.
+
+    :param curve_point: function evaluating the curve point at the given span and parameter
+    :type curve_point: callable
+    :param intervals: list of (span, start, stop) tuples
+    :type intervals: list
+    :param tol: chordal deviation tolerance
+    :type tol: float
+    :param max_points: maximum number of points, None for no limit
+    :type max_points: int
+    :return: a tuple containing the sampled parameters and the evaluated curve points
+    :rtype: tuple
+    """
+    points = {}
+
+    def sample(span, knot):
+        if knot not in points:
+            points[knot] = curve_point(span, knot)
+        return points[knot]
+
+    def deviation(span, k1, k2):
+        pt1 = sample(span, k1)
+        pt2 = sample(span, k2)
+        km = 0.5 * (k1 + k2)
+        return max(_point_segment_distance(sample(span, knot), pt1, pt2) for knot in
+                   (0.5 * (k1 + km), km, 0.5 * (km + k2)))
+
+    # Subdivide the interval with the largest deviation first
+    knots = set()
+    heap = []
+    for span, k1, k2 in intervals:
+        knots.update((k1, k2))
+        heapq.heappush(heap, (-deviation(span, k1, k2), k1, k2, span))
+    while heap and (max_points is None or len(knots) < max_points):
+        dev, k1, k2, span = heapq.heappop(heap)
+        if -dev <= tol:
+            break
+        km = 0.5 * (k1 + k2)
+        if not k1 < km < k2:
+            continue
+        knots.add(km)
+        heapq.heappush(heap, (-deviation(span, k1, km), k1, km, span))
+        heapq.heappush(heap, (-deviation(span, km, k2), km, k2, span))
+
+    knots = sorted(knots)
+    return knots, [points[knot] for knot in knots]
+
+
+def _point_segment_distance(pt, pt1, pt2):
+    """ Computes the distance between the point and the line segment defined by two points. """
+    seg = [c2 - c1 for c1, c2 in zip(pt1, pt2)]
+    vec = [c - c1 for c, c1 in zip(pt, pt1)]
+    seg_len2 = sum(c ** 2 for c in seg)
+    t = 0.0 if seg_len2 == 0.0 else min(1.0, max(0.0, sum(c1 * c2 for c1, c2 in zip(vec, seg)) / seg_len2))
+    return math.sqrt(sum((c - (t * d)) ** 2 for c, d in zip(vec, seg)))
+
+
+def _rational_curve_derivatives(CKw, deriv_order, dimension):
+    """ Computes the rational curve derivatives from the derivatives of the weighted curve.
+
+    Implementation of Algorithm A4.2 from The NURBS Book by Piegl & Tiller.
+
+    :param CKw: derivatives of A(u) and w(u)
+    :type CKw: list
+    :param deriv_order: derivative order
+    :type deriv_order: int
+    :param dimension: dimension of the weighted control points
+    :type dimension: int
+    :return: C(u) derivatives
+    :rtype: list
+    """
+    CK = [[0.0 for _ in range(dimension - 1)] for _ in range(deriv_order + 1)]
+    for k in range(0, deriv_order + 1):
+        v = [val for val in CKw[k][0:(dimension - 1)]]
+        for i in range(1, k + 1):
+            v[:] = [tmp - (utilities.binomial_coefficient(k, i) * CKw[i][-1] * drv) for tmp, drv in
+                    zip(v, CK[k - i])]
+        CK[k][:] = [tmp / CKw[0][-1] for tmp in v]
+
+    # Return C(u) derivatives
+    return CK
+
+
+def _rational_surface_derivatives(SKLw, deriv_order, dimension):
+    """ Computes the rational surface derivatives from the derivatives of the weighted surface.
+
+    Implementation of Algorithm A4.4 from The NURBS Book by Piegl & Tiller.
+
+    :param SKLw: derivatives of A(u,v) and w(u,v)
+    :type SKLw: list
+    :param deriv_order: derivative order
+    :type deriv_order: int
+    :param dimension: dimension of the weighted control points
+    :type dimension: int
+    :return: S(u,v) derivatives
+    :rtype: list
+    """
+    # Generate an empty list of derivatives
+    SKL = [[[0.0 for _ in range(dimension)] for _ in range(deriv_order + 1)] for _ in range(deriv_order + 1)]
+
+    for k in range(0, deriv_order + 1):
+        for l in range(0, deriv_order - k + 1):
+            # Deep copying might seem a little overkill but we also want to avoid same pointer issues too
+            v = copy.deepcopy(SKLw[k][l])
+
+            for j in range(1, l + 1):
+                v[:] = [tmp - (utilities.binomial_coefficient(l, j) * SKLw[0][j][-1] * drv) for tmp, drv in
+                        zip(v, SKL[k][l - j])]
+            for i in range(1, k + 1):
+                v[:] = [tmp - (utilities.binomial_coefficient(k, i) * SKLw[i][0][-1] * drv) for tmp, drv in
+                        zip(v, SKL[k - i][l])]
+                v2 = [0.0 for _ in range(dimension - 1)]
                 for j in range(1, l + 1):
-                    v[:] = [tmp - (utilities.binomial_coefficient(l, j) * SKLw[0][j][-1] * drv) for tmp, drv in
-                            zip(v, SKL[k][l - j])]
-                for i in range(1, k + 1):
-                    v[:] = [tmp - (utilities.binomial_coefficient(k, i) * SKLw[i][0][-1] * drv) for tmp, drv in
-                            zip(v, SKL[k - i][l])]
-                    v2 = [0.0 for _ in range(dimension - 1)]
-                    for j in range(1, l + 1):
-                        v2[:] = [tmp + (utilities.binomial_coefficient(l, j) * SKLw[i][j][-1] * drv) for tmp, drv in
-                                 zip(v2, SKL[k - i][l - j])]
-                    v[:] = [tmp - (utilities.binomial_coefficient(k, i) * tmp2) for tmp, tmp2 in zip(v, v2)]
-
-                SKL[k][l][:] = [tmp / SKLw[0][0][-1] for tmp in v[0:(dimension - 1)]]
-
-        # Return S(u,v) derivatives
-        return SKL
+                    v2[:] = [tmp + (utilities.binomial_coefficient(l, j) * SKLw[i][j][-1] * drv) for tmp, drv in
+                             zip(v2, SKL[k - i][l - j])]
+                v[:] = [tmp - (utilities.binomial_coefficient(k, i) * tmp2) for tmp, tmp2 in zip(v, v2)]
+
+            SKL[k][l][:] = [tmp / SKLw[0][0][-1] for tmp in v[0:(dimension - 1)]]
+
+    # Return S(u,v) derivatives
+    return SKL
+
+
+def _sample_basis(evaluator, degree, knot_vector, num_ctrlpts, start, stop, sample_size, precision, deriv_order=None):
+    """ Samples the spans and the basis functions over a range of parameters using the evaluator's basis cache.
+
+    The basis function derivatives up to ``deriv_order`` are computed instead of the basis functions, if
+    ``deriv_order`` is set.
+
+    :param evaluator: evaluator instance which owns the cache
+    :type evaluator: Abstract.Evaluator
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :param num_ctrlpts: number of control points
+    :type num_ctrlpts: int
+    :param start: start parameter
+    :type start: float
+    :param stop: stop parameter
+    :type stop: float
+    :param sample_size: number of parameters
+    :type sample_size: int
+    :param precision: number of decimal places to round the parameters
+    :type precision: int
+    :param deriv_order: order of the basis function derivatives
+    :type deriv_order: int
+    :return: knots, spans and basis functions (or their derivatives)
+    :rtype: tuple
+    """
+    key = (degree, tuple(knot_vector), num_ctrlpts, start, stop, sample_size, precision, deriv_order)
+    return evaluator._basis_cache_get(key, _compute_sampled_basis, degree, knot_vector, num_ctrlpts, start, stop,
+                                      sample_size, precision, deriv_order, evaluator._span_func)
+
+
+def _compute_sampled_basis(degree, knot_vector, num_ctrlpts, start, stop, sample_size, precision, deriv_order,
+                           span_func):
+    """ Computes the spans and the basis functions (or their derivatives) over a range of parameters.
+
+    :return: knots, spans and basis functions (or their derivatives)
+    :rtype: tuple
+    """
+    knots = utilities.linspace(start, stop, sample_size, decimals=precision)
+    spans = helpers.find_spans(degree, knot_vector, num_ctrlpts, knots, span_func)
+    if deriv_order is None:
+        basis = helpers.basis_functions(degree, knot_vector, spans, knots)
+    else:
+        basis = helpers.basis_functions_ders(degree, knot_vector, spans, knots, deriv_order)
+    return knots, spans, basis
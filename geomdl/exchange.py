@@ -15,7 +15,7 @@ from . import NURBS
 from . import Multi
 from . import compatibility
 from . import operations
-from . import utilities
+from . import tessellate
 
 
 def import_txt(file_name, two_dimensional=False, **kwargs):
@@ -594,25 +594,21 @@ def _export_obj_single(surface, **kwargs):
             fp.write("# Generated by NURBS-Python\n")
 
             # Tessellate surface
-            surface.tessellate(vertex_spacing=vertex_spacing)
-            vertices = surface.tessellator.vertices
-            triangles = surface.tessellator.triangles
+            vertices, triangles, vertices_uv = surface._tessellate_index_array(vertex_spacing=vertex_spacing)
 
             # Write vertices
             for vert in vertices:
-                line = "v " + str(vert.x) + " " + str(vert.y) + " " + str(vert.z) + "\n"
+                line = "v " + str(vert[0]) + " " + str(vert[1]) + " " + str(vert[2]) + "\n"
                 fp.write(line)
 
             # Write vertex normals
-            for vert in vertices:
-                sn = operations.normal(surface, vert.uv)
+            for sn in operations.normal(surface, vertices_uv):
                 line = "vn " + str(sn[1][0]) + " " + str(sn[1][1]) + " " + str(sn[1][2]) + "\n"
                 fp.write(line)
 
             # Write faces
-            for t in triangles:
-                vl = t.vertex_ids
-                line = "f " + str(vl[0]) + " " + str(vl[1]) + " " + str(vl[2]) + "\n"
+            for vl in triangles:
+                line = "f " + str(vl[0] + 1) + " " + str(vl[1] + 1) + " " + str(vl[2] + 1) + "\n"
                 fp.write(line)
     except IOError as e:
         print("An error occurred: {}".format(e.args[-1]))
@@ -666,28 +662,24 @@ def _export_obj_multi(surface_list, **kwargs):
                     surface.sample_size_v = surface_list.sample_size_v
 
                 # Tessellate surface
-                surface.tessellate(vertex_spacing=vertex_spacing)
-                vertices = surface.tessellator.vertices
-                triangles = surface.tessellator.triangles
+                vertices, triangles, vertices_uv = surface._tessellate_index_array(vertex_spacing=vertex_spacing)
 
                 # Collect vertices
                 for vert in vertices:
-                    line = "v " + str(vert.x) + " " + str(vert.y) + " " + str(vert.z) + "\n"
+                    line = "v " + str(vert[0]) + " " + str(vert[1]) + " " + str(vert[2]) + "\n"
                     str_v.append(line)
 
                 # Collect vertex normals
-                for vert in vertices:
-                    sn = operations.normal(surface, vert.uv)
+                for sn in operations.normal(surface, vertices_uv):
                     line = "vn " + str(sn[1][0]) + " " + str(sn[1][1]) + " " + str(sn[1][2]) + "\n"
                     str_vn.append(line)
 
                 # Collect faces
-                for t in triangles:
-                    vl = t.vertex_ids
+                for vl in triangles:
                     line = "f " + \
-                           str(vl[0] + vertex_offset) + " " + \
-                           str(vl[1] + vertex_offset) + " " + \
-                           str(vl[2] + vertex_offset) + "\n"
+                           str(vl[0] + 1 + vertex_offset) + " " + \
+                           str(vl[1] + 1 + vertex_offset) + " " + \
+                           str(vl[2] + 1 + vertex_offset) + "\n"
                     str_f.append(line)
 
                 # Update vertex offset
@@ -731,22 +723,9 @@ def _export_stl_ascii_single(surface, **kwargs):
     # Create the file and start saving triangulated surface points
     try:
         with open(file_name, 'w') as fp:
-            # Tessellate surface
-            surface.tessellate(vertex_spacing=vertex_spacing)
-            vertices = surface.tessellator.vertices
-            triangles = surface.tessellator.triangles
-
             fp.write("solid Surface\n")
-            for t in triangles:
-                nvec = utilities.triangle_normal(t)
-                line = "\tfacet normal " + str(nvec[0]) + " " + str(nvec[1]) + " " + str(nvec[2]) + "\n"
-                fp.write(line)
-                fp.write("\t\touter loop\n")
-                for v in t.vertices:
-                    line = "\t\t\tvertex " + str(v.x) + " " + str(v.y) + " " + str(v.z) + "\n"
-                    fp.write(line)
-                fp.write("\t\tendloop\n")
-                fp.write("\tendfacet\n")
+            for t in _stl_triangles(surface, vertex_spacing):
+                _write_stl_ascii_facet(fp, t)
             fp.write("endsolid Surface\n")
     except IOError as e:
         print("An error occurred: {}".format(e.args[-1]))
@@ -793,20 +772,8 @@ def _export_stl_ascii_multi(surface_list, **kwargs):
                 if surface_list.sample_size_v != 0:
                     surface.sample_size_v = surface_list.sample_size_v
 
-                # Tessellate surface
-                surface.tessellate(vertex_spacing=vertex_spacing)
-                triangles = surface.tessellator.triangles
-
-                for t in triangles:
-                    nvec = utilities.triangle_normal(t)
-                    line = "\tfacet normal " + str(nvec[0]) + " " + str(nvec[1]) + " " + str(nvec[2]) + "\n"
-                    fp.write(line)
-                    fp.write("\t\touter loop\n")
-                    for v in t.vertices:
-                        line = "\t\t\tvertex " + str(v.x) + " " + str(v.y) + " " + str(v.z) + "\n"
-                        fp.write(line)
-                    fp.write("\t\tendloop\n")
-                    fp.write("\tendfacet\n")
+                for t in _stl_triangles(surface, vertex_spacing):
+                    _write_stl_ascii_facet(fp, t)
 
             fp.write("endsolid Surface\n")
     except IOError as e:
@@ -841,19 +808,7 @@ def _export_stl_binary_single(surface, **kwargs):
 
     # Create the file and start saving triangulated surface points
     try:
-        with open(file_name, 'wb') as fp:
-            # Tessellate surface
-            surface.tessellate(vertex_spacing=vertex_spacing)
-            triangles = surface.tessellator.triangles
-
-            # Write triangle list to the binary STL file
-            fp.write(b'\0' * 80)  # header
-            fp.write(struct.pack('<i', len(triangles)))  # number of triangles
-            for t in triangles:
-                fp.write(struct.pack('<3f', *utilities.triangle_normal(t)))  # normal
-                for v in t.vertices:
-                    fp.write(struct.pack('<3f', *v.data))  # vertices
-                fp.write(b'\0\0')  # attribute byte count
+        _write_stl_binary(file_name, [surface], vertex_spacing)
     except IOError as e:
         print("An error occurred: {}".format(e.args[-1]))
         raise e
@@ -864,6 +819,9 @@ def _export_stl_binary_single(surface, **kwargs):
 def _export_stl_binary_multi(surface_list, **kwargs):
     """ Saves multiple surfaces as a binary .stl file.
 
+    The surfaces are triangulated and written one by one, i.e. the triangles of all surfaces are not stored in the
+    memory at the same time.
+
     :param surface_list: list of surfaces to be saved
     :type surface_list: Multi.MultiSurface
 
@@ -882,36 +840,24 @@ def _export_stl_binary_multi(surface_list, **kwargs):
     if vertex_spacing < 1 or not isinstance(vertex_spacing, int):
         raise ValueError("Vertex spacing must be an integer value and it must be bigger than zero")
 
-    # Create the file and start saving triangulated surface points
-    try:
-        with open(file_name, 'wb') as fp:
-            # Loop through MultiSurface object
-            triangles_list = []
-            for surface in surface_list:
-                if not isinstance(surface, Abstract.Surface):
-                    warnings.warn("Encountered a non-surface object")
-                    continue
+    def surfaces():
+        # Loop through MultiSurface object
+        for surface in surface_list:
+            if not isinstance(surface, Abstract.Surface):
+                warnings.warn("Encountered a non-surface object")
+                continue
 
-                # Set surface evaluation delta
-                if surface_list.sample_size_u != 0:
-                    surface.sample_size_u = surface_list.sample_size_u
-                if surface_list.sample_size_v != 0:
-                    surface.sample_size_v = surface_list.sample_size_v
+            # Set surface evaluation delta
+            if surface_list.sample_size_u != 0:
+                surface.sample_size_u = surface_list.sample_size_u
+            if surface_list.sample_size_v != 0:
+                surface.sample_size_v = surface_list.sample_size_v
 
-                # Tessellate surface
-                surface.tessellate(vertex_spacing=vertex_spacing)
-                triangles = surface.tessellator.triangles
-
-                triangles_list += triangles
-
-            # Write triangle list to the binary STL file
-            fp.write(b'\0' * 80)  # header
-            fp.write(struct.pack('<i', len(triangles_list)))  # number of triangles
-            for t in triangles_list:
-                fp.write(struct.pack('<3f', *utilities.triangle_normal(t)))  # normal
-                for v in t.vertices:
-                    fp.write(struct.pack('<3f', *v.data))  # vertices
-                fp.write(b'\0\0')  # attribute byte count
+            yield surface
+
+    # Create the file and start saving triangulated surface points
+    try:
+        _write_stl_binary(file_name, surfaces(), vertex_spacing)
     except IOError as e:
         print("An error occurred: {}".format(e.args[-1]))
         raise e
@@ -919,6 +865,111 @@ def _export_stl_binary_multi(surface_list, **kwargs):
         raise
 
 
+# Binary STL triangle record: normal, 3 vertices and the attribute byte count
+_STL_BINARY_RECORD = struct.Struct('<12fH')
+
+
+def _write_stl_binary(file_name, surfaces, vertex_spacing, chunk_size=4096):
+    """ Writes the triangles of the surfaces to a binary .stl file.
+
+    The triangle records are packed into a preallocated buffer which is written to the file when it is full. The
+    number of triangles in the file header is updated after all triangles are written.
+
+    :param file_name: name of the output file
+    :type file_name: str
+    :param surfaces: surfaces to be saved
+    :type surfaces: list, generator
+    :param vertex_spacing: size of the triangle edge in terms of points sampled on the surface
+    :type vertex_spacing: int
+    :param chunk_size: number of triangle records in the buffer
+    :type chunk_size: int
+    """
+    record_size = _STL_BINARY_RECORD.size
+    buffer = bytearray(record_size * chunk_size)
+    offset = 0
+    num_triangles = 0
+
+    with open(file_name, 'wb') as fp:
+        fp.write(b'\0' * 80)  # header
+        fp.write(struct.pack('<i', 0))  # number of triangles, updated after writing the triangles
+        for surface in surfaces:
+            for tri in _stl_triangles(surface, vertex_spacing):
+                _STL_BINARY_RECORD.pack_into(buffer, offset, *tri)
+                offset += record_size
+                num_triangles += 1
+                if offset == len(buffer):
+                    fp.write(buffer)
+                    offset = 0
+        fp.write(buffer[:offset])
+
+        # Update the number of triangles
+        fp.seek(80)
+        fp.write(struct.pack('<i', num_triangles))
+
+
+def _stl_triangles(surface, vertex_spacing):
+    """ Generates the STL triangle records of the surface.
+
+    The triangles are generated directly from the evaluated surface points without creating the vertex and triangle
+    objects, unless the surface is trimmed or it uses a custom tessellation component. In that case, the triangles are
+    generated from the index arrays of the tessellated surface.
+
+    :param surface: surface
+    :type surface: Abstract.Surface
+    :param vertex_spacing: size of the triangle edge in terms of points sampled on the surface
+    :type vertex_spacing: int
+    :return: generator of (normal, vertex 1, vertex 2, vertex 3, attribute byte count) tuples in flattened form
+    """
+    if surface.trims or type(surface.tessellator) is not tessellate.TriangularTessellate:
+        # Use the tessellation component
+        points, triangles, _ = surface._tessellate_index_array(vertex_spacing=vertex_spacing)
+        for tri in triangles:
+            yield _stl_triangle(points[tri[0]], points[tri[1]], points[tri[2]])
+        return
+
+    # Organization of the points in a quad on the parametric space is the same as utilities.make_triangle_mesh
+    points = surface.evalpts
+    size_u = surface.sample_size_u
+    size_v = surface.sample_size_v
+    row_prev = None
+    for i in range(0, size_u, vertex_spacing):
+        row = [points[j + (i * size_v)] for j in range(0, size_v, vertex_spacing)]
+        if row_prev is not None:
+            for j in range(len(row) - 1):
+                yield _stl_triangle(row_prev[j], row_prev[j + 1], row[j + 1])
+                yield _stl_triangle(row_prev[j], row[j + 1], row[j])
+        row_prev = row
+
+
+def _write_stl_ascii_facet(fp, tri):
+    """ Writes a flattened STL triangle record to the file as an ASCII facet.
+
+    :param fp: file object
+    :param tri: (normal, vertex 1, vertex 2, vertex 3, attribute byte count) tuple in flattened form
+    :type tri: tuple
+    """
+    fp.write("\tfacet normal " + str(tri[0]) + " " + str(tri[1]) + " " + str(tri[2]) + "\n")
+    fp.write("\t\touter loop\n")
+    for idx in range(3, 12, 3):
+        fp.write("\t\t\tvertex " + str(tri[idx]) + " " + str(tri[idx + 1]) + " " + str(tri[idx + 2]) + "\n")
+    fp.write("\t\tendloop\n")
+    fp.write("\tendfacet\n")
+
+
+def _stl_triangle(pt1, pt2, pt3):
+    """ Generates a flattened STL triangle record from the input triangle vertices.
+
+    The normal vector is computed in the same way as :py:func:`.utilities.triangle_normal()`.
+
+    :return: (normal, vertex 1, vertex 2, vertex 3, attribute byte count) tuple in flattened form
+    :rtype: tuple
+    """
+    x1, y1, z1 = pt2[0] - pt1[0], pt2[1] - pt1[1], pt2[2] - pt1[2]
+    x2, y2, z2 = pt3[0] - pt2[0], pt3[1] - pt2[1], pt3[2] - pt2[2]
+    return (y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2,
+            pt1[0], pt1[1], pt1[2], pt2[0], pt2[1], pt2[2], pt3[0], pt3[1], pt3[2], 0)
+
+
 def _export_off_single(surface, **kwargs):
     """ Saves a single surface as a .off file.
 
@@ -946,21 +997,18 @@ def _export_off_single(surface, **kwargs):
             fp.write("OFF\n")
 
             # Tessellate surface
-            surface.tessellate(vertex_spacing=vertex_spacing)
-            vertices = surface.tessellator.vertices
-            triangles = surface.tessellator.triangles
+            vertices, triangles, _ = surface._tessellate_index_array(vertex_spacing=vertex_spacing)
 
-            line = str(len(vertices) * len(vertices[0])) + " " + str(len(triangles)) + " 0\n"
+            line = str(len(vertices)) + " " + str(len(triangles)) + " 0\n"
             fp.write(line)
 
             # Write vertices
             for vert in vertices:
-                line = str(vert.x) + " " + str(vert.y) + " " + str(vert.z) + "\n"
+                line = str(vert[0]) + " " + str(vert[1]) + " " + str(vert[2]) + "\n"
                 fp.write(line)
 
             # Write faces (zero-indexed)
-            for t in triangles:
-                vl = t.vertex_ids_zero
+            for vl in triangles:
                 line = "3 " + str(vl[0]) + " " + str(vl[1]) + " " + str(vl[2]) + "\n"
                 fp.write(line)
     except IOError as e:
@@ -1013,22 +1061,19 @@ def _export_off_multi(surface_list, **kwargs):
                     surface.sample_size_v = surface_list.sample_size_v
 
                 # Tessellate surface
-                surface.tessellate(vertex_spacing=vertex_spacing)
-                vertices = surface.tessellator.vertices
-                triangles = surface.tessellator.triangles
+                vertices, triangles, _ = surface._tessellate_index_array(vertex_spacing=vertex_spacing)
 
                 # Collect vertices
                 for vert in vertices:
-                    line = str(vert.x) + " " + str(vert.y) + " " + str(vert.z) + "\n"
+                    line = str(vert[0]) + " " + str(vert[1]) + " " + str(vert[2]) + "\n"
                     str_v.append(line)
 
                 # Collect faces (zero-indexed)
-                for t in triangles:
-                    vl = t.vertex_ids
+                for vl in triangles:
                     line = "3 " + \
-                           str(vl[0] - 1 + vertex_offset) + " " + \
-                           str(vl[1] - 1 + vertex_offset) + " " + \
-                           str(vl[2] - 1 + vertex_offset) + "\n"
+                           str(vl[0] + vertex_offset) + " " + \
+                           str(vl[1] + vertex_offset) + " " + \
+                           str(vl[2] + vertex_offset) + "\n"
                     str_f.append(line)
 
                 # Update vertex offset
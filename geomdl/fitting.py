@@ -0,0 +1,621 @@
+"""
+.. module:: fitting
+    :platform: Unix, Windows
+    :synopsis: Provides curve and surface fitting functions
+
+.. moduleauthor:: Onur Rauf Bingol <orbingol@gmail.com>
+
+"""
+
+from itertools import islice, repeat
+from . import BSpline
+from . import helpers
+from . import utilities
+
+
+def interpolate_curve(points, degree, **kwargs):
+    """ Applies global curve interpolation to the input points.
+
+    Implementation of Algorithm A9.1 from The NURBS Book by Piegl & Tiller. The parameters are computed using the chord
+    length or the centripetal method and the knot vector is computed by averaging the parameters.
+
+    Each row of the collocation matrix contains at most (degree + 1) non-zero basis functions around the diagonal.
+    Therefore, the linear system is solved with a banded LU decomposition in O(n * degree^2) time instead of a dense
+    solver.
+
+    Keyword Arguments:
+
+        * ``centripetal``: uses the centripetal parametrization method, if True. *Default: False*
+
+    :param points: data points
+    :type points: list, tuple
+    :param degree: degree of the curve
+    :type degree: int
+    :return: interpolated B-Spline curve
+    :rtype: BSpline.Curve
+    """
+    centripetal = kwargs.get('centripetal', False)
+
+    # Check inputs
+    num_points = len(points)
+    if degree < 1:
+        raise ValueError("Degree must be greater than zero")
+    if num_points <= degree:
+        raise ValueError("The number of points must be greater than the degree")
+
+    curve = BSpline.Curve()
+    curve.degree = degree
+
+    # Compute the parameters and the knot vector; the curve stores the knots rounded to its precision
+    uk = compute_params_curve(points, centripetal=centripetal)
+    kv = utilities.normalize_knot_vector(compute_knot_vector(degree, num_points, uk), decimals=curve._precision)
+
+    # Solve the linear system
+    lu = _collocation_lu(degree, kv, uk)
+    curve.ctrlpts = _banded_solve(lu, degree, points)
+    curve.knotvector = kv
+
+    return curve
+
+
+def interpolate_surface(points, size_u, size_v, degree_u, degree_v, **kwargs):
+    """ Applies global surface interpolation to the input points.
+
+    Implementation of Algorithm A9.4 from The NURBS Book by Piegl & Tiller. The surface interpolation is applied as
+    a sequence of curve interpolations on the u- and v-directions, i.e. the collocation matrix of each direction is
+    factorized once using the banded LU decomposition and the data points are solved column by column.
+
+    The input points should be in [u][v] order, i.e. the v index varies first, as in the ``ctrlpts`` property of the
+    surfaces.
+
+    Keyword Arguments:
+
+        * ``centripetal``: uses the centripetal parametrization method, if True. *Default: False*
+
+    :param points: data points
+    :type points: list, tuple
+    :param size_u: number of data points on the u-direction
+    :type size_u: int
+    :param size_v: number of data points on the v-direction
+    :type size_v: int
+    :param degree_u: degree of the surface on the u-direction
+    :type degree_u: int
+    :param degree_v: degree of the surface on the v-direction
+    :type degree_v: int
+    :return: interpolated B-Spline surface
+    :rtype: BSpline.Surface
+    """
+    centripetal = kwargs.get('centripetal', False)
+
+    # Check inputs
+    if size_u * size_v != len(points):
+        raise ValueError("The number of points must be equal to size_u * size_v")
+    if degree_u < 1 or degree_v < 1:
+        raise ValueError("Degrees must be greater than zero")
+    if size_u <= degree_u or size_v <= degree_v:
+        raise ValueError("The number of points on each direction must be greater than the degree")
+
+    surf = BSpline.Surface()
+    surf.degree_u = degree_u
+    surf.degree_v = degree_v
+
+    # Compute the parameters and the knot vectors; the surface stores the knots rounded to its precision
+    uk, vl = compute_params_surface(points, size_u, size_v, centripetal=centripetal)
+    kv_u = utilities.normalize_knot_vector(compute_knot_vector(degree_u, size_u, uk), decimals=surf._precision)
+    kv_v = utilities.normalize_knot_vector(compute_knot_vector(degree_v, size_v, vl), decimals=surf._precision)
+
+    # Interpolate on the u-direction, i.e. the coordinates of each u-row contain all v-columns
+    dimension = len(points[0])
+    rows = [[c for v in range(size_v) for c in points[v + (size_v * u)]] for u in range(size_u)]
+    rows = _banded_solve(_collocation_lu(degree_u, kv_u, uk), degree_u, rows)
+
+    # Interpolate on the v-direction, i.e. the coordinates of each v-column contain all u-rows
+    cols = [[c for u in range(size_u) for c in rows[u][(v * dimension):((v + 1) * dimension)]] for v in range(size_v)]
+    cols = _banded_solve(_collocation_lu(degree_v, kv_v, vl), degree_v, cols)
+
+    # Set the surface data
+    surf.set_ctrlpts([cols[v][(u * dimension):((u + 1) * dimension)] for u in range(size_u) for v in range(size_v)],
+                     size_u, size_v)
+    surf.knotvector_u = kv_u
+    surf.knotvector_v = kv_v
+
+    return surf
+
+
+def approximate_curve(points, degree, ctrlpts_size, **kwargs):
+    """ Applies global least squares curve approximation to the input points.
+
+    Implementation of Algorithm A9.6 from The NURBS Book by Piegl & Tiller. The data points are consumed in chunks and
+    each chunk is added to the normal equations, (N^T W N) P = N^T W Q, using the non-vanishing basis functions of the
+    data points. The matrix N^T W N is stored as a band of (2 * degree + 1) columns, therefore the memory usage depends
+    on the number of control points instead of the number of data points and the input can be any iterable, e.g. a
+    generator reading the points from a file.
+
+    The parameters of the data points are computed using the chord length or the centripetal method, if they are not
+    provided. In that case, the input points should be a sequence. If the parameters are provided as an iterable, the
+    knot vector should also be provided or a uniform knot vector is used.
+
+    Keyword Arguments:
+
+        * ``params``: parameters of the data points. *Default: computed from the data points*
+        * ``centripetal``: uses the centripetal parametrization method, if True. *Default: False*
+        * ``knotvector``: knot vector of the curve. *Default: computed from the parameters*
+        * ``weights``: weights of the data points in the least squares sum. *Default: 1.0 for all points*
+        * ``fixed_ends``: curve passes through the first and the last data points, if True. *Default: True*
+        * ``chunk_size``: number of data points added to the normal equations at once. *Default: 1024*
+
+    :param points: data points
+    :type points: list, tuple or any iterable
+    :param degree: degree of the curve
+    :type degree: int
+    :param ctrlpts_size: number of control points
+    :type ctrlpts_size: int
+    :return: approximated B-Spline curve
+    :rtype: BSpline.Curve
+    """
+    params = kwargs.get('params', None)
+    centripetal = kwargs.get('centripetal', False)
+    knotvector = kwargs.get('knotvector', None)
+    weights = kwargs.get('weights', None)
+    fixed_ends = kwargs.get('fixed_ends', True)
+    chunk_size = kwargs.get('chunk_size', 1024)
+
+    # Check inputs
+    if degree < 1:
+        raise ValueError("Degree must be greater than zero")
+    if ctrlpts_size <= degree:
+        raise ValueError("The number of control points must be greater than the degree")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be greater than zero")
+
+    curve = BSpline.Curve()
+    curve.degree = degree
+
+    # Compute the parameters and the knot vector; the curve stores the knots rounded to its precision
+    if params is None:
+        if not isinstance(points, (list, tuple)):
+            raise TypeError("The parameters must be provided for the data points which are not in a sequence")
+        params = compute_params_curve(points, centripetal=centripetal)
+    if knotvector is None:
+        if isinstance(params, (list, tuple)):
+            knotvector = compute_knot_vector_approx(degree, ctrlpts_size, params)
+        else:
+            knotvector = utilities.generate_knot_vector(degree, ctrlpts_size)
+    kv = utilities.normalize_knot_vector(knotvector, decimals=curve._precision)
+    if len(kv) != degree + ctrlpts_size + 1:
+        raise ValueError("The knot vector must have (degree + ctrlpts_size + 1) knots")
+    if weights is None:
+        weights = repeat(1.0)
+
+    # Accumulate the normal equations
+    band = [[0.0 for _ in range((2 * degree) + 1)] for _ in range(ctrlpts_size)]
+    rhs = None
+    num_points = 0
+    first_pt = last_pt = None
+    for pts, uk, wk in _chunks(chunk_size, points, params, weights):
+        if rhs is None:
+            rhs = [[0.0 for _ in range(len(pts[0]))] for _ in range(ctrlpts_size)]
+            first_pt = pts[0]
+        spans = helpers.find_spans(degree, kv, ctrlpts_size, uk)
+        basis = helpers.basis_functions(degree, kv, spans, uk)
+        for pt, wgt, span, bfuncs in zip(pts, wk, spans, basis):
+            _normal_equations_add(band, rhs, degree, pt, wgt, range(span - degree, span + 1), bfuncs)
+        num_points += len(pts)
+        last_pt = pts[-1]
+    if num_points < ctrlpts_size:
+        raise ValueError("The number of points must be greater than or equal to the number of control points")
+
+    if fixed_ends:
+        # Move the fixed end control points to the right hand side and solve for the interior control points
+        last = ctrlpts_size - 1
+        interior = [list(band[i]) for i in range(1, last)]
+        interior_rhs = []
+        for i in range(1, last):
+            coeff_first = band[i][degree - i] if i <= degree else 0.0
+            coeff_last = band[i][last - i + degree] if last - i <= degree else 0.0
+            interior_rhs.append([r - (coeff_first * p0) - (coeff_last * pn)
+                                 for r, p0, pn in zip(rhs[i], first_pt, last_pt)])
+        ctrlpts = [list(first_pt)]
+        if interior:
+            ctrlpts += _banded_solve(_banded_lu(interior, degree), degree, interior_rhs)
+        ctrlpts.append(list(last_pt))
+    else:
+        ctrlpts = _banded_solve(_banded_lu(band, degree), degree, rhs)
+
+    # Set the curve data
+    curve.ctrlpts = ctrlpts
+    curve.knotvector = kv
+
+    return curve
+
+
+def approximate_surface(points, degree_u, degree_v, ctrlpts_size_u, ctrlpts_size_v, **kwargs):
+    """ Applies global least squares surface approximation to the input points.
+
+    The data points are consumed in chunks and each chunk is added to the normal equations of the tensor product
+    basis functions. The control point (i, j) is stored in the row (i * ctrlpts_size_v + j), therefore the matrix of
+    the normal equations is a band of (2 * (degree_u * ctrlpts_size_v + degree_v) + 1) columns and the memory usage
+    depends on the size of the control points grid instead of the number of data points.
+
+    The parameters of the scattered data points should be provided as (u, v) pairs. If the data points are on a grid
+    in [u][v] order, ``size_u`` and ``size_v`` can be provided instead and the parameters are computed as in the
+    surface interpolation.
+
+    Keyword Arguments:
+
+        * ``params``: (u, v) parameters of the data points. *Default: computed from the grid of data points*
+        * ``size_u``: number of data points on the u-direction of the grid. *Default: None*
+        * ``size_v``: number of data points on the v-direction of the grid. *Default: None*
+        * ``centripetal``: uses the centripetal parametrization method, if True. *Default: False*
+        * ``knotvector_u``: knot vector on the u-direction. *Default: computed from the parameters*
+        * ``knotvector_v``: knot vector on the v-direction. *Default: computed from the parameters*
+        * ``weights``: weights of the data points in the least squares sum. *Default: 1.0 for all points*
+        * ``chunk_size``: number of data points added to the normal equations at once. *Default: 1024*
+
+    :param points: data points
+    :type points: list, tuple or any iterable
+    :param degree_u: degree of the surface on the u-direction
+    :type degree_u: int
+    :param degree_v: degree of the surface on the v-direction
+    :type degree_v: int
+    :param ctrlpts_size_u: number of control points on the u-direction
+    :type ctrlpts_size_u: int
+    :param ctrlpts_size_v: number of control points on the v-direction
+    :type ctrlpts_size_v: int
+    :return: approximated B-Spline surface
+    :rtype: BSpline.Surface
+    """
+    params = kwargs.get('params', None)
+    size_u = kwargs.get('size_u', None)
+    size_v = kwargs.get('size_v', None)
+    centripetal = kwargs.get('centripetal', False)
+    knotvector_u = kwargs.get('knotvector_u', None)
+    knotvector_v = kwargs.get('knotvector_v', None)
+    weights = kwargs.get('weights', None)
+    chunk_size = kwargs.get('chunk_size', 1024)
+
+    # Check inputs
+    if degree_u < 1 or degree_v < 1:
+        raise ValueError("Degrees must be greater than zero")
+    if ctrlpts_size_u <= degree_u or ctrlpts_size_v <= degree_v:
+        raise ValueError("The number of control points on each direction must be greater than the degree")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be greater than zero")
+
+    surf = BSpline.Surface()
+    surf.degree_u = degree_u
+    surf.degree_v = degree_v
+
+    # Compute the parameters and the knot vectors; the surface stores the knots rounded to its precision
+    if params is None:
+        if size_u is None or size_v is None:
+            raise ValueError("The parameters or the grid size of the data points must be provided")
+        if size_u * size_v != len(points):
+            raise ValueError("The number of points must be equal to size_u * size_v")
+        uk, vl = compute_params_surface(points, size_u, size_v, centripetal=centripetal)
+        if knotvector_u is None:
+            knotvector_u = compute_knot_vector_approx(degree_u, ctrlpts_size_u, uk)
+        if knotvector_v is None:
+            knotvector_v = compute_knot_vector_approx(degree_v, ctrlpts_size_v, vl)
+        params = ((u, v) for u in uk for v in vl)
+    if knotvector_u is None:
+        knotvector_u = utilities.generate_knot_vector(degree_u, ctrlpts_size_u)
+    if knotvector_v is None:
+        knotvector_v = utilities.generate_knot_vector(degree_v, ctrlpts_size_v)
+    kv_u = utilities.normalize_knot_vector(knotvector_u, decimals=surf._precision)
+    kv_v = utilities.normalize_knot_vector(knotvector_v, decimals=surf._precision)
+    if len(kv_u) != degree_u + ctrlpts_size_u + 1 or len(kv_v) != degree_v + ctrlpts_size_v + 1:
+        raise ValueError("The knot vectors must have (degree + ctrlpts_size + 1) knots on each direction")
+    if weights is None:
+        weights = repeat(1.0)
+
+    # Accumulate the normal equations
+    width = (degree_u * ctrlpts_size_v) + degree_v
+    band = [[0.0 for _ in range((2 * width) + 1)] for _ in range(ctrlpts_size_u * ctrlpts_size_v)]
+    rhs = None
+    num_points = 0
+    for pts, uvk, wk in _chunks(chunk_size, points, params, weights):
+        if rhs is None:
+            rhs = [[0.0 for _ in range(len(pts[0]))] for _ in range(ctrlpts_size_u * ctrlpts_size_v)]
+        uk = [uv[0] for uv in uvk]
+        vl = [uv[1] for uv in uvk]
+        spans_u = helpers.find_spans(degree_u, kv_u, ctrlpts_size_u, uk)
+        spans_v = helpers.find_spans(degree_v, kv_v, ctrlpts_size_v, vl)
+        basis_u = helpers.basis_functions(degree_u, kv_u, spans_u, uk)
+        basis_v = helpers.basis_functions(degree_v, kv_v, spans_v, vl)
+        for pt, wgt, span_u, span_v, bfuncs_u, bfuncs_v in zip(pts, wk, spans_u, spans_v, basis_u, basis_v):
+            indices = [(i * ctrlpts_size_v) + j for i in range(span_u - degree_u, span_u + 1)
+                       for j in range(span_v - degree_v, span_v + 1)]
+            bfuncs = [bu * bv for bu in bfuncs_u for bv in bfuncs_v]
+            _normal_equations_add(band, rhs, width, pt, wgt, indices, bfuncs)
+        num_points += len(pts)
+    if num_points < ctrlpts_size_u * ctrlpts_size_v:
+        raise ValueError("The number of points must be greater than or equal to the number of control points")
+
+    # Set the surface data
+    surf.set_ctrlpts(_banded_solve(_banded_lu(band, width), width, rhs), ctrlpts_size_u, ctrlpts_size_v)
+    surf.knotvector_u = kv_u
+    surf.knotvector_v = kv_v
+
+    return surf
+
+
+def compute_params_curve(points, **kwargs):
+    """ Computes the parameters of the data points on a curve.
+
+    Please refer to Equations 9.4 and 9.5 for the chord length parametrization and Equation 9.6 for the centripetal
+    method from The NURBS Book by Piegl & Tiller.
+
+    Keyword Arguments:
+
+        * ``centripetal``: uses the centripetal parametrization method, if True. *Default: False*
+
+    :param points: data points
+    :type points: list, tuple
+    :return: parameters on [0, 1]
+    :rtype: list
+    """
+    centripetal = kwargs.get('centripetal', False)
+
+    # Compute the chord lengths
+    lengths = [utilities.point_distance(pt1, pt2) for pt1, pt2 in zip(points[:-1], points[1:])]
+    if centripetal:
+        lengths = [length ** 0.5 for length in lengths]
+    total = sum(lengths)
+    if total == 0.0:
+        raise ValueError("Cannot compute the parameters of the coincident points")
+
+    # Compute the parameters
+    uk = [0.0 for _ in range(len(points))]
+    for idx, length in enumerate(lengths[:-1]):
+        uk[idx + 1] = uk[idx] + (length / total)
+    uk[-1] = 1.0
+
+    return uk
+
+
+def compute_params_surface(points, size_u, size_v, **kwargs):
+    """ Computes the parameters of the data points on a surface.
+
+    Implementation of Algorithm A9.3 from The NURBS Book by Piegl & Tiller. The parameters on each direction are the
+    averages of the parameters of the data point rows, excluding the rows of coincident points.
+
+    Keyword Arguments:
+
+        * ``centripetal``: uses the centripetal parametrization method, if True. *Default: False*
+
+    :param points: data points in [u][v] order
+    :type points: list, tuple
+    :param size_u: number of data points on the u-direction
+    :type size_u: int
+    :param size_v: number of data points on the v-direction
+    :type size_v: int
+    :return: parameters on the u- and v-directions
+    :rtype: tuple
+    """
+    centripetal = kwargs.get('centripetal', False)
+
+    lines_u = [[points[v + (size_v * u)] for u in range(size_u)] for v in range(size_v)]
+    lines_v = [[points[v + (size_v * u)] for v in range(size_v)] for u in range(size_u)]
+    return _average_params(lines_u, centripetal), _average_params(lines_v, centripetal)
+
+
+def compute_knot_vector(degree, num_points, params):
+    """ Computes the knot vector by averaging the parameters.
+
+    Please refer to Equation 9.8 from The NURBS Book by Piegl & Tiller.
+
+    :param degree: degree
+    :type degree: int
+    :param num_points: number of data points
+    :type num_points: int
+    :param params: parameters of the data points
+    :type params: list, tuple
+    :return: knot vector
+    :rtype: list
+    """
+    kv = [0.0 for _ in range(degree + 1)]
+    for j in range(1, num_points - degree):
+        kv.append(sum(params[j:j + degree]) / degree)
+    kv += [1.0 for _ in range(degree + 1)]
+    return kv
+
+
+def compute_knot_vector_approx(degree, num_ctrlpts, params):
+    """ Computes the knot vector for the least squares approximation.
+
+    Please refer to Equations 9.68 and 9.69 from The NURBS Book by Piegl & Tiller. The internal knots are placed such
+    that every knot span contains at least one parameter.
+
+    :param degree: degree
+    :type degree: int
+    :param num_ctrlpts: number of control points
+    :type num_ctrlpts: int
+    :param params: parameters of the data points
+    :type params: list, tuple
+    :return: knot vector
+    :rtype: list
+    """
+    num_points = len(params)
+    if num_points < num_ctrlpts:
+        raise ValueError("The number of points must be greater than or equal to the number of control points")
+    d = float(num_points) / float(num_ctrlpts - degree)
+    kv = [0.0 for _ in range(degree + 1)]
+    for j in range(1, num_ctrlpts - degree):
+        i = int(j * d)
+        alpha = (j * d) - i
+        kv.append(((1.0 - alpha) * params[i - 1]) + (alpha * params[i]))
+    kv += [1.0 for _ in range(degree + 1)]
+    return kv
+
+
+def _average_params(lines, centripetal):
+    """ Averages the parameters of the lines of data points.
+
+    :param lines: lines of data points
+    :type lines: list
+    :param centripetal: uses the centripetal parametrization method, if True
+    :type centripetal: bool
+    :return: averaged parameters
+    :rtype: list
+    """
+    params = [0.0 for _ in range(len(lines[0]))]
+    num_lines = 0
+    for line in lines:
+        try:
+            line_params = compute_params_curve(line, centripetal=centripetal)
+        except ValueError:
+            # Skip the degenerate line
+            continue
+        params = [p1 + p2 for p1, p2 in zip(params, line_params)]
+        num_lines += 1
+    if num_lines == 0:
+        raise ValueError("Cannot compute the parameters of the coincident points")
+    return [p / num_lines for p in params]
+
+
+def _chunks(size, *iterables):
+    """ Generates the chunks of the input iterables.
+
+    :param size: maximum number of items in a chunk
+    :type size: int
+    :param iterables: input iterables
+    :return: lists of items, one for each input iterable
+    :rtype: generator
+    """
+    iterators = [iter(it) for it in iterables]
+    while True:
+        chunk = [list(islice(it, size)) for it in iterators]
+        num = min(len(items) for items in chunk)
+        if num == 0:
+            return
+        yield [items[:num] for items in chunk]
+
+
+def _normal_equations_add(band, rhs, width, point, weight, indices, bfuncs):
+    """ Adds the data point to the normal equations in the banded storage.
+
+    :param band: matrix of the normal equations in the banded storage
+    :type band: list
+    :param rhs: right hand side of the normal equations
+    :type rhs: list
+    :param width: half bandwidth of the matrix
+    :type width: int
+    :param point: data point
+    :type point: list, tuple
+    :param weight: weight of the data point
+    :type weight: float
+    :param indices: indices of the control points with the non-vanishing basis functions
+    :type indices: list, tuple
+    :param bfuncs: non-vanishing basis functions
+    :type bfuncs: list, tuple
+    """
+    for idx_a, bfunc_a in zip(indices, bfuncs):
+        if bfunc_a == 0.0:
+            continue
+        wbfunc = weight * bfunc_a
+        row = band[idx_a]
+        for idx_b, bfunc_b in zip(indices, bfuncs):
+            row[idx_b - idx_a + width] += wbfunc * bfunc_b
+        rhs[idx_a] = [r + (wbfunc * c) for r, c in zip(rhs[idx_a], point)]
+
+
+def _collocation_lu(degree, knot_vector, params):
+    """ Generates the collocation matrix and computes its LU decomposition in the banded storage.
+
+    The row i of the banded storage contains the columns from (i - degree) to (i + degree) of the matrix. The
+    collocation matrix is totally positive and therefore the decomposition does not require pivoting (de Boor, 1977).
+    The lower and the upper triangular factors overwrite the matrix, the unit diagonal of the lower factor is not
+    stored.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :param params: parameters of the data points
+    :type params: list, tuple
+    :return: LU decomposition in the banded storage
+    :rtype: list
+    """
+    num = len(params)
+    spans = helpers.find_spans(degree, knot_vector, num, params)
+    basis = helpers.basis_functions(degree, knot_vector, spans, params)
+
+    # Generate the collocation matrix using the non-vanishing basis functions
+    band = [[0.0 for _ in range((2 * degree) + 1)] for _ in range(num)]
+    for i, (span, bfuncs) in enumerate(zip(spans, basis)):
+        for k, bfunc in enumerate(bfuncs):
+            col = span - degree + k - i + degree
+            if not 0 <= col <= 2 * degree:
+                if bfunc != 0.0:
+                    raise ValueError("The parameters do not satisfy the Schoenberg-Whitney conditions")
+                continue
+            band[i][col] = bfunc
+
+    # Apply LU decomposition
+    return _banded_lu(band, degree)
+
+
+def _banded_lu(band, width):
+    """ Computes the LU decomposition of the banded matrix without pivoting.
+
+    The row i of the banded storage contains the columns from (i - width) to (i + width) of the matrix. The
+    decomposition is applied in-place and it is stable for the totally positive and the symmetric positive definite
+    matrices, i.e. the collocation matrices and the normal equations of the least squares problems.
+
+    :param band: matrix in the banded storage
+    :type band: list
+    :param width: half bandwidth of the matrix
+    :type width: int
+    :return: LU decomposition in the banded storage
+    :rtype: list
+    """
+    num = len(band)
+    for k in range(num):
+        pivot = band[k][width]
+        if pivot == 0.0:
+            raise ValueError("The matrix is singular")
+        row_k = band[k]
+        for i in range(k + 1, min(k + width + 1, num)):
+            row_i = band[i]
+            factor = row_i[k - i + width] / pivot
+            if factor == 0.0:
+                continue
+            row_i[k - i + width] = factor
+            for j in range(k + 1, min(k + width + 1, num)):
+                row_i[j - i + width] -= factor * row_k[j - k + width]
+
+    return band
+
+
+def _banded_solve(lu, width, rhs):
+    """ Solves the linear system using the LU decomposition in the banded storage.
+
+    :param lu: LU decomposition generated by :py:func:`_banded_lu`
+    :type lu: list
+    :param width: half bandwidth of the matrix
+    :type width: int
+    :param rhs: right hand side, i.e. a vector for each row of the matrix
+    :type rhs: list, tuple
+    :return: solution, i.e. a vector for each column of the matrix
+    :rtype: list
+    """
+    num = len(lu)
+    sol = [list(vec) for vec in rhs]
+
+    # Forward substitution with the lower triangular factor
+    for i in range(num):
+        for k in range(max(0, i - width), i):
+            factor = lu[i][k - i + width]
+            if factor != 0.0:
+                sol[i] = [s - (factor * sk) for s, sk in zip(sol[i], sol[k])]
+
+    # Backward substitution with the upper triangular factor
+    for i in range(num - 1, -1, -1):
+        for j in range(i + 1, min(i + width + 1, num)):
+            factor = lu[i][j - i + width]
+            if factor != 0.0:
+                sol[i] = [s - (factor * sj) for s, sj in zip(sol[i], sol[j])]
+        sol[i] = [s / lu[i][width] for s in sol[i]]
+
+    return sol
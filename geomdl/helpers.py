@@ -7,6 +7,8 @@
 
 """
 
+import bisect
+
 
 def find_span_binsearch(degree, knot_vector, num_ctrlpts, knot, **kwargs):
     """ Finds the span of the knot over the input knot vector using binary search.
@@ -82,9 +84,34 @@ def find_span_linear(degree, knot_vector, num_ctrlpts, knot, **kwargs):
     return span - 1
 
 
-def find_spans(degree, knot_vector, num_ctrlpts, knots, func=find_span_linear):
+def find_span_bisect(degree, knot_vector, num_ctrlpts, knot, **kwargs):
+    """ Finds the span of a single knot over the knot vector using bisection.
+
+    Alternative implementation for the Algorithm A2.1 from The NURBS Book by Piegl & Tiller. The span is found in
+    logarithmic time using the standard library's ``bisect`` module. The output is the same as
+    :py:func:`.find_span_linear`, i.e. the last knot of a clamped knot vector is in the last non-zero span.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :param num_ctrlpts: number of control points
+    :type num_ctrlpts: int
+    :param knot: knot
+    :type knot: float
+    :return: span of the knot over the knot vector
+    :rtype: int
+    """
+    return min(bisect.bisect_right(knot_vector, knot), num_ctrlpts) - 1
+
+
+def find_spans(degree, knot_vector, num_ctrlpts, knots, func=find_span_bisect):
     """ Finds spans of a list of knots over the knot vector.
 
+    If the span finding function is :py:func:`.find_span_bisect` or :py:func:`.find_span_linear`, the spans are found
+    in a single sweep over the knots and the knot vector, which only takes linear time for the knots sorted in
+    ascending order. The knots breaking the order are located using bisection.
+
     :param degree: degree
     :type degree: int
     :param knot_vector: knot vector
@@ -97,9 +124,20 @@ def find_spans(degree, knot_vector, num_ctrlpts, knots, func=find_span_linear):
     :return: list of spans
     :rtype: list
     """
+    if func not in (find_span_bisect, find_span_linear):
+        return [func(degree, knot_vector, num_ctrlpts, knot) for knot in knots]
+
     spans = []
+    idx = 0  # number of knots in the knot vector less than or equal to the previous knot, capped to num_ctrlpts
+    knot_prev = None
     for knot in knots:
-        spans.append(func(degree, knot_vector, num_ctrlpts, knot))
+        if knot_prev is not None and knot < knot_prev:
+            idx = min(bisect.bisect_right(knot_vector, knot), num_ctrlpts)
+        else:
+            while idx < num_ctrlpts and knot_vector[idx] <= knot:
+                idx += 1
+        spans.append(idx - 1)
+        knot_prev = knot
     return spans
 
 
@@ -293,6 +331,29 @@ def basis_function_ders(degree, knot_vector, span, knot, order):
     return ders
 
 
+def basis_functions_ders(degree, knot_vector, spans, knots, order):
+    """ Finds derivatives of the basis functions for a list of knots.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :param spans: spans
+    :type spans: list, tuple
+    :param knots: knots
+    :type knots: list, tuple
+    :param order: order of the derivative
+    :type order: int
+    :return: basis function derivatives
+    :rtype: list
+    """
+    basis_ders = []
+
+    for span, knot in zip(spans, knots):
+        basis_ders.append(basis_function_ders(degree, knot_vector, span, knot, order))
+    return basis_ders
+
+
 def basis_function_one(degree, knot_vector, span, knot):
     """ Computes the value of a basis function for a knot.
 
@@ -7,9 +7,13 @@
 
 """
 
+import bisect
 import copy
+import math
+from array import array
 from . import Abstract
 from . import Multi
+from . import arrays
 from . import helpers
 from . import utilities
 
@@ -31,7 +35,7 @@ def split_curve(obj, u, **kwargs):
         raise TypeError("Input shape must be an instance of any Curve class")
 
     # Keyword arguments
-    span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+    span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
 
     # Validate input data
     if u == 0.0 or u == 1.0:
@@ -85,7 +89,8 @@ def split_curve(obj, u, **kwargs):
 def decompose_curve(obj, **kwargs):
     """ Decomposes the curve into Bezier curve segments of the same degree.
 
-    This operation does not modify the input curve, instead it returns the split curve segments.
+    This operation does not modify the input curve, instead it returns the split curve segments. All segments are
+    extracted in a single pass over the knot vector using Algorithm A5.6 from The NURBS Book by Piegl & Tiller.
 
     :param obj: Curve to be decomposed
     :type obj: BSpline.Curve or NURBS.Curve
@@ -95,16 +100,16 @@ def decompose_curve(obj, **kwargs):
     if not isinstance(obj, Abstract.Curve):
         raise TypeError("Input shape must be an instance of any Curve class")
 
+    # Use private variable due to differences between rational and non-rational curve
+    segments = _decompose_ctrlpts(obj.degree, obj.knotvector, [obj._control_points])[0]
+
     curve_list = Multi.MultiCurve()
-    curve = copy.deepcopy(obj)
-    knots = curve.knotvector[curve.degree + 1:-(curve.degree + 1)]
-    while knots:
-        knot = knots[0]
-        curves = split_curve(curve, u=knot, **kwargs)
-        curve_list.add(curves[0])
-        curve = curves[1]
-        knots = curve.knotvector[curve.degree + 1:-(curve.degree + 1)]
-    curve_list.add(curve)
+    for ctrlpts in segments:
+        curve = obj.__class__(compact=obj.compact)
+        curve.degree = obj.degree
+        curve.set_ctrlpts(ctrlpts)
+        curve.knotvector = [0.0 for _ in range(obj.degree + 1)] + [1.0 for _ in range(obj.degree + 1)]
+        curve_list.add(curve)
 
     return curve_list
 
@@ -167,7 +172,7 @@ def split_surface_u(obj, t, **kwargs):
     utilities.check_uv(t)
 
     # Keyword arguments
-    span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+    span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
 
     # Find multiplicity of the knot
     ks = span_func(obj.degree_u, obj.knotvector_u, obj.ctrlpts_size_u, t) - obj.degree_u + 1
@@ -239,7 +244,7 @@ def split_surface_v(obj, t, **kwargs):
     utilities.check_uv(t)
 
     # Keyword arguments
-    span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+    span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
 
     # Find multiplicity of the knot
     ks = span_func(obj.degree_v, obj.knotvector_v, obj.ctrlpts_size_v, t) - obj.degree_v + 1
@@ -298,7 +303,8 @@ def split_surface_v(obj, t, **kwargs):
 def decompose_surface(obj, **kwargs):
     """ Decomposes the surface into Bezier surface patches of the same degree.
 
-    This operation does not modify the input surface, instead it returns the surface patches.
+    This operation does not modify the input surface, instead it returns the surface patches. The patches are
+    extracted in a single pass over each knot vector using Algorithm A5.7 from The NURBS Book by Piegl & Tiller.
 
     :param obj: Surface
     :type obj: BSpline.Surface or NURBS.Surface
@@ -309,36 +315,678 @@ def decompose_surface(obj, **kwargs):
     if not isinstance(obj, Abstract.Surface):
         raise TypeError("Input shape must be an instance of any Surface class")
 
-    # Work with an identical copy
-    surf = copy.deepcopy(obj)
-
-    surf_list = []
+    degree_u = obj.degree_u
+    degree_v = obj.degree_v
+    ctrlpts2d = obj._control_points2D
 
-    # Process u-direction
-    knots_u = surf.knotvector_u[surf.degree_u + 1:-(surf.degree_u + 1)]
-    while knots_u:
-        knot = knots_u[0]
-        surfs = split_surface_u(surf, t=knot, **kwargs)
-        surf_list.append(surfs[0])
-        surf = surfs[1]
-        knots_u = surf.knotvector_u[surf.degree_u + 1:-(surf.degree_u + 1)]
-    surf_list.append(surf)
+    # Process u-direction, i.e. decompose the control points on the u-direction for each v
+    cols = [[ctrlpts2d[u][v] for u in range(obj.ctrlpts_size_u)] for v in range(obj.ctrlpts_size_v)]
+    cols_decomposed = _decompose_ctrlpts(degree_u, obj.knotvector_u, cols)
 
-    # Process v-direction
     multi_surf = Multi.MultiSurface()
-    for surf in surf_list:
-        knots_v = surf.knotvector_v[surf.degree_v + 1:-(surf.degree_v + 1)]
-        while knots_v:
-            knot = knots_v[0]
-            surfs = split_surface_v(surf, t=knot, **kwargs)
-            multi_surf.add(surfs[0])
-            surf = surfs[1]
-            knots_v = surf.knotvector_v[surf.degree_v + 1:-(surf.degree_v + 1)]
-        multi_surf.add(surf)
+    for seg_u in range(len(cols_decomposed[0])):
+        # Process v-direction, i.e. decompose the control points on the v-direction for each u of the strip
+        rows = [[col[seg_u][u] for col in cols_decomposed] for u in range(degree_u + 1)]
+        rows_decomposed = _decompose_ctrlpts(degree_v, obj.knotvector_v, rows)
+
+        for seg_v in range(len(rows_decomposed[0])):
+            surf = obj.__class__(compact=obj.compact)
+            surf.degree_u = degree_u
+            surf.degree_v = degree_v
+            surf.set_ctrlpts([pt for row in rows_decomposed for pt in row[seg_v]], degree_u + 1, degree_v + 1)
+            surf.knotvector_u = [0.0 for _ in range(degree_u + 1)] + [1.0 for _ in range(degree_u + 1)]
+            surf.knotvector_v = [0.0 for _ in range(degree_v + 1)] + [1.0 for _ in range(degree_v + 1)]
+            multi_surf.add(surf)
 
     return multi_surf
 
 
+def _decompose_ctrlpts(degree, knot_vector, ctrlpts_list):
+    """ Decomposes the control point sequences defined on the same knot vector into Bezier segments.
+
+    Implementation of Algorithm A5.6 from The NURBS Book by Piegl & Tiller. The alphas are shared between the control
+    point sequences, as described in Algorithm A5.7.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :param ctrlpts_list: list of control point sequences (may be weighted or not)
+    :type ctrlpts_list: list
+    :return: list of Bezier segments, i.e. lists of degree + 1 control points, for each control point sequence
+    :rtype: list
+    """
+    m = len(knot_vector) - 1
+    a = degree
+    b = degree + 1
+    alphas = [0.0 for _ in range(degree)]
+
+    # Initialize the first segment
+    Qs = [[[list(P[i]) for i in range(degree + 1)]] for P in ctrlpts_list]
+    while b < m:
+        i = b
+        while b < m and knot_vector[b + 1] == knot_vector[b]:
+            b += 1
+        mult = b - i + 1
+
+        # Initialize the next segment, if there is any
+        Qnext = [[[] for _ in range(degree + 1)] for _ in ctrlpts_list]
+
+        if mult < degree:
+            # Compute the alphas
+            numer = knot_vector[b] - knot_vector[a]
+            for j in range(degree, mult, -1):
+                alphas[j - mult - 1] = numer / (knot_vector[a + j] - knot_vector[a])
+            # Insert the knot r times
+            r = degree - mult
+            for j in range(1, r + 1):
+                save = r - j
+                s = mult + j
+                for Q, Qn in zip(Qs, Qnext):
+                    Qc = Q[-1]
+                    for k in range(degree, s - 1, -1):
+                        alpha = alphas[k - s]
+                        Qc[k] = [alpha * elem1 + (1.0 - alpha) * elem2 for elem1, elem2 in zip(Qc[k], Qc[k - 1])]
+                    if b < m:
+                        # Control point of the next segment
+                        Qn[save] = list(Qc[degree])
+
+        if b < m:
+            # Load the remaining control points of the next segment
+            for P, Q, Qn in zip(ctrlpts_list, Qs, Qnext):
+                for k in range(degree - mult, degree + 1):
+                    Qn[k] = list(P[b - degree + k])
+                Q.append(Qn)
+            a = b
+            b += 1
+
+    return Qs
+
+
+def degree_elevate(obj, t, **kwargs):
+    """ Elevates the degree of the curve or the surface.
+
+    Implementation of Algorithm A5.9 from The NURBS Book by Piegl & Tiller. The control points are processed in a
+    single pass over the knot vector, i.e. each Bezier segment is extracted, degree elevated and the redundant knots
+    are removed before moving to the next segment. For surfaces, the rows of the control points share the same knot
+    insertion and removal coefficients, as described in Algorithm A5.10.
+
+    This operation does not modify the input shape, instead it returns a new shape.
+
+    Keyword Arguments:
+
+        * ``direction``: parametric direction of the surface, "u", "v" or "uv". *Default: "uv"*
+
+    :param obj: Curve or Surface
+    :type obj: BSpline.Curve, NURBS.Curve, BSpline.Surface or NURBS.Surface
+    :param t: number of degrees to elevate
+    :type t: int
+    :return: degree elevated shape
+    :rtype: BSpline.Curve, NURBS.Curve, BSpline.Surface or NURBS.Surface
+    """
+    if t < 0:
+        raise ValueError("Number of degrees to elevate must be a positive integer")
+    return _ctrlpts_operation(obj, _elevate_ctrlpts, t, kwargs.get('direction', 'uv'))
+
+
+def degree_reduce(obj, **kwargs):
+    """ Reduces the degree of the curve or the surface by one.
+
+    Implementation of Algorithm A5.11 from The NURBS Book by Piegl & Tiller. The control points are processed in a
+    single pass over the knot vector, i.e. each Bezier segment is extracted, degree reduced and the knots are removed
+    to restore the continuity of the input shape. The deviation from the input shape is bounded on each knot span and
+    the operation fails if the bound exceeds the tolerance. For rational shapes, the deviation is computed using the
+    weighted control points.
+
+    This operation does not modify the input shape, instead it returns a new shape.
+
+    Keyword Arguments:
+
+        * ``tol``: maximum allowed deviation from the input shape. *Default: 10e-8*
+        * ``direction``: parametric direction of the surface, "u", "v" or "uv". *Default: "uv"*
+
+    :param obj: Curve or Surface
+    :type obj: BSpline.Curve, NURBS.Curve, BSpline.Surface or NURBS.Surface
+    :return: degree reduced shape
+    :rtype: BSpline.Curve, NURBS.Curve, BSpline.Surface or NURBS.Surface
+    """
+    return _ctrlpts_operation(obj, _reduce_ctrlpts, kwargs.get('tol', 10e-8), kwargs.get('direction', 'uv'))
+
+
+def remove_knot(obj, u, num=1, **kwargs):
+    """ Removes the knot from the curve or the surface.
+
+    Implementation of Algorithm A5.8 from The NURBS Book by Piegl & Tiller. The knot is removed up to ``num`` times,
+    as long as the shape does not deviate more than the tolerance from the input shape, i.e. the removal stops at the
+    first step which exceeds the tolerance. The number of successful removals can be determined from the knot vector
+    of the returned shape. For surfaces, the knot is removed only if all rows of the control points satisfy the
+    tolerance. For rational shapes, the deviation is computed using the weighted control points.
+
+    This operation does not modify the input shape, instead it returns a new shape.
+
+    Keyword Arguments:
+
+        * ``tol``: maximum allowed deviation on each removal step. *Default: 10e-8*
+        * ``direction``: parametric direction of the surface, "u" or "v". *Default: "u"*
+
+    :param obj: Curve or Surface
+    :type obj: BSpline.Curve, NURBS.Curve, BSpline.Surface or NURBS.Surface
+    :param u: knot to be removed
+    :type u: float
+    :param num: number of removals
+    :type num: int
+    :return: shape with the knot removed
+    :rtype: BSpline.Curve, NURBS.Curve, BSpline.Surface or NURBS.Surface
+    """
+    tol = kwargs.get('tol', 10e-8)
+    direction = kwargs.get('direction', 'u')
+    if num < 1:
+        raise ValueError("Number of removals must be a positive integer")
+    if isinstance(obj, Abstract.Surface) and direction not in ('u', 'v'):
+        raise ValueError("Direction must be 'u' or 'v'")
+
+    if not isinstance(obj, (Abstract.Curve, Abstract.Surface)):
+        raise TypeError("Input shape must be an instance of any Curve or Surface class")
+
+    # The knot vectors are stored rounded to the precision of the shape
+    u = round(u, obj._precision)
+
+    def remove_func(degree, knot_vector, ctrlpts_list, arg):
+        knot_vector, ctrlpts_list = _remove_knot_ctrlpts(degree, knot_vector, ctrlpts_list, u, num, arg)[0:2]
+        return degree, knot_vector, ctrlpts_list
+
+    return _ctrlpts_operation(obj, remove_func, tol, direction)
+
+
+def remove_knots(obj, **kwargs):
+    """ Removes all removable internal knots from the curve or the surface.
+
+    Each distinct internal knot is removed using Algorithm A5.8 from The NURBS Book by Piegl & Tiller as many times as
+    the tolerance allows and the knot vector is processed until no more knots can be removed. This operation is useful
+    for compacting the shapes which contain redundant knots, e.g. after knot insertions or splitting.
+
+    Please note that the tolerance bounds the deviation of each removal step, not the total deviation from the input
+    shape. This operation does not modify the input shape, instead it returns a new shape.
+
+    Keyword Arguments:
+
+        * ``tol``: maximum allowed deviation on each removal step. *Default: 10e-8*
+        * ``direction``: parametric direction of the surface, "u", "v" or "uv". *Default: "uv"*
+
+    :param obj: Curve or Surface
+    :type obj: BSpline.Curve, NURBS.Curve, BSpline.Surface or NURBS.Surface
+    :return: shape with the redundant knots removed
+    :rtype: BSpline.Curve, NURBS.Curve, BSpline.Surface or NURBS.Surface
+    """
+    return _ctrlpts_operation(obj, _remove_knots_ctrlpts, kwargs.get('tol', 10e-8), kwargs.get('direction', 'uv'))
+
+
+def _remove_knots_ctrlpts(degree, knot_vector, ctrlpts_list, tol):
+    """ Removes all removable internal knots from the control point sequences defined on the same knot vector.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :param ctrlpts_list: list of control point sequences (may be weighted or not)
+    :type ctrlpts_list: list
+    :param tol: maximum allowed deviation on each removal step
+    :type tol: float
+    :return: degree, new knot vector and the list of new control point sequences
+    :rtype: tuple
+    """
+    kv = list(knot_vector)
+    removed = True
+    while removed:
+        removed = False
+        for knot in sorted(set(kv[degree + 1:len(kv) - degree - 1])):
+            kv, ctrlpts_list, num = _remove_knot_ctrlpts(degree, kv, ctrlpts_list, knot, degree + 1, tol)
+            removed = removed or num > 0
+    return degree, kv, ctrlpts_list
+
+
+def _remove_knot_ctrlpts(degree, knot_vector, ctrlpts_list, u, num, tol):
+    """ Removes the knot from the control point sequences defined on the same knot vector.
+
+    Implementation of Algorithm A5.8 from The NURBS Book by Piegl & Tiller. The alphas are shared between the control
+    point sequences and the knot is removed only if all sequences satisfy the tolerance.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :param ctrlpts_list: list of control point sequences (may be weighted or not)
+    :type ctrlpts_list: list
+    :param u: knot to be removed
+    :type u: float
+    :param num: maximum number of removals
+    :type num: int
+    :param tol: maximum allowed deviation on each removal step
+    :type tol: float
+    :return: new knot vector, the list of new control point sequences and the number of removals
+    :rtype: tuple
+    """
+    p = degree
+    order = p + 1
+
+    # Find the last index and the multiplicity of the knot; the knots are compared exactly as the nearby knots may be
+    # distinct knots and the alphas depend on the exact knot value
+    indices = [idx for idx, knot in enumerate(knot_vector) if knot == u]
+    if not indices:
+        raise ValueError("The knot " + str(u) + " does not exist in the knot vector")
+    r = indices[-1]
+    s = len(indices)
+    if r - s < p or r >= len(knot_vector) - order:
+        raise ValueError("Cannot remove the end knots")
+    num = min(num, s)
+
+    # The control points are replaced, not updated; therefore, copying the sequences is sufficient
+    Ps = [list(P) for P in ctrlpts_list]
+    first = r - p
+    last = r - s
+    t = 0
+    while t < num:
+        off = first - 1
+        temps = []
+        for P in Ps:
+            temp = [None for _ in range(last + 2 - off)]
+            temp[0] = P[off]
+            temp[last + 1 - off] = P[last + 1]
+            temps.append(temp)
+        i = first
+        j = last
+        ii = 1
+        jj = last - off
+        while j - i > t:
+            alfi = (u - knot_vector[i]) / (knot_vector[i + order + t] - knot_vector[i])
+            alfj = (u - knot_vector[j - t]) / (knot_vector[j + order] - knot_vector[j - t])
+            for P, temp in zip(Ps, temps):
+                temp[ii] = [(c1 - ((1.0 - alfi) * c2)) / alfi for c1, c2 in zip(P[i], temp[ii - 1])]
+                temp[jj] = [(c1 - (alfj * c2)) / (1.0 - alfj) for c1, c2 in zip(P[j], temp[jj + 1])]
+            i += 1
+            ii += 1
+            j -= 1
+            jj -= 1
+
+        # Check if the knot is removable
+        if j - i < t:
+            err = max(utilities.point_distance(temp[ii - 1], temp[jj + 1]) for temp in temps)
+        else:
+            alfi = (u - knot_vector[i]) / (knot_vector[i + order + t] - knot_vector[i])
+            err = max(utilities.point_distance(P[i], [(alfi * c1) + ((1.0 - alfi) * c2)
+                                                      for c1, c2 in zip(temp[ii + t + 1], temp[ii - 1])])
+                      for P, temp in zip(Ps, temps))
+        if err > tol:
+            break
+
+        # Save the new control points
+        i = first
+        j = last
+        while j - i > t:
+            for P, temp in zip(Ps, temps):
+                P[i] = temp[i - off]
+                P[j] = temp[j - off]
+            i += 1
+            j -= 1
+        first -= 1
+        last += 1
+        t += 1
+
+    if t == 0:
+        return list(knot_vector), Ps, 0
+
+    # Shift the knots and the control points
+    kv = list(knot_vector[0:r + 1 - t]) + list(knot_vector[r + 1:])
+    j = (2 * r - s - p) // 2
+    i = j
+    for k in range(1, t):
+        if k % 2 == 1:
+            i += 1
+        else:
+            j -= 1
+    Ps = [P[0:j] + P[i + 1:] for P in Ps]
+
+    return kv, Ps, t
+
+
+def _ctrlpts_operation(obj, func, arg, direction):
+    """ Applies the operation on the control point sequences to the curve or the surface.
+
+    The operation takes the degree, the knot vector, the list of control point sequences and the argument. It returns
+    the new degree, the new knot vector and the list of new control point sequences.
+
+    :param obj: Curve or Surface
+    :type obj: Abstract.Curve or Abstract.Surface
+    :param func: operation on the control point sequences
+    :type func: function
+    :param arg: argument of the operation
+    :param direction: parametric direction of the surface
+    :type direction: str
+    :return: new shape
+    :rtype: Abstract.Curve or Abstract.Surface
+    """
+    if isinstance(obj, Abstract.Curve):
+        degree, kv, ctrlpts = func(obj.degree, obj.knotvector, [obj._control_points], arg)
+        curve = obj.__class__(compact=obj.compact)
+        curve.degree = degree
+        curve.set_ctrlpts(ctrlpts[0])
+        curve.knotvector = kv
+        return curve
+
+    if not isinstance(obj, Abstract.Surface):
+        raise TypeError("Input shape must be an instance of any Curve or Surface class")
+    if direction not in ('u', 'v', 'uv'):
+        raise ValueError("Direction must be 'u', 'v' or 'uv'")
+
+    degree_u, degree_v = obj.degree_u, obj.degree_v
+    kv_u, kv_v = obj.knotvector_u, obj.knotvector_v
+    ctrlpts2d = obj._control_points2D
+    if 'u' in direction:
+        # Process u-direction, i.e. the control points on the u-direction for each v
+        cols = [[ctrlpts2d[u][v] for u in range(len(ctrlpts2d))] for v in range(len(ctrlpts2d[0]))]
+        degree_u, kv_u, cols = func(degree_u, kv_u, cols, arg)
+        ctrlpts2d = [[col[u] for col in cols] for u in range(len(cols[0]))]
+    if 'v' in direction:
+        # Process v-direction, i.e. the control points on the v-direction for each u
+        degree_v, kv_v, ctrlpts2d = func(degree_v, kv_v, ctrlpts2d, arg)
+
+    surf = obj.__class__(compact=obj.compact)
+    surf.degree_u = degree_u
+    surf.degree_v = degree_v
+    surf.set_ctrlpts([pt for row in ctrlpts2d for pt in row], len(ctrlpts2d), len(ctrlpts2d[0]))
+    surf.knotvector_u = kv_u
+    surf.knotvector_v = kv_v
+    return surf
+
+
+def _elevate_ctrlpts(degree, knot_vector, ctrlpts_list, t):
+    """ Elevates the degree of the control point sequences defined on the same knot vector.
+
+    Implementation of Algorithm A5.9 from The NURBS Book by Piegl & Tiller.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :param ctrlpts_list: list of control point sequences (may be weighted or not)
+    :type ctrlpts_list: list
+    :param t: number of degrees to elevate
+    :type t: int
+    :return: new degree, new knot vector and the list of new control point sequences
+    :rtype: tuple
+    """
+    p = degree
+    ph = p + t
+    m = len(knot_vector) - 1
+    if t == 0:
+        return p, list(knot_vector), [[list(pt) for pt in P] for P in ctrlpts_list]
+
+    # Compute the Bezier degree elevation coefficients
+    bezalfs = [[0.0 for _ in range(p + 1)] for _ in range(ph + 1)]
+    bezalfs[0][0] = bezalfs[ph][p] = 1.0
+    for i in range(1, (ph // 2) + 1):
+        inv = 1.0 / utilities.binomial_coefficient(ph, i)
+        for j in range(max(0, i - t), min(p, i) + 1):
+            bezalfs[i][j] = inv * utilities.binomial_coefficient(p, j) * utilities.binomial_coefficient(t, i - j)
+    for i in range((ph // 2) + 1, ph):
+        for j in range(max(0, i - t), min(p, i) + 1):
+            bezalfs[i][j] = bezalfs[ph - i][p - j]
+
+    kv = [knot_vector[0] for _ in range(ph + 1)]
+    Qs = [[list(P[0])] for P in ctrlpts_list]
+    bpts = [[list(P[i]) for i in range(p + 1)] for P in ctrlpts_list]
+    next_bpts = [[None for _ in range(p - 1)] for _ in ctrlpts_list]
+    alfs = [0.0 for _ in range(p - 1)]
+    r = -1
+    a = p
+    b = p + 1
+    ua = knot_vector[0]
+    while b < m:
+        i = b
+        while b < m and knot_vector[b] == knot_vector[b + 1]:
+            b += 1
+        mul = b - i + 1
+        ub = knot_vector[b]
+        oldr = r
+        r = p - mul
+        lbz = (oldr + 2) // 2 if oldr > 0 else 1
+        rbz = ph - ((r + 1) // 2) if r > 0 else ph
+
+        # Insert the knot ub r times to get the Bezier segment
+        if r > 0:
+            numer = ub - ua
+            for k in range(p, mul, -1):
+                alfs[k - mul - 1] = numer / (knot_vector[a + k] - ua)
+            for j in range(1, r + 1):
+                save = r - j
+                s = mul + j
+                for bp, nbp in zip(bpts, next_bpts):
+                    for k in range(p, s - 1, -1):
+                        alf = alfs[k - s]
+                        bp[k] = [(alf * c1) + ((1.0 - alf) * c2) for c1, c2 in zip(bp[k], bp[k - 1])]
+                    nbp[save] = bp[p]
+
+        # Elevate the degree of the Bezier segment
+        ebpts_list = []
+        for bp in bpts:
+            ebpts = [None for _ in range(ph + 1)]
+            for i in range(ph + 1):
+                ebpts[i] = [0.0 for _ in bp[0]]
+                for j in range(max(0, i - t), min(p, i) + 1):
+                    ebpts[i] = [e + (bezalfs[i][j] * c) for e, c in zip(ebpts[i], bp[j])]
+            ebpts_list.append(ebpts)
+
+        # Remove the knot ua oldr times
+        if oldr > 1:
+            kind = len(kv)
+            cind = len(Qs[0])
+            first = kind - 2
+            last = kind
+            den = ub - ua
+            bet = (ub - kv[kind - 1]) / den
+            for tr in range(1, oldr):
+                i = first
+                j = last
+                kj = j - kind + 1
+                while j - i > tr:
+                    if i < cind:
+                        alf = (ub - kv[i]) / (ua - kv[i])
+                        for Q in Qs:
+                            Q[i] = [(alf * c1) + ((1.0 - alf) * c2) for c1, c2 in zip(Q[i], Q[i - 1])]
+                    if j >= lbz:
+                        gam = (ub - kv[j - tr]) / den if j - tr <= kind - ph + oldr else bet
+                        for ebpts in ebpts_list:
+                            ebpts[kj] = [(gam * c1) + ((1.0 - gam) * c2) for c1, c2 in zip(ebpts[kj], ebpts[kj + 1])]
+                    i += 1
+                    j -= 1
+                    kj -= 1
+                first -= 1
+                last += 1
+
+        # Load the knot ua and the control points
+        if a != p:
+            kv += [ua for _ in range(ph - oldr)]
+        for Q, ebpts in zip(Qs, ebpts_list):
+            Q += ebpts[lbz:rbz + 1]
+
+        if b < m:
+            # Set up the next Bezier segment
+            for P, bp, nbp in zip(ctrlpts_list, bpts, next_bpts):
+                bp[:] = nbp[0:r] + [list(P[b - p + j]) for j in range(r, p + 1)]
+            a = b
+            b += 1
+            ua = ub
+        else:
+            # Load the end knots
+            kv += [ub for _ in range(ph + 1)]
+
+    return ph, kv, Qs
+
+
+def _reduce_ctrlpts(degree, knot_vector, ctrlpts_list, tol):
+    """ Reduces the degree of the control point sequences defined on the same knot vector by one.
+
+    Implementation of Algorithm A5.11 from The NURBS Book by Piegl & Tiller. The error bounds are shared between the
+    control point sequences, i.e. the maximum of the bounds is accumulated on the knot spans.
+
+    :param degree: degree
+    :type degree: int
+    :param knot_vector: knot vector
+    :type knot_vector: list, tuple
+    :param ctrlpts_list: list of control point sequences (may be weighted or not)
+    :type ctrlpts_list: list
+    :param tol: maximum allowed deviation
+    :type tol: float
+    :return: new degree, new knot vector and the list of new control point sequences
+    :rtype: tuple
+    """
+    p = degree
+    ph = p - 1
+    m = len(knot_vector) - 1
+    if p < 2:
+        raise ValueError("Degree must be greater than one for degree reduction")
+
+    kv = [knot_vector[0] for _ in range(ph + 1)]
+    Ps = [[list(P[0])] for P in ctrlpts_list]
+    bpts = [[list(P[i]) for i in range(p + 1)] for P in ctrlpts_list]
+    next_bpts = [[None for _ in range(p - 1)] for _ in ctrlpts_list]
+    alphas = [0.0 for _ in range(p - 1)]
+    errors = [0.0 for _ in range(m + 1)]
+    r = -1
+    a = p
+    b = p + 1
+    while b < m:
+        i = b
+        while b < m and knot_vector[b] == knot_vector[b + 1]:
+            b += 1
+        mult = b - i + 1
+        oldr = r
+        r = p - mult
+        lbz = (oldr + 2) // 2 if oldr > 0 else 1
+
+        # Insert the knot U[b] r times to get the Bezier segment
+        if r > 0:
+            numer = knot_vector[b] - knot_vector[a]
+            for k in range(p, mult, -1):
+                alphas[k - mult - 1] = numer / (knot_vector[a + k] - knot_vector[a])
+            for j in range(1, r + 1):
+                save = r - j
+                s = mult + j
+                for bp, nbp in zip(bpts, next_bpts):
+                    for k in range(p, s - 1, -1):
+                        alpha = alphas[k - s]
+                        bp[k] = [(alpha * c1) + ((1.0 - alpha) * c2) for c1, c2 in zip(bp[k], bp[k - 1])]
+                    nbp[save] = bp[p]
+
+        # Reduce the degree of the Bezier segment
+        rbpts_list = []
+        max_err = 0.0
+        for bp in bpts:
+            rbpts, err = _bezier_reduce(bp)
+            rbpts_list.append(rbpts)
+            max_err = max(max_err, err)
+        errors[a] += max_err
+        if errors[a] > tol:
+            raise ValueError("Cannot reduce the degree within the tolerance")
+
+        # Remove the knot U[a] oldr times
+        cind = len(Ps[0])
+        if oldr > 0:
+            kind = len(kv)
+            first = kind
+            last = kind
+            for k in range(oldr):
+                i = first
+                j = last
+                kj = j - kind
+                while j - i > k:
+                    alfa = (knot_vector[a] - kv[i - 1]) / (knot_vector[b] - kv[i - 1])
+                    beta = (knot_vector[a] - kv[j - k - 1]) / (knot_vector[b] - kv[j - k - 1])
+                    for P in Ps:
+                        P[i - 1] = [(c1 - ((1.0 - alfa) * c2)) / alfa for c1, c2 in zip(P[i - 1], P[i - 2])]
+                    for rbpts in rbpts_list:
+                        rbpts[kj] = [(c1 - (beta * c2)) / (1.0 - beta) for c1, c2 in zip(rbpts[kj], rbpts[kj + 1])]
+                    i += 1
+                    j -= 1
+                    kj -= 1
+
+                # Compute the knot removal error bound
+                if j - i < k:
+                    err_rem = max(utilities.point_distance(P[i - 2], rbpts[kj + 1])
+                                  for P, rbpts in zip(Ps, rbpts_list))
+                else:
+                    delta = (knot_vector[a] - kv[i - 1]) / (knot_vector[b] - kv[i - 1])
+                    err_rem = max(utilities.point_distance(P[i - 1], [(delta * c1) + ((1.0 - delta) * c2)
+                                                                      for c1, c2 in zip(rbpts[kj + 1], P[i - 2])])
+                                  for P, rbpts in zip(Ps, rbpts_list))
+
+                # Update the errors of the affected knot spans
+                span_last = a + oldr - k - ((2 * p - k + 1) // 2)
+                for ii in range(max(0, span_last), a + 1):
+                    errors[ii] += err_rem
+                    if errors[ii] > tol:
+                        raise ValueError("Cannot reduce the degree within the tolerance")
+                first -= 1
+                last += 1
+            cind = i - 1
+
+        # Load the knot U[a] and the control points
+        if a != p:
+            kv += [knot_vector[a] for _ in range(ph - oldr)]
+        for P, rbpts in zip(Ps, rbpts_list):
+            P[cind:] = rbpts[lbz:ph + 1]
+
+        if b < m:
+            # Set up the next Bezier segment
+            for P, bp, nbp in zip(ctrlpts_list, bpts, next_bpts):
+                bp[:] = nbp[0:r] + [list(P[b - p + j]) for j in range(r, p + 1)]
+            a = b
+            b += 1
+        else:
+            # Load the end knots
+            kv += [knot_vector[b] for _ in range(ph + 1)]
+
+    return ph, kv, Ps
+
+
+def _bezier_reduce(pts):
+    """ Reduces the degree of the Bezier segment by one.
+
+    Please refer to Equations 5.41 to 5.43 from The NURBS Book by Piegl & Tiller. The error is bounded by the maximum
+    distance between the control points of the segment and the degree elevated control points of the reduced segment.
+
+    :param pts: control points of the Bezier segment
+    :type pts: list
+    :return: control points of the reduced segment and the error bound
+    :rtype: tuple
+    """
+    p = len(pts) - 1
+    r = (p - 1) // 2
+    rpts = [None for _ in range(p)]
+    rpts[0] = list(pts[0])
+    rpts[p - 1] = list(pts[p])
+    for i in range(1, r + 1):
+        alpha = float(i) / p
+        rpts[i] = [(c1 - (alpha * c2)) / (1.0 - alpha) for c1, c2 in zip(pts[i], rpts[i - 1])]
+    for i in range(p - 2, r, -1):
+        alpha = float(i + 1) / p
+        rpts[i] = [(c1 - ((1.0 - alpha) * c2)) / alpha for c1, c2 in zip(pts[i + 1], rpts[i + 1])]
+    if p % 2 == 1 and r > 0:
+        # Average the middle control point computed from both ends
+        alpha = float(r + 1) / p
+        right = [(c1 - ((1.0 - alpha) * c2)) / alpha for c1, c2 in zip(pts[r + 1], rpts[r + 1])]
+        rpts[r] = [(c1 + c2) / 2.0 for c1, c2 in zip(rpts[r], right)]
+
+    # Compute the error bound by elevating the degree of the reduced segment
+    err = 0.0
+    for i in range(1, p):
+        alpha = float(i) / p
+        pt = [(alpha * c1) + ((1.0 - alpha) * c2) for c1, c2 in zip(rpts[i - 1], rpts[i])]
+        err = max(err, utilities.point_distance(pt, pts[i]))
+
+    return rpts, err
+
+
 def translate(obj, vec, **kwargs):
     """ Translates a single curve or a surface by the input vector.
 
@@ -489,10 +1137,13 @@ def _tangent_curve_single_list(obj, param_list, normalize):
     :return: a list containing "point" and "vector" pairs
     :rtype: tuple
     """
+    # 1st derivatives of the curve give the tangents
+    ders_list = obj.derivatives_list(param_list, 1)
+
     ret_vector = []
-    for param in param_list:
-        temp = _tangent_curve_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for ders in ders_list:
+        vector = utilities.vector_normalize(ders[1]) if normalize else ders[1]
+        ret_vector.append((tuple(ders[0]), tuple(vector)))
     return tuple(ret_vector)
 
 
@@ -533,10 +1184,13 @@ def _normal_curve_single_list(obj, param_list, normalize):
     :return: a list containing "point" and "vector" pairs
     :rtype: tuple
     """
+    # 2nd derivatives of the curve give the normals
+    ders_list = obj.derivatives_list(param_list, 2)
+
     ret_vector = []
-    for param in param_list:
-        temp = _normal_curve_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for ders in ders_list:
+        vector = utilities.vector_normalize(ders[2]) if normalize else ders[2]
+        ret_vector.append((tuple(ders[0]), tuple(vector)))
     return tuple(ret_vector)
 
 
@@ -579,10 +1233,16 @@ def _binormal_curve_single_list(obj, param_list, normalize):
     :return: a list containing "point" and "vector" pairs
     :rtype: tuple
     """
+    # Tangent and normal vectors are computed from the same set of derivatives
+    ders_list = obj.derivatives_list(param_list, 2)
+
     ret_vector = []
-    for param in param_list:
-        temp = _binormal_curve_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for ders in ders_list:
+        tan_vector = utilities.vector_normalize(ders[1]) if normalize else ders[1]
+        norm_vector = utilities.vector_normalize(ders[2]) if normalize else ders[2]
+        vector = utilities.vector_cross(tan_vector, norm_vector)
+        vector = utilities.vector_normalize(vector) if normalize else vector
+        ret_vector.append((tuple(ders[0]), tuple(vector)))
     return tuple(ret_vector)
 
 
@@ -623,10 +1283,14 @@ def _tangent_surface_single_list(obj, param_list, normalize):
     :return: a list containing "point" and "vector" pairs
     :rtype: tuple
     """
+    # Tangents are the 1st derivatives of the surface
+    skl_list = obj.derivatives_list(param_list, 1)
+
     ret_vector = []
-    for param in param_list:
-        temp = _tangent_surface_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for skl in skl_list:
+        vector_u = utilities.vector_normalize(skl[1][0]) if normalize else skl[1][0]
+        vector_v = utilities.vector_normalize(skl[0][1]) if normalize else skl[0][1]
+        ret_vector.append((tuple(skl[0][0]), tuple(vector_u), tuple(vector_v)))
     return tuple(ret_vector)
 
 
@@ -667,10 +1331,14 @@ def _normal_surface_single_list(obj, param_list, normalize):
     :return: a list containing "point" and "vector" pairs
     :rtype: tuple
     """
+    # Take the 1st derivatives of the surface
+    skl_list = obj.derivatives_list(param_list, 1)
+
     ret_vector = []
-    for param in param_list:
-        temp = _normal_surface_single(obj, param, normalize)
-        ret_vector.append(temp)
+    for skl in skl_list:
+        vector = utilities.vector_cross(skl[1][0], skl[0][1])
+        vector = utilities.vector_normalize(vector) if normalize else vector
+        ret_vector.append((tuple(skl[0][0]), tuple(vector)))
     return tuple(ret_vector)
 
 
@@ -710,7 +1378,7 @@ def _find_ctrlpts_curve(t, curve, **kwargs):
     :rtype: list
     """
     # Get keyword arguments
-    span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+    span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
 
     # Find spans and the constant index
     span = span_func(curve.degree, curve.knotvector, len(curve.ctrlpts), t)
@@ -740,7 +1408,7 @@ def _find_ctrlpts_surface(t_u, t_v, surf, **kwargs):
     :rtype: list
     """
     # Get keyword arguments
-    span_func = kwargs.get('find_span_func', helpers.find_span_linear)
+    span_func = kwargs.get('find_span_func', helpers.find_span_bisect)
 
     # Find spans
     span_u = span_func(surf.degree_u, surf.knotvector_u, surf.ctrlpts_size_u, t_u)
@@ -760,3 +1428,1303 @@ def _find_ctrlpts_surface(t_u, t_v, surf, **kwargs):
 
     # Return 2-dimensional control points array
     return surf_ctrlpts
+
+
+def closest_point(obj, points, **kwargs):
+    """ Finds the closest points on the curve or the surface to the input points.
+
+    This function solves the *point inversion* problem described in Section 6.1 of The NURBS Book by Piegl & Tiller
+    for all input points at once. The shape is evaluated on a coarse grid of parameters and the grid points are indexed
+    by a k-d tree to find the starting parameter of each input point. Then, the parameters are refined by the Newton
+    iterations. In each iteration, the derivatives of the shape are evaluated for all unconverged points with a single
+    evaluator call.
+
+    Keyword Arguments:
+
+        * ``tol``: point coincidence and zero cosine tolerance. *Default: 10e-8*
+        * ``max_iter``: maximum number of Newton iterations. *Default: 20*
+        * ``sample_size``: size of the seed grid, (size_u, size_v) for surfaces. *Default: sample size of the shape*
+
+    :param obj: input shape
+    :type obj: BSpline.Curve, NURBS.Curve, BSpline.Surface or NURBS.Surface
+    :param points: a single point or a list of points
+    :type points: list, tuple
+    :return: parameters, closest points and distances; lists of them for a list of input points
+    :rtype: tuple
+    """
+    tol = kwargs.get('tol', 10e-8)
+    max_iter = kwargs.get('max_iter', 20)
+
+    if not points:
+        raise ValueError("The input must contain at least one point")
+
+    # Check if the input is a single point
+    single = not hasattr(points[0], '__len__')
+    pts = [points] if single else points
+    for pt in pts:
+        if len(pt) != obj.dimension:
+            raise ValueError("The input points must be " + str(obj.dimension) + " dimensional")
+
+    if isinstance(obj, Abstract.Curve):
+        sample_size = kwargs.get('sample_size', obj.sample_size)
+        res = _closest_point_curve(obj, pts, tol, max_iter, sample_size)
+    elif isinstance(obj, Abstract.Surface):
+        sample_size = kwargs.get('sample_size', (obj.sample_size_u, obj.sample_size_v))
+        res = _closest_point_surface(obj, pts, tol, max_iter, sample_size)
+    else:
+        raise TypeError("The input must be an instance of Abstract.Curve or Abstract.Surface")
+
+    if single:
+        return res[0][0], res[1][0], res[2][0]
+    return res
+
+
+def _closest_point_curve(obj, points, tol, max_iter, sample_size):
+    """ Finds the closest points on the curve to the input points.
+
+    :param obj: input curve
+    :type obj: BSpline.Curve or NURBS.Curve
+    :param points: list of points
+    :type points: list, tuple
+    :param tol: point coincidence and zero cosine tolerance
+    :type tol: float
+    :param max_iter: maximum number of Newton iterations
+    :type max_iter: int
+    :param sample_size: number of the seed parameters
+    :type sample_size: int
+    :return: parameters, closest points and distances
+    :rtype: tuple
+    """
+    eval_args = obj._evaluate_args()
+    start = eval_args['start_u']
+    stop = eval_args['stop_u']
+
+    # Find the starting parameters from the nearest seed points
+    seed_args = dict(eval_args, sample_size=max(int(sample_size), 2))
+    seeds = utilities.linspace(start, stop, seed_args['sample_size'], decimals=eval_args['precision'])
+    seed_pts, nearest = _closest_point_seeds(obj, points, seed_args)
+    params = [seeds[idx] for idx in nearest]
+
+    # Refine the unconverged parameters
+    active = list(range(len(points)))
+    for _ in range(max_iter):
+        if not active:
+            break
+        ders = obj.evaluator.derivatives(knots=[params[idx] for idx in active], deriv_order=2, **eval_args)
+        unconverged = []
+        for idx, ck in zip(active, ders):
+            params[idx], converged = _closest_point_curve_step(ck, points[idx], params[idx], start, stop, tol)
+            if not converged:
+                unconverged.append(idx)
+        active = unconverged
+
+    return _closest_point_result(obj, points, params, [(seeds[idx], seed_pts[idx]) for idx in nearest], eval_args)
+
+
+def _closest_point_curve_step(ders, point, u, start, stop, tol):
+    """ Applies a single Newton iteration to the curve parameter of the input point.
+
+    :param ders: curve derivatives up to 2nd order at the parameter
+    :type ders: list
+    :param point: input point
+    :type point: list, tuple
+    :param u: parameter
+    :type u: float
+    :param start: start of the parametric domain
+    :type start: float
+    :param stop: end of the parametric domain
+    :type stop: float
+    :param tol: point coincidence and zero cosine tolerance
+    :type tol: float
+    :return: updated parameter and convergence status
+    :rtype: tuple
+    """
+    diff = [c - p for c, p in zip(ders[0], point)]
+    dist = utilities.vector_magnitude(diff)
+    mag = utilities.vector_magnitude(ders[1])
+
+    # Check point coincidence and zero cosine
+    if dist <= tol or mag == 0.0:
+        return u, True
+    f = utilities.vector_dot(ders[1], diff)
+    if abs(f) / (mag * dist) <= tol:
+        return u, True
+
+    df = utilities.vector_dot(ders[2], diff) + (mag ** 2)
+    if df == 0.0:
+        return u, True
+    u_new = min(max(u - (f / df), start), stop)
+
+    # Check if the parameter is changing significantly
+    return u_new, abs(u_new - u) * mag <= tol
+
+
+def _closest_point_surface(obj, points, tol, max_iter, sample_size):
+    """ Finds the closest points on the surface to the input points.
+
+    :param obj: input surface
+    :type obj: BSpline.Surface or NURBS.Surface
+    :param points: list of points
+    :type points: list, tuple
+    :param tol: point coincidence and zero cosine tolerance
+    :type tol: float
+    :param max_iter: maximum number of Newton iterations
+    :type max_iter: int
+    :param sample_size: number of the seed parameters on the u- and v-directions
+    :type sample_size: list, tuple
+    :return: parameters, closest points and distances
+    :rtype: tuple
+    """
+    eval_args = obj._evaluate_args()
+    bounds = (eval_args['start_u'], eval_args['stop_u'], eval_args['start_v'], eval_args['stop_v'])
+
+    # Find the starting parameters from the nearest seed points
+    seed_args = dict(eval_args, sample_size=(max(int(sample_size[0]), 2), max(int(sample_size[1]), 2)))
+    knots_u = utilities.linspace(bounds[0], bounds[1], seed_args['sample_size'][0], decimals=eval_args['precision'])
+    knots_v = utilities.linspace(bounds[2], bounds[3], seed_args['sample_size'][1], decimals=eval_args['precision'])
+    seeds = [(u, v) for u in knots_u for v in knots_v]
+    seed_pts, nearest = _closest_point_seeds(obj, points, seed_args)
+    params = [seeds[idx] for idx in nearest]
+
+    # Refine the unconverged parameters
+    active = list(range(len(points)))
+    for _ in range(max_iter):
+        if not active:
+            break
+        ders = obj.evaluator.derivatives(knots=[params[idx] for idx in active], deriv_order=2, **eval_args)
+        unconverged = []
+        for idx, skl in zip(active, ders):
+            params[idx], converged = _closest_point_surface_step(skl, points[idx], params[idx], bounds, tol)
+            if not converged:
+                unconverged.append(idx)
+        active = unconverged
+
+    return _closest_point_result(obj, points, params, [(seeds[idx], seed_pts[idx]) for idx in nearest], eval_args)
+
+
+def _closest_point_surface_step(ders, point, uv, bounds, tol):
+    """ Applies a single Newton iteration to the surface parameters of the input point.
+
+    A parameter on the domain boundary is fixed while the distance decreases outwards, and the Newton iteration is
+    applied to the other parameter along the boundary.
+
+    :param ders: surface derivatives up to 2nd order at the parameters
+    :type ders: list
+    :param point: input point
+    :type point: list, tuple
+    :param uv: parameter pair (u, v)
+    :type uv: tuple
+    :param bounds: parametric domain as (start_u, stop_u, start_v, stop_v)
+    :type bounds: tuple
+    :param tol: point coincidence and zero cosine tolerance
+    :type tol: float
+    :return: updated parameters and convergence status
+    :rtype: tuple
+    """
+    diff = [s - p for s, p in zip(ders[0][0], point)]
+    dist = utilities.vector_magnitude(diff)
+
+    # Check point coincidence
+    if dist <= tol:
+        return uv, True
+
+    su = ders[1][0]
+    sv = ders[0][1]
+    mag_u = utilities.vector_magnitude(su)
+    mag_v = utilities.vector_magnitude(sv)
+    f = utilities.vector_dot(su, diff)
+    g = utilities.vector_dot(sv, diff)
+
+    # Fix the parameters on the domain boundary if the distance decreases outwards
+    fixed_u = (uv[0] <= bounds[0] and f > 0.0) or (uv[0] >= bounds[1] and f < 0.0)
+    fixed_v = (uv[1] <= bounds[2] and g > 0.0) or (uv[1] >= bounds[3] and g < 0.0)
+
+    # Check zero cosine of the projected gradient, a degenerate partial derivative does not define a direction
+    cos_u = abs(f) / (mag_u * dist) if mag_u > 0.0 and not fixed_u else 0.0
+    cos_v = abs(g) / (mag_v * dist) if mag_v > 0.0 and not fixed_v else 0.0
+    if cos_u <= tol and cos_v <= tol:
+        return uv, True
+
+    j11 = (mag_u ** 2) + utilities.vector_dot(diff, ders[2][0])
+    j12 = utilities.vector_dot(su, sv) + utilities.vector_dot(diff, ders[1][1])
+    j22 = (mag_v ** 2) + utilities.vector_dot(diff, ders[0][2])
+    if fixed_u:
+        # Newton step on the v-direction along the boundary
+        if j22 == 0.0:
+            return uv, True
+        u_new = uv[0]
+        v_new = min(max(uv[1] - (g / j22), bounds[2]), bounds[3])
+    elif fixed_v:
+        # Newton step on the u-direction along the boundary
+        if j11 == 0.0:
+            return uv, True
+        u_new = min(max(uv[0] - (f / j11), bounds[0]), bounds[1])
+        v_new = uv[1]
+    else:
+        # Solve the 2x2 Newton system
+        det = (j11 * j22) - (j12 * j12)
+        if det == 0.0:
+            return uv, True
+        u_new = min(max(uv[0] - (((j22 * f) - (j12 * g)) / det), bounds[0]), bounds[1])
+        v_new = min(max(uv[1] - (((j11 * g) - (j12 * f)) / det), bounds[2]), bounds[3])
+
+    # Check if the parameters are changing significantly
+    step = [((u_new - uv[0]) * du) + ((v_new - uv[1]) * dv) for du, dv in zip(su, sv)]
+    return (u_new, v_new), utilities.vector_magnitude(step) <= tol
+
+
+def _closest_point_seeds(obj, points, seed_args):
+    """ Evaluates the seed grid and finds the nearest seed points to the input points.
+
+    :param obj: input shape
+    :type obj: Abstract.Curve or Abstract.Surface
+    :param points: list of points
+    :type points: list, tuple
+    :param seed_args: keyword arguments of the evaluator for the seed grid
+    :type seed_args: dict
+    :return: evaluated seed points and the index of the nearest seed point for each input point
+    :rtype: tuple
+    """
+    seed_pts = obj.evaluator.evaluate(**seed_args)
+    tree = _kdtree_build(seed_pts)
+    return seed_pts, [_kdtree_nearest(tree, seed_pts, pt) for pt in points]
+
+
+def _closest_point_evaluate(obj, params, eval_args):
+    """ Evaluates the shape at the input list of parameters.
+
+    :param obj: input shape
+    :type obj: Abstract.Curve or Abstract.Surface
+    :param params: list of parameters
+    :type params: list
+    :param eval_args: keyword arguments of the evaluator
+    :type eval_args: dict
+    :return: list of evaluated points
+    :rtype: list
+    """
+    ders = obj.evaluator.derivatives(knots=params, deriv_order=0, **eval_args)
+    if isinstance(obj, Abstract.Curve):
+        return [tuple(ck[0]) for ck in ders]
+    return [tuple(skl[0][0]) for skl in ders]
+
+
+def _closest_point_result(obj, points, params, nearest, eval_args):
+    """ Evaluates the closest points and the distances at the refined parameters.
+
+    The Newton iterations might converge to a point which is farther than the nearest seed point, e.g. a local
+    minimum. In that case, the nearest seed point is used.
+
+    :param obj: input shape
+    :type obj: Abstract.Curve or Abstract.Surface
+    :param points: list of points
+    :type points: list, tuple
+    :param params: list of refined parameters
+    :type params: list
+    :param nearest: list of the nearest seed parameters and points
+    :type nearest: list
+    :param eval_args: keyword arguments of the evaluator
+    :type eval_args: dict
+    :return: parameters, closest points and distances
+    :rtype: tuple
+    """
+    closest = _closest_point_evaluate(obj, params, eval_args)
+    distances = [utilities.point_distance(cpt, pt) for cpt, pt in zip(closest, points)]
+
+    # Compare with the nearest seed points
+    for idx, (pt, (seed, seed_pt)) in enumerate(zip(points, nearest)):
+        seed_dist = utilities.point_distance(seed_pt, pt)
+        if seed_dist < distances[idx]:
+            params[idx] = seed
+            closest[idx] = seed_pt
+            distances[idx] = seed_dist
+
+    return params, closest, distances
+
+
+def _kdtree_build(points):
+    """ Builds a k-d tree over the input points.
+
+    The tree is stored implicitly as a permutation of the point indices. The median point of the index range
+    [lo, hi) is the node which splits the range and the splitting axis cycles with the depth.
+
+    :param points: list of points
+    :type points: list, tuple
+    :return: permutation of the point indices
+    :rtype: list
+    """
+    dimension = len(points[0])
+    order = list(range(len(points)))
+    ranges = [(0, len(order), 0)]
+    while ranges:
+        lo, hi, depth = ranges.pop()
+        if hi - lo <= 1:
+            continue
+        axis = depth % dimension
+        order[lo:hi] = sorted(order[lo:hi], key=lambda idx: points[idx][axis])
+        mid = (lo + hi) // 2
+        ranges.append((lo, mid, depth + 1))
+        ranges.append((mid + 1, hi, depth + 1))
+    return order
+
+
+def _kdtree_nearest(tree, points, point):
+    """ Finds the index of the nearest point to the input point using the k-d tree.
+
+    :param tree: k-d tree generated by :py:func:`_kdtree_build`
+    :type tree: list
+    :param points: list of points used for building the tree
+    :type points: list, tuple
+    :param point: input point
+    :type point: list, tuple
+    :return: index of the nearest point
+    :rtype: int
+    """
+    dimension = len(points[0])
+    best = [-1, float('inf')]
+
+    def search(lo, hi, depth):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        idx = tree[mid]
+        dist = sum([(c - p) ** 2 for c, p in zip(points[idx], point)])
+        if dist < best[1]:
+            best[:] = [idx, dist]
+        axis = depth % dimension
+        diff = point[axis] - points[idx][axis]
+        if diff < 0:
+            search(lo, mid, depth + 1)
+            if diff ** 2 < best[1]:
+                search(mid + 1, hi, depth + 1)
+        else:
+            search(mid + 1, hi, depth + 1)
+            if diff ** 2 < best[1]:
+                search(lo, mid, depth + 1)
+
+    search(0, len(tree), 0)
+    return best[0]
+
+
+def intersect_ray(obj, origins, directions, **kwargs):
+    """ Finds the nearest intersections of the rays with the surfaces.
+
+    The surfaces are decomposed into Bezier patches, which are indexed by a :py:class:`.bvh.BVH` instance. For each
+    ray, the patches hit by the ray are subdivided recursively and the sub-patches whose control points are not around
+    the ray are discarded. The control points are projected onto the two planes intersecting at the ray, which makes
+    the test 2-dimensional. The centers of the remaining sub-patches are refined by the Newton iterations, which are
+    applied to all seeds of a patch together.
+
+    The rays are defined as ``origin + t * direction``. A single direction can be used with multiple origins, e.g.
+    parallel rays, and a single origin can be used with multiple directions, e.g. rays cast from a view point.
+
+    Keyword Arguments:
+
+        * ``t_min``: minimum ray parameter of the intersections. *Default: 0.0*
+        * ``t_max``: maximum ray parameter of the intersections. *Default: infinity*
+        * ``tol``: maximum distance between the intersection and the ray. *Default: 10e-8*
+        * ``max_depth``: maximum subdivision depth of the Bezier patches. *Default: 6*
+        * ``max_iter``: maximum number of Newton iterations. *Default: 20*
+        * ``bvh``: hierarchy built over the input surfaces, useful for casting rays repeatedly. *Default: None*
+
+    :param obj: input surface or surfaces
+    :type obj: Abstract.Surface or Multi.MultiSurface
+    :param origins: a single origin or a list of origins
+    :type origins: list, tuple
+    :param directions: a single direction or a list of directions
+    :type directions: list, tuple
+    :return: parameters, points and unit normals of the intersections, None for the rays missing the surfaces. The
+        parameters are (u, v) pairs for surfaces and (surface index, u, v) tuples for MultiSurface instances.
+    :rtype: tuple
+    """
+    # Avoid circular import
+    from . import bvh
+
+    t_min = kwargs.get('t_min', 0.0)
+    t_max = kwargs.get('t_max', float('inf'))
+    tol = kwargs.get('tol', 10e-8)
+    max_depth = kwargs.get('max_depth', 6)
+    max_iter = kwargs.get('max_iter', 20)
+    tree = kwargs.get('bvh', None)
+
+    if isinstance(obj, Abstract.Surface):
+        surfaces = [obj]
+    elif isinstance(obj, Abstract.Multi) and all(isinstance(surf, Abstract.Surface) for surf in obj):
+        surfaces = list(obj)
+    else:
+        raise TypeError("The input must be an instance of Abstract.Surface or Multi.MultiSurface")
+    if any(surf.dimension != 3 for surf in surfaces):
+        raise ValueError("Ray intersection requires 3-dimensional surfaces")
+    if tree is None:
+        tree = bvh.BVH(surfaces)
+
+    # Check if the input contains a single ray
+    single_origin = not hasattr(origins[0], '__len__')
+    single_direction = not hasattr(directions[0], '__len__')
+    origins = [origins] if single_origin else origins
+    directions = [directions] if single_direction else directions
+    num_rays = max(len(origins), len(directions))
+    if (len(origins) != num_rays and len(origins) != 1) or (len(directions) != num_rays and len(directions) != 1):
+        raise ValueError("The number of origins and directions must match")
+    if len(origins) == 1:
+        origins = [origins[0] for _ in range(num_rays)]
+    if len(directions) == 1:
+        directions = [directions[0] for _ in range(num_rays)]
+
+    # Find the seed parameters on the patches by subdivision
+    seeds = {}
+    planes = []
+    for ray, (origin, direction) in enumerate(zip(origins, directions)):
+        if len(origin) != 3 or len(direction) != 3:
+            raise ValueError("The ray origins and directions must be 3-dimensional")
+        planes.append(_ray_planes(origin, direction))
+        for _, pidx in tree.query_ray(origin, direction, t_min=t_min, t_max=t_max):
+            net = _ray_project_patch(tree.patches[pidx], origin, planes[ray])
+            for uv in _ray_patch_seeds(net, max_depth, tol):
+                seeds.setdefault(pidx, []).append((ray, uv))
+
+    # Refine the seeds of each patch together and keep the nearest intersection of each ray
+    hits = [None for _ in range(num_rays)]
+    for pidx, patch_seeds in seeds.items():
+        rays = [ray for ray, _ in patch_seeds]
+        results = _ray_patch_newton(tree.patches[pidx], [uv for _, uv in patch_seeds],
+                                    [origins[ray] for ray in rays], [planes[ray] for ray in rays], tol, max_iter)
+        for ray, res in zip(rays, results):
+            if res is None:
+                continue
+            t = utilities.vector_dot(directions[ray], [p - o for p, o in zip(res[1], origins[ray])]) / \
+                utilities.vector_dot(directions[ray], directions[ray])
+            if t_min <= t <= t_max and (hits[ray] is None or t < hits[ray][0]):
+                hits[ray] = (t, pidx, res)
+
+    params = []
+    points = []
+    normals = []
+    for hit in hits:
+        if hit is None:
+            params.append(None)
+            points.append(None)
+            normals.append(None)
+            continue
+        _, pidx, (uv, pt, nvec) = hit
+        uv = tree.shape_params(pidx, uv)
+        params.append(uv if isinstance(obj, Abstract.Surface) else (tree.patch_shape(pidx), uv[0], uv[1]))
+        points.append(pt)
+        normals.append(nvec)
+
+    if single_origin and single_direction:
+        return params[0], points[0], normals[0]
+    return params, points, normals
+
+
+def _ray_planes(origin, direction):
+    """ Generates the normals of two orthogonal planes intersecting at the ray.
+
+    :param origin: origin of the ray
+    :type origin: list, tuple
+    :param direction: direction of the ray
+    :type direction: list, tuple
+    :return: normals of the planes and their distances to the coordinate origin
+    :rtype: tuple
+    """
+    if utilities.vector_is_zero(direction):
+        raise ValueError("The ray direction cannot be a zero vector")
+
+    # Use the coordinate axis which is the most perpendicular to the direction
+    axis = [0.0, 0.0, 0.0]
+    axis[min(range(3), key=lambda i: abs(direction[i]))] = 1.0
+    n1 = utilities.vector_normalize(utilities.vector_cross(direction, axis), decimals=18)
+    n2 = utilities.vector_normalize(utilities.vector_cross(direction, n1), decimals=18)
+    return n1, n2, utilities.vector_dot(n1, origin), utilities.vector_dot(n2, origin)
+
+
+def _ray_project_patch(patch, origin, planes):
+    """ Projects the control points of the Bezier patch onto the planes intersecting at the ray.
+
+    The weighted control points are projected, i.e. the projected points are in homogeneous coordinates.
+
+    :param patch: Bezier patch
+    :type patch: BSpline.Surface or NURBS.Surface
+    :param origin: origin of the ray
+    :type origin: list, tuple
+    :param planes: planes generated by :py:func:`_ray_planes`
+    :type planes: tuple
+    :return: projected control points in [u][v] format
+    :rtype: list
+    """
+    n1, n2, d1, d2 = planes
+    net = []
+    for row in patch._control_points2D:
+        net_row = []
+        for pt in row:
+            w = pt[3] if len(pt) > 3 else 1.0
+            net_row.append((utilities.vector_dot(n1, pt[0:3]) - (w * d1),
+                            utilities.vector_dot(n2, pt[0:3]) - (w * d2), w))
+        net.append(net_row)
+    return net
+
+
+def _ray_patch_seeds(net, max_depth, tol):
+    """ Finds the starting parameters of the Newton iterations by subdividing the projected Bezier patch.
+
+    A sub-patch can intersect the ray only if the convex hull of its projected control points contains the origin of
+    the projection plane. The sub-patches whose bounding boxes of the projected control points do not contain the
+    origin are discarded.
+
+    :param net: projected control points in homogeneous coordinates, [u][v] format
+    :type net: list
+    :param max_depth: maximum subdivision depth
+    :type max_depth: int
+    :param tol: tolerance of the origin containment test
+    :type tol: float
+    :return: list of parameter pairs (u, v) on the patch
+    :rtype: list
+    """
+    seeds = []
+    stack = [(net, 0.0, 1.0, 0.0, 1.0, 0)]
+    while stack:
+        net, u0, u1, v0, v1, depth = stack.pop()
+        xs = [pt[0] / pt[2] for row in net for pt in row]
+        ys = [pt[1] / pt[2] for row in net for pt in row]
+        if min(xs) > tol or max(xs) < -tol or min(ys) > tol or max(ys) < -tol:
+            continue
+        um = 0.5 * (u0 + u1)
+        vm = 0.5 * (v0 + v1)
+        if depth >= max_depth or max(max(xs) - min(xs), max(ys) - min(ys)) <= tol:
+            seeds.append((um, vm))
+            continue
+
+        # Subdivide on the u-direction and then on the v-direction
+        cols = [_split_bezier([row[j] for row in net]) for j in range(len(net[0]))]
+        for half, (us, ue) in enumerate(((u0, um), (um, u1))):
+            rows = [_split_bezier([col[half][i] for col in cols]) for i in range(len(net))]
+            stack.append(([row[0] for row in rows], us, ue, v0, vm, depth + 1))
+            stack.append(([row[1] for row in rows], us, ue, vm, v1, depth + 1))
+    return seeds
+
+
+def _split_bezier(pts):
+    """ Splits the Bezier control points at the parametric midpoint using de Casteljau's algorithm.
+
+    :param pts: control points
+    :type pts: list
+    :return: control points of the first and the second halves
+    :rtype: tuple
+    """
+    left = [pts[0]]
+    right = [pts[-1]]
+    while len(pts) > 1:
+        pts = [tuple([0.5 * (c1 + c2) for c1, c2 in zip(pt1, pt2)]) for pt1, pt2 in zip(pts[:-1], pts[1:])]
+        left.append(pts[0])
+        right.append(pts[-1])
+    return left, right[::-1]
+
+
+def _ray_patch_newton(patch, uvs, origins, planes, tol, max_iter):
+    """ Refines the intersections of the rays with the Bezier patch using the Newton iterations.
+
+    The iterations find the roots of the distances of the surface point to the planes intersecting at the ray. The
+    derivatives of all unconverged seeds are evaluated with a single evaluator call in each iteration.
+
+    :param patch: Bezier patch
+    :type patch: BSpline.Surface or NURBS.Surface
+    :param uvs: seed parameters
+    :type uvs: list
+    :param origins: origins of the rays of the seeds
+    :type origins: list
+    :param planes: planes of the rays of the seeds, generated by :py:func:`_ray_planes`
+    :type planes: list
+    :param tol: maximum distance between the intersection and the ray
+    :type tol: float
+    :param max_iter: maximum number of Newton iterations
+    :type max_iter: int
+    :return: parameters, point and unit normal of the intersection for each seed, None if not converged
+    :rtype: list
+    """
+    eval_args = patch._evaluate_args()
+    uvs = list(uvs)
+    results = [None for _ in uvs]
+    active = list(range(len(uvs)))
+    for _ in range(max_iter + 1):
+        if not active:
+            break
+        ders = patch.evaluator.derivatives(knots=[uvs[idx] for idx in active], deriv_order=1, **eval_args)
+        unconverged = []
+        for idx, skl in zip(active, ders):
+            n1, n2, _, _ = planes[idx]
+            diff = [s - o for s, o in zip(skl[0][0], origins[idx])]
+            f1 = utilities.vector_dot(n1, diff)
+            f2 = utilities.vector_dot(n2, diff)
+
+            # Check if the surface point is on the ray
+            if (f1 ** 2) + (f2 ** 2) <= tol ** 2:
+                nvec = utilities.vector_cross(skl[1][0], skl[0][1])
+                if not utilities.vector_is_zero(nvec):
+                    nvec = utilities.vector_normalize(nvec)
+                results[idx] = (uvs[idx], tuple(skl[0][0]), tuple(nvec))
+                continue
+
+            # Solve the 2x2 Newton system
+            j11 = utilities.vector_dot(n1, skl[1][0])
+            j12 = utilities.vector_dot(n1, skl[0][1])
+            j21 = utilities.vector_dot(n2, skl[1][0])
+            j22 = utilities.vector_dot(n2, skl[0][1])
+            det = (j11 * j22) - (j12 * j21)
+            if det == 0.0:
+                continue
+            u_new = min(max(uvs[idx][0] - (((j22 * f1) - (j12 * f2)) / det), 0.0), 1.0)
+            v_new = min(max(uvs[idx][1] - (((j11 * f2) - (j21 * f1)) / det), 0.0), 1.0)
+            uvs[idx] = (u_new, v_new)
+            unconverged.append(idx)
+        active = unconverged
+    return results
+
+
+def intersect_curves(obj1, obj2, **kwargs):
+    """ Finds the intersections of two curves.
+
+    The curves are decomposed into Bezier segments and the pairs of the segments are subdivided recursively. A pair is
+    discarded, if the convex hulls of the control points cannot intersect, i.e. the bounding boxes of the control
+    points do not overlap or the projections of the control points onto the chords of the segments are separated.
+    The midpoints of the remaining pairs are refined by the Newton iterations.
+
+    Overlapping curves are not supported.
+
+    Keyword Arguments:
+
+        * ``tol``: maximum distance between the curves at the intersections. *Default: 10e-8*
+        * ``max_depth``: maximum subdivision depth of the Bezier segments. *Default: 6*
+        * ``max_iter``: maximum number of Newton iterations. *Default: 20*
+
+    :param obj1: first curve
+    :type obj1: Abstract.Curve
+    :param obj2: second curve
+    :type obj2: Abstract.Curve
+    :return: list of parameter pairs (u1, u2) and list of intersection points, sorted by u1
+    :rtype: tuple
+    """
+    tol = kwargs.get('tol', 10e-8)
+    max_depth = kwargs.get('max_depth', 6)
+    max_iter = kwargs.get('max_iter', 20)
+
+    if not isinstance(obj1, Abstract.Curve) or not isinstance(obj2, Abstract.Curve):
+        raise TypeError("The inputs must be instances of Abstract.Curve")
+    if obj1.dimension != obj2.dimension:
+        raise ValueError("The curves must have the same dimension")
+
+    # Find the seed parameters by subdividing the pairs of Bezier segments
+    seeds = []
+    segments2 = _bezier_segments(obj2)
+    stack = [(seg1, dom1, seg2, dom2, 0) for dom1, seg1 in _bezier_segments(obj1) for dom2, seg2 in segments2]
+    while stack:
+        seg1, dom1, seg2, dom2, depth = stack.pop()
+        pts1 = [[c / pt[-1] for c in pt[:-1]] for pt in seg1]
+        pts2 = [[c / pt[-1] for c in pt[:-1]] for pt in seg2]
+        if not _hulls_overlap(pts1, pts2, tol):
+            continue
+        mid1 = 0.5 * (dom1[0] + dom1[1])
+        mid2 = 0.5 * (dom2[0] + dom2[1])
+        if depth >= max_depth:
+            seeds.append((mid1, mid2))
+            continue
+        halves1 = zip(_split_bezier(seg1), ((dom1[0], mid1), (mid1, dom1[1])))
+        halves2 = list(zip(_split_bezier(seg2), ((dom2[0], mid2), (mid2, dom2[1]))))
+        for sub1, sdom1 in halves1:
+            for sub2, sdom2 in halves2:
+                stack.append((sub1, sdom1, sub2, sdom2, depth + 1))
+
+    # Refine the seeds
+    eval_args1 = obj1._evaluate_args()
+    eval_args2 = obj2._evaluate_args()
+    bounds = (eval_args1['start_u'], eval_args1['stop_u'], eval_args2['start_u'], eval_args2['stop_u'])
+    roots = []
+    for u1, u2 in seeds:
+        for _ in range(max_iter):
+            ck1 = obj1.evaluator.derivatives_single(knot=u1, deriv_order=1, **eval_args1)
+            ck2 = obj2.evaluator.derivatives_single(knot=u2, deriv_order=1, **eval_args2)
+            diff = [c1 - c2 for c1, c2 in zip(ck1[0], ck2[0])]
+            if utilities.vector_magnitude(diff) <= tol:
+                roots.append(((u1, u2), tuple(ck1[0])))
+                break
+
+            # Solve the normal equations of the Gauss-Newton step
+            a11 = utilities.vector_dot(ck1[1], ck1[1])
+            a12 = -utilities.vector_dot(ck1[1], ck2[1])
+            a22 = utilities.vector_dot(ck2[1], ck2[1])
+            b1 = -utilities.vector_dot(ck1[1], diff)
+            b2 = utilities.vector_dot(ck2[1], diff)
+            det = (a11 * a22) - (a12 * a12)
+            if det == 0.0:
+                break
+            u1 = min(max(u1 + (((a22 * b1) - (a12 * b2)) / det), bounds[0]), bounds[1])
+            u2 = min(max(u2 + (((a11 * b2) - (a12 * b1)) / det), bounds[2]), bounds[3])
+
+    # Merge the roots found from the neighboring seeds
+    roots.sort()
+    merge_tol = tol ** 0.5
+    params = []
+    points = []
+    for uv, pt in roots:
+        if params and abs(uv[0] - params[-1][0]) <= merge_tol and abs(uv[1] - params[-1][1]) <= merge_tol:
+            continue
+        params.append(uv)
+        points.append(pt)
+    return params, points
+
+
+def intersect_plane(obj, planes, **kwargs):
+    """ Finds the intersections of the curves with the planes.
+
+    This function is designed for slicing many curves with many planes. The curves are decomposed into Bezier segments
+    and the planes with the same normal are sorted by their offsets. The planes between the extreme projections of the
+    control points of a segment are found by bisection. For each of these planes, the segment is subdivided until the
+    signed distances of the control points change sign only once and the subdivisions on one side of the plane are
+    discarded. The roots are refined by the Newton iterations, which are applied to all roots of a curve together.
+
+    The planes are defined by a point on the plane and the plane normal, i.e. ``(point, normal)``. The segments lying
+    on the planes are skipped.
+
+    Keyword Arguments:
+
+        * ``tol``: maximum distance between the intersections and the planes. *Default: 10e-8*
+        * ``max_depth``: maximum subdivision depth of the Bezier segments. *Default: 10*
+        * ``max_iter``: maximum number of Newton iterations. *Default: 20*
+
+    :param obj: a curve, a MultiCurve instance or a list of curves
+    :type obj: Abstract.Curve, Multi.MultiCurve, list or tuple
+    :param planes: a single plane or a list of planes
+    :type planes: list, tuple
+    :return: curve indices, plane indices, curve parameters and intersection points as flat arrays, sorted by the
+        curve index, the plane index and the parameter
+    :rtype: tuple
+    """
+    tol = kwargs.get('tol', 10e-8)
+    max_depth = kwargs.get('max_depth', 10)
+    max_iter = kwargs.get('max_iter', 20)
+
+    curves = [obj] if isinstance(obj, Abstract.Curve) else list(obj)
+    if not curves or not all(isinstance(curve, Abstract.Curve) for curve in curves):
+        raise TypeError("The input must be a curve or a list of curves")
+    dimension = curves[0].dimension
+    if any(curve.dimension != dimension for curve in curves):
+        raise ValueError("The curves must have the same dimension")
+
+    # Group the planes by their normals and sort them by their offsets
+    if not hasattr(planes[0][0], '__len__'):
+        planes = [planes]
+    groups = {}
+    for pidx, (point, normal) in enumerate(planes):
+        if len(point) != dimension or len(normal) != dimension:
+            raise ValueError("The planes must be " + str(dimension) + " dimensional")
+        if utilities.vector_is_zero(normal):
+            raise ValueError("The plane normal cannot be a zero vector")
+        normal = tuple(utilities.vector_normalize(normal, decimals=18))
+        groups.setdefault(normal, []).append((utilities.vector_dot(normal, point), pidx))
+    groups = [(normal, sorted(offsets)) for normal, offsets in groups.items()]
+    groups = [(normal, [off[0] for off in offsets], [off[1] for off in offsets]) for normal, offsets in groups]
+
+    results = []
+    for cidx, curve in enumerate(curves):
+        # Find the seed parameters
+        seeds = []
+        for dom, seg in _bezier_segments(curve):
+            weights = [pt[-1] for pt in seg]
+            for normal, offsets, ids in groups:
+                proj = [utilities.vector_dot(normal, pt[:-1]) / pt[-1] for pt in seg]
+                start = bisect.bisect_left(offsets, min(proj) - tol)
+                stop = bisect.bisect_right(offsets, max(proj) + tol)
+                for offset, pidx in zip(offsets[start:stop], ids[start:stop]):
+                    coeffs = [(w * (p - offset), w) for p, w in zip(proj, weights)]
+                    for s in _bezier_roots_seeds(coeffs, max_depth, tol):
+                        seeds.append(((normal, offset, pidx), dom[0] + (s * (dom[1] - dom[0]))))
+
+        # Refine the seeds of the curve together
+        eval_args = curve._evaluate_args()
+        params = [u for _, u in seeds]
+        active = list(range(len(seeds)))
+        for _ in range(max_iter + 1):
+            if not active:
+                break
+            ders = curve.evaluator.derivatives(knots=[params[idx] for idx in active], deriv_order=1, **eval_args)
+            unconverged = []
+            for idx, ck in zip(active, ders):
+                normal, offset, pidx = seeds[idx][0]
+                dist = utilities.vector_dot(normal, ck[0]) - offset
+                if abs(dist) <= tol:
+                    results.append((cidx, pidx, params[idx], tuple(ck[0])))
+                    continue
+                slope = utilities.vector_dot(normal, ck[1])
+                if slope == 0.0:
+                    continue
+                params[idx] = min(max(params[idx] - (dist / slope), eval_args['start_u']), eval_args['stop_u'])
+                unconverged.append(idx)
+            active = unconverged
+
+    # Merge the roots found from the neighboring seeds
+    results.sort()
+    merge_tol = tol ** 0.5
+    curve_ids = array('i')
+    plane_ids = array('i')
+    params = array('d')
+    points = []
+    for cidx, pidx, u, pt in results:
+        if points and curve_ids[-1] == cidx and plane_ids[-1] == pidx and abs(params[-1] - u) <= merge_tol:
+            continue
+        curve_ids.append(cidx)
+        plane_ids.append(pidx)
+        params.append(u)
+        points.append(pt)
+    return curve_ids, plane_ids, params, arrays.PointArray(points, dimension=dimension)
+
+
+def _bezier_segments(obj):
+    """ Extracts the Bezier segments of the curve in homogeneous coordinates.
+
+    :param obj: curve
+    :type obj: Abstract.Curve
+    :return: list of parametric domains and control points of the Bezier segments
+    :rtype: list
+    """
+    if obj.rational:
+        ctrlpts = [list(pt) for pt in obj._control_points]
+    else:
+        ctrlpts = [list(pt) + [1.0] for pt in obj._control_points]
+    segments = _decompose_ctrlpts(obj.degree, obj.knotvector, [ctrlpts])[0]
+    knots = sorted(set(obj.knotvector[obj.degree:len(obj.knotvector) - obj.degree]))
+    return list(zip(zip(knots[:-1], knots[1:]), [[tuple(pt) for pt in seg] for seg in segments]))
+
+
+def _hulls_overlap(pts1, pts2, tol):
+    """ Checks if the convex hulls of the input points might overlap.
+
+    The projections of the points onto the coordinate axes and the chords of the point sequences are compared.
+
+    :param pts1: first list of points
+    :type pts1: list
+    :param pts2: second list of points
+    :type pts2: list
+    :param tol: tolerance
+    :type tol: float
+    :return: False if the convex hulls are separated
+    :rtype: bool
+    """
+    for crd1, crd2 in zip(zip(*pts1), zip(*pts2)):
+        if min(crd1) > max(crd2) + tol or min(crd2) > max(crd1) + tol:
+            return False
+    for pts in (pts1, pts2):
+        axis = [c2 - c1 for c1, c2 in zip(pts[0], pts[-1])]
+        if utilities.vector_is_zero(axis):
+            continue
+        axis = utilities.vector_normalize(axis, decimals=18)
+        proj1 = [utilities.vector_dot(axis, pt) for pt in pts1]
+        proj2 = [utilities.vector_dot(axis, pt) for pt in pts2]
+        if min(proj1) > max(proj2) + tol or min(proj2) > max(proj1) + tol:
+            return False
+    return True
+
+
+def _bezier_roots_seeds(coeffs, max_depth, tol):
+    """ Finds the starting parameters of the Newton iterations for the roots of the rational Bezier function.
+
+    The number of the roots is not more than the number of sign changes of the coefficients, i.e. the variation
+    diminishing property. The function is subdivided until the coefficients change sign only once and the subdivisions
+    without any sign changes are discarded. The seed is the root of the control polygon.
+
+    :param coeffs: weighted coefficients and the weights, i.e. (w * c, w)
+    :type coeffs: list
+    :param max_depth: maximum subdivision depth
+    :type max_depth: int
+    :param tol: tolerance
+    :type tol: float
+    :return: list of parameters on [0, 1]
+    :rtype: list
+    """
+    seeds = []
+    stack = [(coeffs, 0.0, 1.0, 0)]
+    while stack:
+        coeffs, s0, s1, depth = stack.pop()
+        vals = [c / w for c, w in coeffs]
+        if min(vals) > tol or max(vals) < -tol or max(abs(v) for v in vals) <= tol:
+            continue
+        changes = [i for i in range(len(vals) - 1) if (vals[i] <= 0.0 < vals[i + 1]) or (vals[i] >= 0.0 > vals[i + 1])]
+        if len(changes) == 1 or depth >= max_depth:
+            # Root of the control polygon
+            i = changes[0] if changes else 0
+            t = (i + (vals[i] / (vals[i] - vals[i + 1]) if vals[i] != vals[i + 1] else 0.5)) / (len(vals) - 1)
+            seeds.append(s0 + (t * (s1 - s0)))
+            continue
+        sm = 0.5 * (s0 + s1)
+        left, right = _split_bezier(coeffs)
+        stack.append((left, s0, sm, depth + 1))
+        stack.append((right, sm, s1, depth + 1))
+    return seeds
+
+
+def length(obj, **kwargs):
+    """ Computes the arc length of the curve.
+
+    The arc length is integrated using the adaptive Gauss-Legendre quadrature. The knot spans are bisected until the
+    quadrature on each interval agrees with the sum of the quadratures on its halves, so that the total error is
+    bounded by the tolerance. The first derivatives at all quadrature points of a subdivision level are evaluated with
+    a single evaluator call. The cumulative arc lengths are stored in the curve as a lookup table, which is also used
+    by :py:func:`.params_at_lengths` and :py:func:`.evaluate_at_lengths`. The table is rebuilt only if a smaller
+    tolerance is requested and it is discarded when the control points, the degree or the knot vector of the curve
+    change.
+
+    Keyword Arguments:
+
+        * ``start_u``: start parameter. *Default: start of the knot vector domain*
+        * ``stop_u``: stop parameter. *Default: end of the knot vector domain*
+        * ``tol``: arc length tolerance. *Default: 10e-8*
+
+    :param obj: Curve
+    :type obj: BSpline.Curve or NURBS.Curve
+    :return: arc length
+    :rtype: float
+    """
+    tol = kwargs.get('tol', 10e-8)
+
+    if not isinstance(obj, Abstract.Curve):
+        raise TypeError("Input shape must be an instance of any Curve class")
+
+    params, lengths = _arc_length_table(obj, tol)[0:2]
+    start_u = kwargs.get('start_u', params[0])
+    stop_u = kwargs.get('stop_u', params[-1])
+    if not params[0] <= start_u <= stop_u <= params[-1]:
+        raise ValueError("The parameters must satisfy start_u <= stop_u in the knot vector domain")
+    if start_u == params[0] and stop_u == params[-1]:
+        return lengths[-1]
+
+    lengths_at = _arc_length_at_params(obj, params, lengths, [start_u, stop_u])
+    return lengths_at[1] - lengths_at[0]
+
+
+def params_at_lengths(obj, lengths, **kwargs):
+    """ Finds the parameters of the curve at the input arc lengths measured from the start of the curve.
+
+    The lookup table of the cumulative arc lengths is searched using bisection, i.e. in O(log n) time for n knot spans.
+    Then, the parameters are refined by the safeguarded Newton iterations on the arc length function, which are applied
+    to all unconverged inputs at once. Please see :py:func:`.length` for the details of the lookup table.
+
+    Keyword Arguments:
+
+        * ``tol``: arc length tolerance. *Default: 10e-8*
+        * ``max_iter``: maximum number of Newton iterations. *Default: 20*
+
+    :param obj: Curve
+    :type obj: BSpline.Curve or NURBS.Curve
+    :param lengths: arc lengths
+    :type lengths: list, tuple
+    :return: parameters
+    :rtype: list
+    """
+    tol = kwargs.get('tol', 10e-8)
+    max_iter = kwargs.get('max_iter', 20)
+
+    if not isinstance(obj, Abstract.Curve):
+        raise TypeError("Input shape must be an instance of any Curve class")
+
+    params, table, table_speeds = _arc_length_table(obj, tol)
+    total = table[-1]
+
+    # Find the table interval of each input arc length
+    targets = []
+    brackets = []
+    res = []
+    for s in lengths:
+        if s < -tol or s > total + tol:
+            raise ValueError("Arc length " + str(s) + " is out of the range [0, " + str(total) + "]")
+        s = min(max(s, 0.0), total)
+        idx = min(max(bisect.bisect_right(table, s) - 1, 0), len(table) - 2)
+        targets.append(s)
+        brackets.append([params[idx], params[idx + 1], idx])
+
+        # Initial guess by the cubic Hermite interpolation of the inverse function, i.e. du/ds = 1 / speed
+        res.append(_arc_length_guess(params[idx:idx + 2], table[idx:idx + 2], table_speeds[idx:idx + 2], s))
+
+    # Refine the parameters
+    eval_args = obj._evaluate_args()
+    nodes, weights = _gauss_legendre(_ARC_LENGTH_ORDER)
+    active = [idx for idx in range(len(res)) if targets[idx] not in (table[brackets[idx][2]], table[-1])]
+    for _ in range(max_iter):
+        if not active:
+            break
+
+        # Evaluate the speed and its derivative at the parameters
+        ders = obj.evaluator.derivatives(knots=[res[idx] for idx in active], deriv_order=2, **eval_args)
+
+        # Evaluate the speed at the quadrature points between the table knots and the parameters
+        knots = []
+        for idx in active:
+            u0 = params[brackets[idx][2]]
+            knots += [u0 + (0.5 * (res[idx] - u0) * (1.0 + node)) for node in nodes]
+        speeds = _arc_length_speeds(obj, knots, eval_args)
+
+        unconverged = []
+        for pos, (idx, ck) in enumerate(zip(active, ders)):
+            lo, hi, tidx = brackets[idx]
+            u0 = params[tidx]
+            sp = speeds[(pos * len(nodes)):((pos + 1) * len(nodes))]
+            diff = table[tidx] + (0.5 * (res[idx] - u0) * sum(w * s for w, s in zip(weights, sp))) - targets[idx]
+            if abs(diff) <= tol:
+                continue
+
+            # Update the bracket and apply the Newton step, or bisect if the step leaves the bracket
+            if diff > 0.0:
+                hi = res[idx]
+            else:
+                lo = res[idx]
+            brackets[idx][0:2] = [lo, hi]
+            speed = sum(c * c for c in ck[1]) ** 0.5
+            u_new = res[idx] - (diff / speed) if speed > 0.0 else lo - 1.0
+            if not lo < u_new < hi:
+                res[idx] = 0.5 * (lo + hi)
+                unconverged.append(idx)
+                continue
+            res[idx] = u_new
+
+            # The Newton step converges if the remainder of the Taylor expansion or the arc length of the bracket is
+            # below the tolerance
+            accel = sum(c1 * c2 for c1, c2 in zip(ck[1], ck[2])) / speed
+            if 0.5 * abs(accel) * ((diff / speed) ** 2) > tol and speed * (hi - lo) > tol:
+                unconverged.append(idx)
+        active = unconverged
+
+    return res
+
+
+def evaluate_at_lengths(obj, lengths, **kwargs):
+    """ Evaluates the curve at the input arc lengths measured from the start of the curve.
+
+    The following example generates 100 points with equal arc length spacing:
+
+    .. code-block:: python
+
+        from geomdl import operations
+        from geomdl import utilities
+
+        curve_length = operations.length(curve)
+        points = operations.evaluate_at_lengths(curve, utilities.linspace(0.0, curve_length, 100, decimals=18))
+
+    Please see :py:func:`.params_at_lengths` for the keyword arguments.
+
+    :param obj: Curve
+    :type obj: BSpline.Curve or NURBS.Curve
+    :param lengths: arc lengths
+    :type lengths: list, tuple
+    :return: evaluated points
+    :rtype: list
+    """
+    params = params_at_lengths(obj, lengths, **kwargs)
+    if not params:
+        return []
+    ders = obj.evaluator.derivatives(knots=params, deriv_order=0, **obj._evaluate_args())
+    return [tuple(ck[0]) for ck in ders]
+
+
+# Number of the Gauss-Legendre quadrature points, the initial number of table intervals on each knot span and the
+# maximum number of bisections of the initial intervals
+_ARC_LENGTH_ORDER = 5
+_ARC_LENGTH_DIVISIONS = 4
+_ARC_LENGTH_MAX_DEPTH = 20
+
+
+def _arc_length_table(obj, tol):
+    """ Generates the lookup table of the cumulative arc lengths of the curve.
+
+    Each knot span is divided into equal intervals and the intervals are bisected while the Gauss-Legendre quadrature
+    on the interval and the sum of the quadratures on its halves differ by more than the share of the tolerance
+    proportional to the interval width. The table is cached in the curve with its tolerance.
+
+    :param obj: Curve
+    :type obj: Abstract.Curve
+    :param tol: arc length tolerance
+    :type tol: float
+    :return: parameters, the cumulative arc lengths and the speeds at the parameters
+    :rtype: tuple
+    """
+    cached = obj._cache.get('arc_length')
+    if cached is not None and cached[0] <= tol:
+        return cached[1]
+
+    # Generate the initial intervals
+    degree = obj.degree
+    kv = obj.knotvector
+    knots = sorted(set(kv[degree:len(kv) - degree]))
+    bounds = [knots[0]]
+    for k0, k1 in zip(knots[:-1], knots[1:]):
+        bounds += [k0 + ((k1 - k0) * float(i) / _ARC_LENGTH_DIVISIONS) for i in range(1, _ARC_LENGTH_DIVISIONS)]
+        bounds.append(k1)
+    intervals = list(zip(bounds[:-1], bounds[1:]))
+    domain = knots[-1] - knots[0]
+
+    # Bisect the intervals until the quadrature error estimates are below the tolerance
+    eval_args = obj._evaluate_args()
+    pending = list(zip(intervals, _arc_length_integrate(obj, intervals, eval_args)))
+    accepted = []
+    depth = 0
+    while pending:
+        halves = []
+        for (u0, u1), _ in pending:
+            um = 0.5 * (u0 + u1)
+            halves += [(u0, um), (um, u1)]
+        values = _arc_length_integrate(obj, halves, eval_args)
+        unconverged = []
+        for idx, (_, whole) in enumerate(pending):
+            left, right = halves[2 * idx], halves[(2 * idx) + 1]
+            len_left, len_right = values[2 * idx], values[(2 * idx) + 1]
+            if abs(whole - (len_left + len_right)) <= tol * (right[1] - left[0]) / domain or \
+                    depth >= _ARC_LENGTH_MAX_DEPTH:
+                accepted += [(left, len_left), (right, len_right)]
+            else:
+                unconverged += [(left, len_left), (right, len_right)]
+        pending = unconverged
+        depth += 1
+    accepted.sort()
+
+    # Accumulate the arc lengths
+    params = [knots[0]]
+    lengths = [0.0]
+    for (_, u1), value in accepted:
+        params.append(u1)
+        lengths.append(lengths[-1] + value)
+
+    table = (params, lengths, _arc_length_speeds(obj, params, eval_args))
+    obj._cache['arc_length'] = (tol, table)
+    return table
+
+
+def _arc_length_integrate(obj, intervals, eval_args):
+    """ Integrates the speed of the curve on the input intervals using the Gauss-Legendre quadrature.
+
+    :param obj: Curve
+    :type obj: Abstract.Curve
+    :param intervals: parameter intervals
+    :type intervals: list
+    :param eval_args: keyword arguments of the evaluator
+    :type eval_args: dict
+    :return: arc lengths of the intervals
+    :rtype: list
+    """
+    nodes, weights = _gauss_legendre(_ARC_LENGTH_ORDER)
+    qpts = [u0 + (0.5 * (u1 - u0) * (1.0 + node)) for u0, u1 in intervals for node in nodes]
+    speeds = _arc_length_speeds(obj, qpts, eval_args)
+    res = []
+    for idx, (u0, u1) in enumerate(intervals):
+        sp = speeds[(idx * len(nodes)):((idx + 1) * len(nodes))]
+        res.append(0.5 * (u1 - u0) * sum(w * s for w, s in zip(weights, sp)))
+    return res
+
+
+def _arc_length_guess(params, lengths, speeds, s):
+    """ Interpolates the parameter at the arc length on the table interval.
+
+    :param params: parameters at the ends of the table interval
+    :type params: list
+    :param lengths: arc lengths at the ends of the table interval
+    :type lengths: list
+    :param speeds: speeds at the ends of the table interval
+    :type speeds: list
+    :param s: arc length
+    :type s: float
+    :return: parameter
+    :rtype: float
+    """
+    ds = lengths[1] - lengths[0]
+    if ds <= 0.0:
+        return params[0]
+    t = (s - lengths[0]) / ds
+    if speeds[0] <= 0.0 or speeds[1] <= 0.0:
+        # Fall back to the linear interpolation on the singular points
+        return params[0] + (t * (params[1] - params[0]))
+    t2 = t * t
+    t3 = t2 * t
+    u = ((2.0 * t3) - (3.0 * t2) + 1.0) * params[0] + ((t3 - (2.0 * t2) + t) * ds / speeds[0]) + \
+        (((3.0 * t2) - (2.0 * t3)) * params[1]) + ((t3 - t2) * ds / speeds[1])
+    return min(max(u, params[0]), params[1])
+
+
+def _arc_length_at_params(obj, params, lengths, knots):
+    """ Computes the arc lengths at the input parameters using the lookup table.
+
+    :param obj: Curve
+    :type obj: Abstract.Curve
+    :param params: parameters of the lookup table
+    :type params: list
+    :param lengths: cumulative arc lengths of the lookup table
+    :type lengths: list
+    :param knots: input parameters
+    :type knots: list
+    :return: arc lengths at the input parameters
+    :rtype: list
+    """
+    nodes, weights = _gauss_legendre(_ARC_LENGTH_ORDER)
+    indices = [min(max(bisect.bisect_right(params, u) - 1, 0), len(params) - 2) for u in knots]
+    qpts = [params[tidx] + (0.5 * (u - params[tidx]) * (1.0 + node))
+            for u, tidx in zip(knots, indices) for node in nodes]
+    speeds = _arc_length_speeds(obj, qpts, obj._evaluate_args())
+    res = []
+    for idx, (u, tidx) in enumerate(zip(knots, indices)):
+        sp = speeds[(idx * len(nodes)):((idx + 1) * len(nodes))]
+        res.append(lengths[tidx] + (0.5 * (u - params[tidx]) * sum(w * s for w, s in zip(weights, sp))))
+    return res
+
+
+def _arc_length_speeds(obj, knots, eval_args):
+    """ Evaluates the magnitude of the first derivative of the curve at the input parameters.
+
+    :param obj: Curve
+    :type obj: Abstract.Curve
+    :param knots: parameters
+    :type knots: list
+    :param eval_args: keyword arguments of the evaluator
+    :type eval_args: dict
+    :return: magnitudes of the first derivatives
+    :rtype: list
+    """
+    ders = obj.evaluator.derivatives(knots=knots, deriv_order=1, **eval_args)
+    return [sum(c * c for c in ck[1]) ** 0.5 for ck in ders]
+
+
+def _gauss_legendre(order):
+    """ Computes the Gauss-Legendre quadrature points and weights on [-1, 1].
+
+    The roots of the Legendre polynomial are found by the Newton iterations starting from the asymptotic estimates.
+
+    :param order: number of quadrature points
+    :type order: int
+    :return: quadrature points and weights
+    :rtype: tuple
+    """
+    nodes = [0.0 for _ in range(order)]
+    weights = [0.0 for _ in range(order)]
+    for i in range((order + 1) // 2):
+        x = math.cos(math.pi * (i + 0.75) / (order + 0.5))
+        for _ in range(100):
+            p1, dp = _legendre(order, x)
+            dx = p1 / dp
+            x -= dx
+            if abs(dx) < 1e-15:
+                break
+        dp = _legendre(order, x)[1]
+        nodes[i] = -x
+        nodes[order - 1 - i] = x
+        weights[i] = weights[order - 1 - i] = 2.0 / ((1.0 - (x * x)) * dp * dp)
+    return nodes, weights
+
+
+def _legendre(order, x):
+    """ Evaluates the Legendre polynomial and its derivative using the three-term recurrence.
+
+    :param order: order of the polynomial
+    :type order: int
+    :param x: parameter on (-1, 1)
+    :type x: float
+    :return: value and derivative of the polynomial
+    :rtype: tuple
+    """
+    p0, p1 = 1.0, x
+    for k in range(2, order + 1):
+        p0, p1 = p1, (((2 * k - 1) * x * p1) - ((k - 1) * p0)) / k
+    if order < 2:
+        return p1, 1.0
+    return p1, order * ((x * p1) - p0) / ((x * x) - 1.0)
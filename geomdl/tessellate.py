@@ -7,14 +7,18 @@
 
 """
 
+import bisect
+import math
 from . import Abstract
+from . import elements
 from . import utilities
 
 
 class TriangularTessellate(Abstract.Tessellate):
     """  Triangular tessellation algorithm for surfaces.
 
-    This class provides the default triangular tessellation algorithm for surfaces.
+    This class provides the default triangular tessellation algorithm for surfaces. The results are stored in a
+    :py:class:`.elements.TriangleMesh` instance, which is accessible via :py:attr:`~mesh` property.
     """
 
     def __init__(self, **kwargs):
@@ -34,4 +38,221 @@ class TriangularTessellate(Abstract.Tessellate):
         super(TriangularTessellate, self).tessellate(points, size_u, size_v, **kwargs)
 
         # Apply default triangular mesh generator function
-        self._vertices, self._triangles = utilities.make_triangle_mesh(points, size_u, size_v, **kwargs)
+        if kwargs.get('tessellate_func') is None:
+            vertices, triangles, vertices_uv = utilities.make_triangle_mesh(points, size_u, size_v, index_array=True,
+                                                                            **kwargs)
+            self._mesh = elements.TriangleMesh(points=vertices, uvs=vertices_uv, triangles=triangles)
+        else:
+            vertices, triangles = utilities.make_triangle_mesh(points, size_u, size_v, **kwargs)
+            self._mesh = elements.TriangleMesh.from_elements(vertices, triangles)
+
+        # Vertex and triangle views
+        self._vertices = self._mesh.vertices
+        self._triangles = self._mesh.triangles
+
+    def tessellate_index_array(self, points, size_u, size_v, **kwargs):
+        """ Applies triangular tessellation and generates index arrays.
+
+        :param points: points to be triangulated
+        :type points: list, tuple
+        :param size_u: number of points on the u-direction
+        :type size_u: int
+        :param size_v: number of points on the v-direction
+        :type size_v: int
+        :return: a tuple containing the vertex coordinates, the zero-indexed vertex indices of the triangles and the
+            parametric coordinates of the vertices
+        :rtype: tuple
+        """
+        # Custom tessellation functions work with the vertex and triangle objects
+        if kwargs.get('tessellate_func') is not None:
+            return super(TriangularTessellate, self).tessellate_index_array(points, size_u, size_v, **kwargs)
+
+        return utilities.make_triangle_mesh(points, size_u, size_v, index_array=True, **kwargs)
+
+
+class AdaptiveTessellate(Abstract.Tessellate):
+    """ Adaptive triangular tessellation algorithm for surfaces.
+
+    This class starts from the knot spans of the surface and recursively subdivides the parametric domain into quads
+    until the chordal deviation and the normal deviation of each quad are within the given tolerances. The chordal
+    deviation is estimated as the distance between the surface points at the center and the edge midpoints of a quad
+    and their bilinear approximations. The normal deviation is the angle between the surface normals at the corners,
+    the edge midpoints and the center of a quad. The surface points and normals are computed using the derivative
+    evaluators of the surface.
+
+    The quads next to the larger quads are triangulated as a fan around their centers using the vertices lying on
+    their edges, i.e. the T-junctions are stitched and the generated mesh is watertight. The remaining quads are split
+    into two triangles in the same way as :py:class:`.TriangularTessellate`. The results are stored in a
+    :py:class:`.elements.TriangleMesh` instance.
+
+    This algorithm ignores the sample size of the surface and the trim curves. It works with the surfaces providing
+    ``evaluator`` and ``eval_args`` keyword arguments, e.g. B-Spline and NURBS surfaces.
+
+    Keyword Arguments:
+        * ``tolerance``: maximum chordal deviation. *Default: 0.01*
+        * ``normal_tolerance``: maximum normal deviation in degrees. *Default: 15*
+        * ``min_depth``: minimum number of subdivisions of the knot spans. *Default: 1*
+        * ``max_depth``: maximum number of subdivisions of the knot spans. *Default: 8*
+    """
+
+    def __init__(self, **kwargs):
+        super(AdaptiveTessellate, self).__init__(**kwargs)
+        self._tolerance = float(kwargs.get('tolerance', 0.01))
+        self._normal_tolerance = float(kwargs.get('normal_tolerance', 15.0))
+        self._min_depth = int(kwargs.get('min_depth', 1))
+        self._max_depth = int(kwargs.get('max_depth', 8))
+        if self._tolerance <= 0.0 or self._normal_tolerance <= 0.0:
+            raise ValueError("Tolerance values must be bigger than zero")
+        if not 0 <= self._min_depth <= self._max_depth:
+            raise ValueError("Minimum depth must be between 0 and the maximum depth")
+
+    @property
+    def tolerance(self):
+        """ Maximum chordal deviation.
+
+        :getter: Gets the tolerance
+        :type: float
+        """
+        return self._tolerance
+
+    @property
+    def normal_tolerance(self):
+        """ Maximum normal deviation in degrees.
+
+        :getter: Gets the tolerance
+        :type: float
+        """
+        return self._normal_tolerance
+
+    @property
+    def vertices_evaluated(self):
+        """ Checks if the tessellation algorithm computes the final vertex coordinates.
+
+        :getter: Gets the flag
+        :type: bool
+        """
+        return True
+
+    def tessellate(self, points, size_u, size_v, **kwargs):
+        """ Applies adaptive triangular tessellation.
+
+        :param points: points to be triangulated
+        :type points: list, tuple
+        :param size_u: number of points on the u-direction
+        :type size_u: int
+        :param size_v: number of points on the v-direction
+        :type size_v: int
+        """
+        # Call parent function
+        super(AdaptiveTessellate, self).tessellate(points, size_u, size_v, **kwargs)
+
+        evaluator = kwargs.get('evaluator')
+        eval_args = kwargs.get('eval_args')
+        if evaluator is None or eval_args is None:
+            raise ValueError("Adaptive tessellation requires the surface evaluator and its arguments")
+
+        # Surface points and unit normals
+        surface_points = {}
+
+        def surface_point(u, v):
+            uv = (u, v)
+            if uv not in surface_points:
+                skl = evaluator.derivatives_single(knot_u=u, knot_v=v, deriv_order=1, **eval_args)
+                nvec = utilities.vector_cross(skl[1][0], skl[0][1])
+                nlen = math.sqrt(sum(n ** 2 for n in nvec))
+                surface_points[uv] = (skl[0][0], [n / nlen for n in nvec] if nlen > 0.0 else None)
+            return surface_points[uv]
+
+        # Subdivide the knot spans
+        cos_tol = math.cos(math.radians(self._normal_tolerance))
+        knots_u = _knot_spans(eval_args['knotvector_u'], eval_args['start_u'], eval_args['stop_u'])
+        knots_v = _knot_spans(eval_args['knotvector_v'], eval_args['start_v'], eval_args['stop_v'])
+        quads = [(u0, v0, u1, v1, 0) for u0, u1 in zip(knots_u[:-1], knots_u[1:])
+                 for v0, v1 in zip(knots_v[:-1], knots_v[1:])]
+        leaves = []
+        while quads:
+            u0, v0, u1, v1, depth = quads.pop()
+            if depth < self._min_depth or \
+                    (depth < self._max_depth and self._subdivide(surface_point, u0, v0, u1, v1, cos_tol)):
+                um = 0.5 * (u0 + u1)
+                vm = 0.5 * (v0 + v1)
+                depth += 1
+                quads += [(u0, v0, um, vm, depth), (u0, vm, um, v1, depth),
+                          (um, vm, u1, v1, depth), (um, v0, u1, vm, depth)]
+            else:
+                leaves.append((u0, v0, u1, v1))
+
+        # Collect the quad corners on the iso-parametric lines for finding the T-junctions
+        lines_u = {}  # v -> u values
+        lines_v = {}  # u -> v values
+        for u0, v0, u1, v1 in leaves:
+            for u, v in ((u0, v0), (u0, v1), (u1, v1), (u1, v0)):
+                lines_u.setdefault(v, set()).add(u)
+                lines_v.setdefault(u, set()).add(v)
+        lines_u = {k: sorted(vals) for k, vals in lines_u.items()}
+        lines_v = {k: sorted(vals) for k, vals in lines_v.items()}
+
+        # Generate the mesh
+        vertex_index = {}
+        vertices = []
+        vertices_uv = []
+
+        def vertex_id(u, v):
+            uv = (u, v)
+            if uv not in vertex_index:
+                vertex_index[uv] = len(vertices)
+                vertices.append(surface_point(u, v)[0])
+                vertices_uv.append(uv)
+            return vertex_index[uv]
+
+        triangles = []
+        for u0, v0, u1, v1 in sorted(leaves):
+            # Vertices on the edges, please see utilities.make_triangle_mesh for the organization of a quad
+            polygon = [(u0, v0)] + [(u0, v) for v in _values_between(lines_v[u0], v0, v1)] + \
+                [(u0, v1)] + [(u, v1) for u in _values_between(lines_u[v1], u0, u1)] + \
+                [(u1, v1)] + [(u1, v) for v in reversed(_values_between(lines_v[u1], v0, v1))] + \
+                [(u1, v0)] + [(u, v0) for u in reversed(_values_between(lines_u[v0], u0, u1))]
+            vids = [vertex_id(u, v) for u, v in polygon]
+            if len(vids) == 4:
+                triangles += [(vids[0], vids[1], vids[2]), (vids[0], vids[2], vids[3])]
+            else:
+                center = vertex_id(0.5 * (u0 + u1), 0.5 * (v0 + v1))
+                triangles += [(center, vids[idx - 1], vids[idx]) for idx in range(1, len(vids))]
+                triangles.append((center, vids[-1], vids[0]))
+
+        self._mesh = elements.TriangleMesh(points=vertices, uvs=vertices_uv, triangles=triangles)
+        self._vertices = self._mesh.vertices
+        self._triangles = self._mesh.triangles
+
+    def _subdivide(self, surface_point, u0, v0, u1, v1, cos_tol):
+        """ Checks if the quad exceeds the chordal deviation or the normal deviation tolerances. """
+        um = 0.5 * (u0 + u1)
+        vm = 0.5 * (v0 + v1)
+        corners = [surface_point(u, v) for u, v in ((u0, v0), (u0, v1), (u1, v1), (u1, v0))]
+        center = surface_point(um, vm)
+        midpoints = [surface_point(u, v) for u, v in ((u0, vm), (um, v1), (u1, vm), (um, v0))]
+
+        # Chordal deviation
+        chords = [[0.25 * sum(c) for c in zip(*[pt for pt, _ in corners])]]
+        chords += [[0.5 * (c1 + c2) for c1, c2 in zip(corners[idx - 1][0], corners[idx][0])] for idx in range(4)]
+        for (pt, _), chord in zip([center] + midpoints[-1:] + midpoints[:-1], chords):
+            if utilities.point_distance(pt, chord) > self._tolerance:
+                return True
+
+        # Normal deviation
+        if center[1] is None:
+            return False
+        for _, nvec in corners + midpoints:
+            if nvec is not None and utilities.vector_dot(center[1], nvec) < cos_tol:
+                return True
+        return False
+
+
+def _knot_spans(knot_vector, start, stop):
+    """ Finds the distinct knots in the given parametric range including the range boundaries. """
+    return [start] + sorted(set(k for k in knot_vector if start < k < stop)) + [stop]
+
+
+def _values_between(values, start, stop):
+    """ Finds the values in the open interval (start, stop) from the sorted list of values. """
+    return values[bisect.bisect_right(values, start):bisect.bisect_left(values, stop)]
@@ -9,6 +9,7 @@
 
 import random
 import math
+from . import arrays
 from .elements import Vertex, Triangle
 
 
@@ -489,6 +490,7 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
     * ``trims``: List of trim curves passed to the tessellation function
     * ``tessellate_func``: Function called for tessellation (default is ``triangular_tessellation``)
     * ``tessellate_args``: Arguments passed to the tessellation function
+    * ``index_array``: Generates index arrays instead of vertex and triangle objects (default is False)
 
     The tessellation function is designed to generate triangles from 4 vertices. It takes 4 :py:class:`.Vertex` objects,
     index values for setting the triangle and vertex IDs and additional parameters as its function arguments.
@@ -498,6 +500,11 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
     The return value of this function is a tuple containing two lists. First one is the list of vertices and the second
     one is the list of triangles.
 
+    If ``index_array`` is True, this function skips generation of the vertex and triangle objects and returns a tuple
+    containing three :py:class:`.arrays.PointArray` instances; the vertex coordinates, the zero-indexed vertex indices
+    of the triangles and the parametric coordinates of the vertices. These arrays can be used for generating a
+    :py:class:`.elements.TriangleMesh`. This mode only works with the default tessellation algorithm.
+
     :param points: input points
     :type points: list, tuple
     :param size_u: number of elements on the u-direction
@@ -536,18 +543,13 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
         return [], tris
 
     def fix_numbering(vertex_list, triangle_list):
-        # Initialize variables
-        final_vertices = []
-
         # Get all vertices inside the triangle list
-        tri_vertex_ids = []
+        tri_vertex_ids = set()
         for tri in triangle_list:
-            tri_vertex_ids += tri.vertex_ids
+            tri_vertex_ids.update(tri.vertex_ids)
 
         # Find vertices used in triangles
-        for vertex in vertex_list:
-            if vertex.id in tri_vertex_ids:
-                final_vertices.append(vertex)
+        final_vertices = [vertex for vertex in vertex_list if vertex.id in tri_vertex_ids]
 
         # Fix vertex numbering (automatically fixes triangle vertex numbering)
         vert_new_id = 1
@@ -563,6 +565,10 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
 
     # Tessellation algorithm
     tsl_func = kwargs.get('tessellate_func')
+    if kwargs.get('index_array', False):
+        if tsl_func is not None:
+            raise ValueError("Index array mode only supports the default tessellation algorithm")
+        return _make_triangle_mesh_index_array(points, size_u, size_v, vertex_spacing)
     if tsl_func is None:
         tsl_func = triangular_tessellation
     tsl_args = kwargs.get('tessellate_args', None)
@@ -572,8 +578,8 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
     tri_idx = 1  # triangle index numbering start
     u_jump = (1.0 / float(size_u - 1)) * vertex_spacing  # for computing vertex parametric u value
     v_jump = (1.0 / float(size_v - 1)) * vertex_spacing  # for computing vertex parametric v value
-    varr_size_u = int(round((float(size_u) / float(vertex_spacing)) + 10e-8))  # vertex array size on the u-direction
-    varr_size_v = int(round((float(size_v) / float(vertex_spacing)) + 10e-8))  # vertex array size on the v-direction
+    varr_size_u = len(range(0, size_u, vertex_spacing))  # vertex array size on the u-direction
+    varr_size_v = len(range(0, size_v, vertex_spacing))  # vertex array size on the v-direction
 
     # Generate vertices directly from input points (preliminary evaluation)
     vertices = [Vertex() for _ in range(varr_size_v * varr_size_u)]
@@ -583,7 +589,7 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
         for j in range(0, size_v, vertex_spacing):
             idx = j + (i * size_v)
             vertices[vrt_idx - 1].id = vrt_idx
-            vertices[vrt_idx - 1].data = points[idx]
+            vertices[vrt_idx - 1].data = list(points[idx])
             vertices[vrt_idx - 1].uv = [u, v]
             vrt_idx += 1
             v += v_jump
@@ -628,6 +634,102 @@ def make_triangle_mesh(points, size_u, size_v, **kwargs):
     return vertices, triangles
 
 
+def _make_triangle_mesh_index_array(points, size_u, size_v, vertex_spacing):
+    """ Generates a triangular mesh from an array of points as index arrays.
+
+    The vertices and the triangles are generated in the same order as :py:func:`.make_triangle_mesh()`, but no vertex
+    or triangle objects are created.
+
+    :param points: input points
+    :type points: list, tuple
+    :param size_u: number of elements on the u-direction
+    :type size_u: int
+    :param size_v: number of elements on the v-direction
+    :type size_v: int
+    :param vertex_spacing: jump value between points
+    :type vertex_spacing: int
+    :return: a tuple containing the vertex coordinates, the zero-indexed triangle vertex indices and the parametric
+        coordinates of the vertices
+    :rtype: tuple
+    """
+    u_jump = (1.0 / float(size_u - 1)) * vertex_spacing  # for computing vertex parametric u value
+    v_jump = (1.0 / float(size_v - 1)) * vertex_spacing  # for computing vertex parametric v value
+    range_u = range(0, size_u, vertex_spacing)
+    range_v = range(0, size_v, vertex_spacing)
+    varr_size_u = len(range_u)  # vertex array size on the u-direction
+    varr_size_v = len(range_v)  # vertex array size on the v-direction
+
+    # Generate vertices directly from input points
+    vertices = arrays.PointArray([points[j + (i * size_v)] for i in range_u for j in range_v], dimension=3)
+    vertices_uv = arrays.PointArray(((i * u_jump, j * v_jump) for i in range(varr_size_u) for j in range(varr_size_v)),
+                                    dimension=2)
+
+    # Generate triangles, please see make_triangle_mesh for the organization of vertices in a quad element
+    def quad_triangles():
+        for i in range(varr_size_u - 1):
+            for j in range(varr_size_v - 1):
+                vertex1 = j + (i * varr_size_v)
+                vertex2 = j + 1 + (i * varr_size_v)
+                vertex3 = j + 1 + ((i + 1) * varr_size_v)
+                vertex4 = j + ((i + 1) * varr_size_v)
+                yield vertex1, vertex2, vertex3
+                yield vertex1, vertex3, vertex4
+    triangles = arrays.PointArray(quad_triangles(), dimension=3, typecode='i')
+
+    return vertices, triangles, vertices_uv
+
+
+def _update_vertices(vertices, points, evaluator, eval_args):
+    """ Updates the spatial coordinates of the tessellation vertices using the evaluated surface points.
+
+    The vertices lying on the evaluation grid take their coordinates from the input points. The remaining vertices,
+    e.g. the ones generated by trimming or a custom tessellation function, are evaluated in a single batch.
+
+    :param vertices: list of vertices
+    :type vertices: list
+    :param points: evaluated surface points
+    :type points: list, tuple
+    :param evaluator: surface evaluator
+    :type evaluator: Abstract.Evaluator
+    :param eval_args: keyword arguments of the evaluator used for evaluating the input points
+    :type eval_args: dict
+    """
+    size_u, size_v = eval_args['sample_size']
+    knots_u = linspace(eval_args['start_u'], eval_args['stop_u'], size_u, decimals=eval_args['precision'])
+    knots_v = linspace(eval_args['start_v'], eval_args['stop_v'], size_v, decimals=eval_args['precision'])
+    tol = 10.0 ** -eval_args['precision']
+
+    def grid_index(knots, knot):
+        """ Finds the index of the knot on the evaluation grid, returns None if the knot is not on the grid. """
+        span = knots[-1] - knots[0]
+        if span <= 0.0:
+            return None
+        idx = int(round((knot - knots[0]) / span * (len(knots) - 1)))
+        if 0 <= idx < len(knots) and abs(knots[idx] - knot) <= tol:
+            return idx
+        return None
+
+    new_vertices = []
+    for vertex in vertices:
+        i = grid_index(knots_u, vertex.uv[0])
+        j = grid_index(knots_v, vertex.uv[1])
+        if i is None or j is None:
+            new_vertices.append(vertex)
+        else:
+            vertex.data = list(points[j + (i * size_v)])
+
+    if new_vertices:
+        knots = [vertex.uv for vertex in new_vertices]
+        if hasattr(evaluator, 'evaluate_list'):
+            new_points = evaluator.evaluate_list(knots=knots, **eval_args)
+        else:
+            # Evaluators which are not derived from Abstract.SurfaceEvaluator
+            new_points = [evaluator.evaluate_single(knot_u=knot_u, knot_v=knot_v, **eval_args)
+                          for knot_u, knot_v in knots]
+        for vertex, pt in zip(new_vertices, new_points):
+            vertex.data = pt
+
+
 def polygon_triangulate(tri_idx, *args):
     """ Triangulates a monotone polygon defined by a list of vertices.
 
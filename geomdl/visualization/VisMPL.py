@@ -381,7 +381,7 @@ class VisSurfTriangle(Abstract.VisAbstractSurf):
     """
     def __init__(self, config=VisConfig()):
         super(VisSurfTriangle, self).__init__(config=config)
-        self._plot_types = {'ctrlpts': 'quads', 'evalpts': 'triangles'}
+        self._plot_types = {'ctrlpts': 'quads', 'evalpts': 'triangle_indices'}
 
     def render(self, **kwargs):
         """ Plots the surface and the control points grid.
@@ -424,12 +424,9 @@ class VisSurfTriangle(Abstract.VisAbstractSurf):
             # Plot evaluated points
             if plot['type'] == 'evalpts':
                 # Use internal triangulation algorithm instead of Qhull (MPL default)
-                verts = plot['ptsarr'][0]
-                tris = plot['ptsarr'][1]
-                # Extract zero-indexed vertex number list
-                tri_idxs = [tri.vertex_ids_zero for tri in tris]
-                # Extract vertex coordinates
-                vert_coords = [vert.data for vert in verts]
+                vert_coords = plot['ptsarr'][0]
+                # Zero-indexed vertex number list
+                tri_idxs = plot['ptsarr'][1]
                 pts = np.array(vert_coords, dtype=self._config.dtype)
                 # Create MPL Triangulation object
                 triangulation = mpltri.Triangulation(pts[:, 0], pts[:, 1], triangles=tri_idxs)
@@ -7,6 +7,7 @@
 """
 from geomdl import BSpline
 from geomdl import evaluators
+from geomdl import operations
 
 GEOMDL_DELTA = 0.001
 OBJECT_INSTANCE = BSpline.Curve
@@ -336,3 +337,31 @@ def test_bspline_curve2d_insert_knot4():
     curve.insert_knot(u, 2)
 
     assert curve.knotvector[5] == u
+
+
+def test_bspline_curve2d_intersect_curves():
+    # Create a curve instance
+    curve1 = OBJECT_INSTANCE()
+    curve1.degree = 3
+    curve1.ctrlpts = CONTROL_POINTS
+    curve1.knotvector = [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+
+    # Create a line crossing the curve twice
+    curve2 = OBJECT_INSTANCE()
+    curve2.degree = 1
+    curve2.ctrlpts = [[0.0, 10.0], [60.0, 10.0]]
+    curve2.knotvector = [0.0, 0.0, 1.0, 1.0]
+
+    params, points = operations.intersect_curves(curve1, curve2)
+    assert len(params) == 2
+    assert params[0][0] < params[1][0]
+    for (u1, u2), pt in zip(params, points):
+        res1 = curve1.curvept(u1)
+        res2 = curve2.curvept(u2)
+        assert abs(pt[1] - 10.0) < GEOMDL_DELTA
+        assert abs(res1[0] - res2[0]) < GEOMDL_DELTA
+        assert abs(res1[1] - res2[1]) < GEOMDL_DELTA
+
+    # Move the line away from the curve
+    curve2.ctrlpts = [[0.0, 20.0], [60.0, 20.0]]
+    assert operations.intersect_curves(curve1, curve2) == ([], [])
@@ -5,8 +5,11 @@
 
     Tests geomdl.BSpline.Curve module. Requires "pytest" to run.
 """
+import pytest
 from geomdl import BSpline
 from geomdl import evaluators
+from geomdl import operations
+from geomdl import utilities
 
 GEOMDL_DELTA = 0.001
 OBJECT_INSTANCE = BSpline.Curve
@@ -321,3 +324,422 @@ def test_bspline_curve3d_insert_knot4():
     assert curve.knotvector[7] == 0.5
     assert curve.knotvector[8] == 0.5
     assert curve.knotvector[10] == 0.7
+
+
+def test_bspline_curve3d_update_ctrlpt():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 4
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+    curve.sample_size = 21
+    evalpts = list(curve.evalpts)
+
+    # Update a control point, only the points in the range [0.3, 1.0] are affected
+    curve.update_ctrlpt(6, [15.0, 0.0, 10.0])
+
+    # Evaluate the curve from scratch
+    ctrlpts = [pt for pt in CONTROL_POINTS]
+    ctrlpts[6] = [15.0, 0.0, 10.0]
+    curve_new = OBJECT_INSTANCE()
+    curve_new.degree = 4
+    curve_new.ctrlpts = ctrlpts
+    curve_new.knotvector = curve.knotvector
+    curve_new.sample_size = 21
+
+    assert curve.ctrlpts == curve_new.ctrlpts
+    assert curve.evalpts == curve_new.evalpts
+    assert curve.evalpts[:6] == evalpts[:6]
+
+
+def test_bspline_curve3d_compact():
+    # Create a curve instance using the compact storage
+    curve = OBJECT_INSTANCE(compact=True)
+    curve.degree = 4
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+    # Create the same curve using lists
+    curve_list = OBJECT_INSTANCE()
+    curve_list.degree = 4
+    curve_list.ctrlpts = CONTROL_POINTS
+    curve_list.knotvector = curve.knotvector
+
+    assert curve.ctrlpts == curve_list.ctrlpts
+    assert curve.evalpts == curve_list.evalpts
+
+    # Knot insertion works on the compact storage
+    curve.insert_knot(0.4)
+    curve_list.insert_knot(0.4)
+    assert curve.ctrlpts == curve_list.ctrlpts
+    assert curve.evalpts == curve_list.evalpts
+
+    # Convert back to lists
+    curve.compact = False
+    assert isinstance(curve.evalpts, list)
+    assert curve.ctrlpts == curve_list.ctrlpts
+
+
+def test_bspline_curve3d_refine_knotvector():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 4
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+    # Insert the same knots one by one
+    curve_ins = OBJECT_INSTANCE()
+    curve_ins.degree = 4
+    curve_ins.ctrlpts = CONTROL_POINTS
+    curve_ins.knotvector = curve.knotvector
+
+    knots = [0.2, 0.6, 0.6, 0.3, 0.95]
+    curve.refine_knotvector(knots)
+    for knot in knots:
+        curve_ins.insert_knot(knot)
+
+    assert curve.knotvector == curve_ins.knotvector
+    for pt, pt_ins in zip(curve.ctrlpts, curve_ins.ctrlpts):
+        assert abs(pt[0] - pt_ins[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - pt_ins[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - pt_ins[2]) < GEOMDL_DELTA
+
+    # Multiplicity of a knot cannot exceed the degree
+    with pytest.raises(ValueError):
+        curve.refine_knotvector([0.6, 0.6, 0.6])
+
+
+def test_bspline_curve3d_decompose():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 4
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+    # Decompose the curve into Bezier segments
+    curves = operations.decompose_curve(curve)
+    assert len(curves) == 6
+
+    # Each segment should match the curve on the corresponding knot span
+    knots = [0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0]
+    for crv, u_start, u_end in zip(curves, knots[:-1], knots[1:]):
+        assert list(crv.knotvector) == [0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0, 1.0]
+        for t in (0.0, 0.5, 1.0):
+            pt = crv.curvept(t)
+            res = curve.curvept(u_start + (u_end - u_start) * t)
+            assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+            assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+            assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_bspline_curve3d_degree_elevate():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 3
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.2, 0.4, 0.4, 0.6, 0.8, 0.9, 1.0, 1.0, 1.0, 1.0]
+
+    # Elevate the degree twice
+    elevated = operations.degree_elevate(curve, 2)
+    assert elevated.degree == 5
+    assert list(elevated.knotvector) == [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.2, 0.2, 0.2, 0.4, 0.4, 0.4, 0.4, 0.6, 0.6,
+                                         0.6, 0.8, 0.8, 0.8, 0.9, 0.9, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]
+    assert len(elevated.ctrlpts) == 22
+
+    # The shape of the curve does not change
+    for u in (0.0, 0.1, 0.3, 0.4, 0.55, 0.9, 1.0):
+        pt = elevated.curvept(u)
+        res = curve.curvept(u)
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_bspline_curve3d_degree_reduce():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 3
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.2, 0.4, 0.4, 0.6, 0.8, 0.9, 1.0, 1.0, 1.0, 1.0]
+
+    # Reduce the degree of the elevated curve
+    reduced = operations.degree_reduce(operations.degree_elevate(curve, 1))
+    assert reduced.degree == 3
+    assert list(reduced.knotvector) == list(curve.knotvector)
+    for pt, res in zip(reduced.ctrlpts, curve.ctrlpts):
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+    # The curve is not degree reducible within the tolerance
+    with pytest.raises(ValueError):
+        operations.degree_reduce(curve)
+
+    # The deviation is bounded by the tolerance
+    reduced = operations.degree_reduce(curve, tol=200.0)
+    assert reduced.degree == 2
+    for u in (0.0, 0.1, 0.3, 0.4, 0.55, 0.9, 1.0):
+        assert utilities.point_distance(reduced.curvept(u), curve.curvept(u)) < 200.0
+
+
+def test_bspline_curve3d_remove_knot():
+    # Create a curve instance
+    refined = OBJECT_INSTANCE()
+    refined.degree = 3
+    refined.ctrlpts = CONTROL_POINTS
+    refined.knotvector = [0.0, 0.0, 0.0, 0.0, 0.2, 0.4, 0.4, 0.6, 0.8, 0.9, 1.0, 1.0, 1.0, 1.0]
+
+    # Insert a knot and remove it
+    refined.insert_knot(0.3, 2)
+    removed = operations.remove_knot(refined, 0.3, 2)
+    assert list(removed.knotvector) == [0.0, 0.0, 0.0, 0.0, 0.2, 0.4, 0.4, 0.6, 0.8, 0.9, 1.0, 1.0, 1.0, 1.0]
+    assert len(removed.ctrlpts) == 10
+
+    # The removal stops at the knots which change the shape of the curve
+    removed = operations.remove_knot(refined, 0.4, 2)
+    assert list(removed.knotvector) == list(refined.knotvector)
+    for u in (0.0, 0.1, 0.25, 0.3, 0.45, 1.0):
+        pt = removed.curvept(u)
+        res = refined.curvept(u)
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+    with pytest.raises(ValueError):
+        operations.remove_knot(refined, 0.35)
+    with pytest.raises(ValueError):
+        operations.remove_knot(refined, 0.0)
+
+
+def test_bspline_curve3d_remove_knot_nearby():
+    # Create a curve instance with a knot close to the knot to be removed
+    curve = OBJECT_INSTANCE()
+    curve.degree = 3
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.3004, 0.4, 0.4, 0.5, 0.5, 0.9, 1.0, 1.0, 1.0, 1.0]
+
+    # Insert a knot next to the existing knot and remove it
+    refined = OBJECT_INSTANCE()
+    refined.degree = 3
+    refined.ctrlpts = CONTROL_POINTS
+    refined.knotvector = curve.knotvector
+    refined.refine_knotvector([0.3])
+    removed = operations.remove_knot(refined, 0.3, 1)
+    assert list(removed.knotvector) == list(curve.knotvector)
+    for u in (0.0, 0.1, 0.3, 0.3002, 0.35, 0.45, 1.0):
+        pt = removed.curvept(u)
+        res = refined.curvept(u)
+        assert utilities.point_distance(pt, res) < 10e-8
+
+    # The distinct nearby knot cannot be removed without changing the shape of the curve
+    removed = operations.remove_knot(refined, 0.3004, 1)
+    assert list(removed.knotvector) == list(refined.knotvector)
+
+
+def test_bspline_curve3d_remove_knots():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 3
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.2, 0.4, 0.4, 0.6, 0.8, 0.9, 1.0, 1.0, 1.0, 1.0]
+
+    # Insert redundant knots
+    refined = operations.degree_elevate(curve, 1)
+    refined.insert_knot(0.1, 2)
+    refined.insert_knot(0.7)
+
+    # Remove all redundant knots
+    removed = operations.remove_knots(refined)
+    assert list(removed.knotvector) == [0.0, 0.0, 0.0, 0.0, 0.0, 0.2, 0.2, 0.4, 0.4, 0.4, 0.6, 0.6, 0.8, 0.8, 0.9,
+                                        0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+    for u in (0.0, 0.1, 0.3, 0.4, 0.55, 0.7, 1.0):
+        pt = removed.curvept(u)
+        res = curve.curvept(u)
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_bspline_curve3d_length():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 3
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.2, 0.4, 0.4, 0.6, 0.8, 0.9, 1.0, 1.0, 1.0, 1.0]
+
+    # Compare with the length of a dense polyline
+    curve.sample_size = 5001
+    points = curve.evalpts
+    res = sum(utilities.point_distance(pt1, pt2) for pt1, pt2 in zip(points[:-1], points[1:]))
+    length = operations.length(curve)
+    assert abs(length - res) < GEOMDL_DELTA
+
+    # The length is additive
+    length1 = operations.length(curve, stop_u=0.45)
+    length2 = operations.length(curve, start_u=0.45)
+    assert abs(length1 + length2 - length) < GEOMDL_DELTA
+
+    # Moving a control point invalidates the arc length table
+    curve.update_ctrlpt(3, [15.0, -5.0, 25.0])
+    assert abs(operations.length(curve) - length) > GEOMDL_DELTA
+
+
+def test_bspline_curve3d_evaluate_at_lengths():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 3
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.2, 0.4, 0.4, 0.6, 0.8, 0.9, 1.0, 1.0, 1.0, 1.0]
+
+    length = operations.length(curve)
+    lengths = [length * i / 10.0 for i in range(11)]
+    params = operations.params_at_lengths(curve, lengths)
+    assert params[0] == 0.0
+    assert params[-1] == 1.0
+
+    # The arc lengths at the parameters match the input
+    for u, res in zip(params[1:-1], lengths[1:-1]):
+        assert abs(operations.length(curve, stop_u=u) - res) < GEOMDL_DELTA
+
+    # Evaluate the points with equal arc length spacing
+    points = curve.evaluate_at_lengths(lengths)
+    assert len(points) == 11
+    for pt, u in zip(points, params):
+        res = curve.curvept(u)
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+    with pytest.raises(ValueError):
+        curve.evaluate_at_lengths([length + 1.0])
+
+
+def test_bspline_curve3d_multi_evaluate_all():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 4
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+    curves = operations.decompose_curve(curve)
+    curves.sample_size = 10
+    curves.evaluate_all(workers=2, backend='thread')
+
+    for crv in curves:
+        evalpts = crv.evalpts
+        crv.evaluate()
+        assert evalpts == crv.evalpts
+
+
+def test_bspline_curve3d_evaluate_adaptive():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 4
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+    # Evaluate curve adaptively
+    knots = curve.evaluate_adaptive(tol=0.01)
+    assert len(knots) == len(curve.evalpts)
+    assert knots[0] == 0.0
+    assert knots[-1] == 1.0
+    for knot, pt in zip(knots, curve.evalpts):
+        res = curve.curvept(knot)
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+    # Check the chordal deviation between the evaluated points
+    for k1, k2, pt1, pt2 in zip(knots[:-1], knots[1:], curve.evalpts[:-1], curve.evalpts[1:]):
+        res = curve.curvept(0.5 * (k1 + k2))
+        assert evaluators._point_segment_distance(res, pt1, pt2) <= 0.01
+
+
+def test_bspline_curve3d_evaluate_adaptive_max_points():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 4
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+    curve.evaluate_adaptive(tol=0.0001, max_points=25)
+    assert len(curve.evalpts) == 25
+
+    with pytest.raises(ValueError):
+        curve.evaluate_adaptive(tol=0.0)
+
+
+def test_bspline_curve3d_closest_point():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 4
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+    params = [0.0, 0.15, 0.333, 0.61, 0.97, 1.0]
+    points = [curve.curvept(u) for u in params]
+
+    res_params, res_points, res_dists = operations.closest_point(curve, points, sample_size=20)
+    for u, pt, res_u, res_pt, res_dist in zip(params, points, res_params, res_points, res_dists):
+        assert abs(u - res_u) < GEOMDL_DELTA
+        assert abs(pt[0] - res_pt[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res_pt[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res_pt[2]) < GEOMDL_DELTA
+        assert res_dist < GEOMDL_DELTA
+
+    # Single point input
+    res_u, res_pt, res_dist = operations.closest_point(curve, points[2])
+    assert abs(res_u - params[2]) < GEOMDL_DELTA
+
+    with pytest.raises(ValueError):
+        operations.closest_point(curve, [1.0, 2.0])
+
+
+def test_bspline_curve3d_intersect_plane():
+    # Create a curve instance
+    curve = OBJECT_INSTANCE()
+    curve.degree = 4
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+    # Slice the curve and its copy with parallel planes
+    curve2 = OBJECT_INSTANCE()
+    curve2.degree = 4
+    curve2.ctrlpts = [[x, y, z + 100.0] for x, y, z in CONTROL_POINTS]
+    curve2.knotvector = curve.knotvector
+    planes = [([0.0, 0.0, 1.0 + (idx * 2.5)], [0.0, 0.0, 2.0]) for idx in range(12)]
+    planes.append(([0.0, 12.0, 0.0], [0.0, 1.0, 0.0]))
+
+    curve_ids, plane_ids, params, points = operations.intersect_plane([curve, curve2], planes)
+    assert len(curve_ids) == len(plane_ids) == len(params) == len(points)
+    # The 2nd curve is above the horizontal planes
+    assert all(pidx == 12 for cidx, pidx in zip(curve_ids, plane_ids) if cidx == 1)
+    for cidx, pidx, u, pt in zip(curve_ids, plane_ids, params, points):
+        res = (curve, curve2)[cidx].curvept(u)
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+        if pidx < 12:
+            assert abs(pt[2] - planes[pidx][0][2]) < GEOMDL_DELTA
+        else:
+            assert abs(pt[1] - 12.0) < GEOMDL_DELTA
+
+    # Check the sign changes of the z-coordinates of the evaluated points
+    curve.sample_size = 1001
+    for pidx in range(12):
+        level = planes[pidx][0][2]
+        crossings = sum(1 for pt1, pt2 in zip(curve.evalpts[:-1], curve.evalpts[1:])
+                        if (pt1[2] - level) * (pt2[2] - level) < 0.0)
+        assert sum(1 for cidx, res in zip(curve_ids, plane_ids) if cidx == 0 and res == pidx) == crossings
+
+
+def test_bspline_curve3d_intersect_plane_error():
+    curve = OBJECT_INSTANCE()
+    curve.degree = 4
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+    with pytest.raises(ValueError):
+        operations.intersect_plane(curve, ([0.0, 0.0], [1.0, 0.0]))
+    with pytest.raises(ValueError):
+        operations.intersect_plane(curve, ([0.0, 0.0, 0.0], [0.0, 0.0, 0.0]))
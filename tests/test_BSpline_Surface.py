@@ -7,6 +7,7 @@
 """
 from geomdl import BSpline
 from geomdl import evaluators
+from geomdl import operations
 
 GEOMDL_DELTA = 0.001
 OBJECT_INSTANCE = BSpline.Surface
@@ -584,3 +585,104 @@ def test_bspline_surface_insert_knot5():
 
     assert surf.knotvector_u[3] == 0.0
     assert surf.knotvector_u[6] == 0.66
+
+
+def test_bspline_surface_refine_knotvector():
+    # Create a surface instance
+    surf = OBJECT_INSTANCE()
+
+    # Set degrees
+    surf.degree_u = 3
+    surf.degree_v = 3
+
+    # Set control points
+    surf.set_ctrlpts(CONTROL_POINTS, 6, 6)
+
+    # Set knot vectors
+    surf.knotvector_u = [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+    surf.knotvector_v = [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+
+    # Refine knot vectors
+    surf.refine_knotvector(knots_u=[0.3, 0.8, 0.3], knots_v=[0.4])
+
+    assert list(surf.knotvector_u) == [0.0, 0.0, 0.0, 0.0, 0.3, 0.3, 0.33, 0.66, 0.8, 1.0, 1.0, 1.0, 1.0]
+    assert list(surf.knotvector_v) == [0.0, 0.0, 0.0, 0.0, 0.33, 0.4, 0.66, 1.0, 1.0, 1.0, 1.0]
+    assert surf.ctrlpts_size_u == 9
+    assert surf.ctrlpts_size_v == 7
+
+    # Evaluate surface
+    evalpt = surf.surfpt(u=0.3, v=0.4)
+
+    assert abs(evalpt[0] - RESULT_LIST[4][0]) < GEOMDL_DELTA
+    assert abs(evalpt[1] - RESULT_LIST[4][1]) < GEOMDL_DELTA
+    assert abs(evalpt[2] - RESULT_LIST[4][2]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_degree_elevate():
+    # Create a surface instance
+    surf = OBJECT_INSTANCE()
+    surf.degree_u = 3
+    surf.degree_v = 2
+    surf.set_ctrlpts(CONTROL_POINTS, 6, 6)
+    surf.knotvector_u = [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+    surf.knotvector_v = [0.0, 0.0, 0.0, 0.25, 0.5, 0.75, 1.0, 1.0, 1.0]
+
+    # Elevate the degree on the v-direction
+    elevated = operations.degree_elevate(surf, 1, direction='v')
+    assert elevated.degree_u == 3
+    assert elevated.degree_v == 3
+    assert elevated.ctrlpts_size_u == 6
+    assert elevated.ctrlpts_size_v == 10
+
+    # Elevate the degree on both directions
+    elevated = operations.degree_elevate(surf, 1)
+    assert elevated.degree_u == 4
+    assert elevated.degree_v == 3
+    assert elevated.ctrlpts_size_u == 9
+    assert elevated.ctrlpts_size_v == 10
+
+    # The shape of the surface does not change
+    for u, v in ((0.0, 0.0), (0.3, 0.4), (0.5, 0.5), (0.9, 0.2), (1.0, 1.0)):
+        evalpt = elevated.surfpt(u, v)
+        res = surf.surfpt(u, v)
+        assert abs(evalpt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(evalpt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(evalpt[2] - res[2]) < GEOMDL_DELTA
+
+    # Reduce the degree back
+    reduced = operations.degree_reduce(elevated)
+    assert reduced.degree_u == 3
+    assert reduced.degree_v == 2
+    for pt, res in zip(reduced.ctrlpts, CONTROL_POINTS):
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_bspline_surface_remove_knots():
+    # Create a surface instance
+    surf = OBJECT_INSTANCE()
+    surf.degree_u = 3
+    surf.degree_v = 3
+    surf.set_ctrlpts(CONTROL_POINTS, 6, 6)
+    surf.knotvector_u = [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+    surf.knotvector_v = [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+
+    # Insert redundant knots
+    surf.insert_knot(u=0.5, v=0.2, ru=2, rv=1)
+
+    # Remove the knot on the v-direction
+    removed = operations.remove_knot(surf, 0.2, direction='v')
+    assert removed.ctrlpts_size_u == 8
+    assert removed.ctrlpts_size_v == 6
+    assert list(removed.knotvector_v) == [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+
+    # Remove all redundant knots
+    removed = operations.remove_knots(surf)
+    assert removed.ctrlpts_size_u == 6
+    assert removed.ctrlpts_size_v == 6
+    assert list(removed.knotvector_u) == [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+    for pt, res in zip(removed.ctrlpts, CONTROL_POINTS):
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
@@ -5,8 +5,11 @@
 
     Tests geomdl.NURBS.Curve module. Requires "pytest" to run.
 """
+import math
+import pickle
 import pytest
 from geomdl import NURBS
+from geomdl import operations
 
 GEOMDL_DELTA = 0.001
 
@@ -197,3 +200,92 @@ def test_nurbs_curve2d_insert_knot2(nurbs_curve2):
 
     assert abs(evalpt[0] - res[0]) < GEOMDL_DELTA
     assert abs(evalpt[1] - res[1]) < GEOMDL_DELTA
+
+
+def test_nurbs_curve2d_compact_pickle(nurbs_curve2):
+    nurbs_curve2.compact = True
+
+    # Populate the caches before pickling
+    weights = list(nurbs_curve2.weights)
+    ctrlpts = nurbs_curve2.ctrlpts
+
+    curve = pickle.loads(pickle.dumps(nurbs_curve2))
+    assert list(curve.weights) == weights
+    assert curve.ctrlpts == ctrlpts
+    assert curve.evalpts == nurbs_curve2.evalpts
+
+
+def test_nurbs_curve2d_refine_knotvector(nurbs_curve2):
+    # Populate the caches before the refinement
+    assert len(nurbs_curve2.ctrlpts) == 7
+    assert len(nurbs_curve2.weights) == 7
+
+    # Refine the knot vector
+    nurbs_curve2.refine_knotvector([0.25, 0.7, 0.8])
+
+    assert len(nurbs_curve2.ctrlptsw) == 10
+    assert len(nurbs_curve2.ctrlpts) == 10
+    assert len(nurbs_curve2.weights) == 10
+    for pt, ptw, w in zip(nurbs_curve2.ctrlpts, nurbs_curve2.ctrlptsw, nurbs_curve2.weights):
+        assert abs(ptw[-1] - w) < GEOMDL_DELTA
+        assert abs(pt[0] * w - ptw[0]) < GEOMDL_DELTA
+        assert abs(pt[1] * w - ptw[1]) < GEOMDL_DELTA
+
+
+def test_nurbs_curve2d_degree_elevate_reduce(nurbs_curve2):
+    # Elevate the degree
+    elevated = operations.degree_elevate(nurbs_curve2, 1)
+    assert elevated.degree == 5
+    assert len(elevated.ctrlpts) == 10
+    for u in (0.0, 0.2, 0.33, 0.5, 0.9, 1.0):
+        evalpt = elevated.curvept(u)
+        res = nurbs_curve2.curvept(u)
+        assert abs(evalpt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(evalpt[1] - res[1]) < GEOMDL_DELTA
+
+    # Reduce the degree back
+    reduced = operations.degree_reduce(elevated)
+    assert reduced.degree == 4
+    for pt, res in zip(reduced.ctrlptsw, nurbs_curve2.ctrlptsw):
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_nurbs_curve2d_evaluate_at_lengths():
+    # Create a unit circle
+    curve = NURBS.Curve()
+    curve.degree = 2
+    wgt = 0.5 ** 0.5
+    curve.ctrlptsw = [[1.0, 0.0, 1.0], [wgt, wgt, wgt], [0.0, 1.0, 1.0], [-wgt, wgt, wgt], [-1.0, 0.0, 1.0],
+                      [-wgt, -wgt, wgt], [0.0, -1.0, 1.0], [wgt, -wgt, wgt], [1.0, 0.0, 1.0]]
+    curve.knotvector = [0.0, 0.0, 0.0, 0.25, 0.25, 0.5, 0.5, 0.75, 0.75, 1.0, 1.0, 1.0]
+
+    # Length of the circle
+    assert abs(operations.length(curve) - (2.0 * math.pi)) < GEOMDL_DELTA
+
+    # Points with equal arc length spacing have equal angle spacing
+    points = curve.evaluate_at_lengths([0.3 * i for i in range(20)])
+    for i, pt in enumerate(points):
+        assert abs(pt[0] - math.cos(0.3 * i)) < GEOMDL_DELTA
+        assert abs(pt[1] - math.sin(0.3 * i)) < GEOMDL_DELTA
+
+
+def test_nurbs_curve2d_length_tolerance():
+    # Create a rational cubic curve
+    curve = NURBS.Curve()
+    curve.degree = 3
+    curve.ctrlptsw = [[-0.5, -1.5, 0.5], [-8.0, 8.0, 2.0], [-2.0, 2.5, 0.5], [-6.0, -8.0, 2.0]]
+    curve.knotvector = [0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0]
+
+    # Converged reference value computed by the composite Simpson's rule
+    res = 13.147086649803
+
+    assert abs(operations.length(curve) - res) < GEOMDL_DELTA
+    assert abs(operations.length(curve, tol=10e-12) - res) < 10e-11
+
+    # Arc lengths at the computed parameters
+    lengths = [0.5 * i for i in range(27)]
+    params = operations.params_at_lengths(curve, lengths)
+    for u, s in zip(params, lengths):
+        assert abs(operations.length(curve, stop_u=u) - s) < GEOMDL_DELTA
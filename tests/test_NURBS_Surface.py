@@ -5,8 +5,14 @@
 
     Tests geomdl.NURBS.Surface module. Requires "pytest" to run.
 """
+import copy
+import pickle
 import pytest
+from geomdl import Multi
 from geomdl import NURBS
+from geomdl import operations
+from geomdl import tessellate
+from geomdl import utilities
 
 GEOMDL_DELTA = 0.001
 RESULT_LIST = [[-25.0, -25.0, -10.0], [-25.0, -11.403, -3.385], [-25.0, 25.0, -10.0], [-7.006, -25.0, -5.725],
@@ -456,3 +462,302 @@ def test_nurbs_surface_insert_knot4(nurbs_surface):
     assert abs(evalpt[0] - RESULT_LIST[4][0]) < GEOMDL_DELTA
     assert abs(evalpt[1] - RESULT_LIST[4][1]) < GEOMDL_DELTA
     assert abs(evalpt[2] - RESULT_LIST[4][2]) < GEOMDL_DELTA
+
+
+def test_nurbs_surface_update_ctrlpt(nurbs_surface):
+    nurbs_surface.sample_size = 15
+    nurbs_surface.tessellate()
+
+    # Update a weighted control point
+    nurbs_surface.update_ctrlpt(2, 3, [2.5, 2.5, 10.0, 0.5])
+
+    # Evaluate the surface from scratch
+    ctrlpts = [pt for pt in CONTROL_POINTS]
+    ctrlpts[15] = [2.5, 2.5, 10.0, 0.5]
+    surf = NURBS.Surface()
+    surf.degree_u = 3
+    surf.degree_v = 3
+    surf.set_ctrlpts(ctrlpts, 6, 6)
+    surf.knotvector_u = nurbs_surface.knotvector_u
+    surf.knotvector_v = nurbs_surface.knotvector_v
+    surf.sample_size = 15
+    surf.tessellate()
+
+    assert nurbs_surface.ctrlpts == surf.ctrlpts
+    assert nurbs_surface.weights == surf.weights
+    assert nurbs_surface.evalpts == surf.evalpts
+    assert [vertex.data for vertex in nurbs_surface.tessellator.vertices] == \
+        [vertex.data for vertex in surf.tessellator.vertices]
+
+
+def test_nurbs_surface_refine_knotvector(nurbs_surface):
+    # Populate the caches before the refinement
+    assert len(nurbs_surface.ctrlpts) == 36
+    assert len(nurbs_surface.weights) == 36
+
+    # Refine the knot vectors
+    nurbs_surface.refine_knotvector([0.5], [0.3, 0.6])
+
+    assert len(nurbs_surface.ctrlptsw) == 56
+    assert len(nurbs_surface.ctrlpts) == 56
+    assert len(nurbs_surface.weights) == 56
+    for pt, ptw, w in zip(nurbs_surface.ctrlpts, nurbs_surface.ctrlptsw, nurbs_surface.weights):
+        assert abs(ptw[-1] - w) < GEOMDL_DELTA
+        assert abs(pt[0] * w - ptw[0]) < GEOMDL_DELTA
+        assert abs(pt[1] * w - ptw[1]) < GEOMDL_DELTA
+        assert abs(pt[2] * w - ptw[2]) < GEOMDL_DELTA
+
+
+def test_nurbs_surface_compact(nurbs_surface):
+    # Create the same surface using the compact storage
+    surf = NURBS.Surface(compact=True)
+    surf.degree_u = 3
+    surf.degree_v = 3
+    surf.set_ctrlpts(CONTROL_POINTS, 6, 6)
+    surf.knotvector_u = nurbs_surface.knotvector_u
+    surf.knotvector_v = nurbs_surface.knotvector_v
+
+    assert surf.ctrlptsw == CONTROL_POINTS
+    assert surf.ctrlpts == [pt[:-1] for pt in CONTROL_POINTS]
+    assert list(surf.weights) == list(nurbs_surface.weights)
+    assert surf.evalpts == nurbs_surface.evalpts
+
+    # Weights vector is a view of the weighted control points
+    surf.ctrlptsw[35][3] = 0.5
+    assert surf.weights[-1] == 0.5
+
+
+def test_nurbs_surface_compact_pickle(nurbs_surface):
+    nurbs_surface.compact = True
+
+    # Populate the caches before pickling
+    weights = list(nurbs_surface.weights)
+    ctrlpts = nurbs_surface.ctrlpts
+
+    surf = pickle.loads(pickle.dumps(nurbs_surface))
+    assert list(surf.weights) == weights
+    assert surf.ctrlpts == ctrlpts
+    assert surf.evalpts == nurbs_surface.evalpts
+
+
+def test_nurbs_surface_compact_convert(nurbs_surface):
+    evalpts = nurbs_surface.evalpts
+    nurbs_surface.compact = True
+    assert nurbs_surface.ctrlptsw == CONTROL_POINTS
+    assert nurbs_surface.evalpts == evalpts
+
+    nurbs_surface.transpose()
+    nurbs_surface.compact = False
+    assert isinstance(nurbs_surface.evalpts, list)
+    assert list(nurbs_surface.ctrlpts2d[1][0]) == CONTROL_POINTS[1]
+
+
+def test_nurbs_surface_decompose(nurbs_surface2):
+    # Decompose the surface into Bezier patches
+    surfs = operations.decompose_surface(nurbs_surface2)
+    assert len(surfs) == 9
+
+    # Each patch should match the surface on the corresponding knot spans
+    knots = [0.0, 0.33, 0.66, 1.0]
+    idx = 0
+    for u_start, u_end in zip(knots[:-1], knots[1:]):
+        for v_start, v_end in zip(knots[:-1], knots[1:]):
+            for t in (0.0, 0.5, 1.0):
+                pt = surfs[idx].surfpt(t, t)
+                res = nurbs_surface2.surfpt(u_start + (u_end - u_start) * t, v_start + (v_end - v_start) * t)
+                assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+                assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+                assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+            idx += 1
+
+
+@pytest.mark.parametrize("backend", ['process', 'thread'])
+def test_nurbs_surface_multi_evaluate_all(nurbs_surface2, backend):
+    surfs = operations.decompose_surface(nurbs_surface2)
+    surfs.sample_size = 5
+
+    # Evaluate in parallel
+    surfs.evaluate_all(workers=2, backend=backend, tessellate=True)
+
+    for surf in surfs:
+        evalpts = surf.evalpts
+        vertices = [vertex.data for vertex in surf.tessellator.vertices]
+
+        # Evaluate again in the main process
+        surf.evaluate()
+        surf.tessellate()
+
+        assert evalpts == surf.evalpts
+        assert vertices == [vertex.data for vertex in surf.tessellator.vertices]
+
+
+def test_nurbs_surface_multi_evaluate_all_backend(nurbs_surface2):
+    surfs = operations.decompose_surface(nurbs_surface2)
+    with pytest.raises(ValueError):
+        surfs.evaluate_all(backend='gpu')
+
+
+def test_nurbs_surface_tessellate(nurbs_surface):
+    nurbs_surface.sample_size = 13
+    nurbs_surface.tessellate()
+
+    for vertex in nurbs_surface.tessellator.vertices:
+        res = nurbs_surface.evaluate_single(vertex.uv)
+        assert abs(vertex.x - res[0]) < GEOMDL_DELTA
+        assert abs(vertex.y - res[1]) < GEOMDL_DELTA
+        assert abs(vertex.z - res[2]) < GEOMDL_DELTA
+
+
+def test_nurbs_surface_evaluator_list(nurbs_surface):
+    uv_list = [(0.0, 0.0), (0.2, 0.7), (0.2, 0.35), (0.9, 1.0)]
+    eval_args = nurbs_surface._evaluate_args()
+    computed = nurbs_surface.evaluator.evaluate_list(knots=uv_list, **eval_args)
+
+    for uv, pt in zip(uv_list, computed):
+        res = nurbs_surface.evaluate_single(uv)
+        assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_nurbs_surface_tessellate_adaptive(nurbs_surface):
+    nurbs_surface.tessellator = tessellate.AdaptiveTessellate(tolerance=0.2)
+    nurbs_surface.tessellate()
+    mesh = nurbs_surface.tessellator.mesh
+
+    # The mesh is watertight, i.e. the edges are shared by two triangles, except the ones on the boundary
+    edges = {}
+    for tri in mesh.triangle_indices:
+        for v1, v2 in ((tri[0], tri[1]), (tri[1], tri[2]), (tri[2], tri[0])):
+            edge = (min(v1, v2), max(v1, v2))
+            edges[edge] = edges.get(edge, 0) + 1
+    for (v1, v2), count in edges.items():
+        if count == 1:
+            uv1 = mesh.uvs[v1]
+            uv2 = mesh.uvs[v2]
+            assert (uv1[0] == uv2[0] and uv1[0] in (0.0, 1.0)) or (uv1[1] == uv2[1] and uv1[1] in (0.0, 1.0))
+        else:
+            assert count == 2
+
+    # The vertices are on the surface
+    for vertex in nurbs_surface.tessellator.vertices:
+        res = nurbs_surface.evaluate_single(vertex.uv)
+        assert abs(vertex.x - res[0]) < GEOMDL_DELTA
+        assert abs(vertex.y - res[1]) < GEOMDL_DELTA
+        assert abs(vertex.z - res[2]) < GEOMDL_DELTA
+
+
+def test_nurbs_surface_tessellate_adaptive_tolerance(nurbs_surface):
+    nurbs_surface.tessellator = tessellate.AdaptiveTessellate(tolerance=1.0)
+    nurbs_surface.tessellate()
+    num_coarse = len(nurbs_surface.tessellator.triangles)
+
+    nurbs_surface.tessellator = tessellate.AdaptiveTessellate(tolerance=0.2)
+    nurbs_surface.tessellate()
+    assert len(nurbs_surface.tessellator.triangles) > num_coarse
+
+
+def test_nurbs_surface_tessellate_adaptive_error():
+    with pytest.raises(ValueError):
+        tessellate.AdaptiveTessellate(tolerance=0.0)
+
+
+def test_nurbs_surface_closest_point(nurbs_surface):
+    nurbs_surface.set_ctrlpts(CONTROL_POINTS2, 6, 6)
+    params = [(0.2, 0.3), (0.5, 0.5), (0.75, 0.1), (0.0, 0.4), (0.9, 1.0)]
+
+    # Move the surface points along the surface normals
+    points = []
+    for uv in params:
+        pt, vec = operations.normal(nurbs_surface, uv)
+        points.append([p + (0.5 * v) for p, v in zip(pt, vec)])
+
+    res_params, res_points, res_dists = operations.closest_point(nurbs_surface, points, sample_size=(10, 10))
+    assert len(res_params) == len(params)
+    for uv, res_uv, res_pt, res_dist in zip(params, res_params, res_points, res_dists):
+        assert abs(uv[0] - res_uv[0]) < GEOMDL_DELTA
+        assert abs(uv[1] - res_uv[1]) < GEOMDL_DELTA
+        assert abs(res_dist - 0.5) < GEOMDL_DELTA
+        res = nurbs_surface.evaluate_single(res_uv)
+        assert abs(res_pt[0] - res[0]) < GEOMDL_DELTA
+        assert abs(res_pt[1] - res[1]) < GEOMDL_DELTA
+        assert abs(res_pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_nurbs_surface_closest_point_outside(nurbs_surface):
+    # The closest point of a point outside the domain is on the boundary
+    res_uv, res_pt, res_dist = operations.closest_point(nurbs_surface, [50.0, 0.0, 0.0])
+    assert res_uv[0] == 1.0
+    assert abs(res_pt[0] - 25.0) < GEOMDL_DELTA
+    assert res_dist >= 25.0
+
+
+def test_nurbs_surface_closest_point_edge():
+    # Create a biquadratic surface
+    surf = NURBS.Surface()
+    surf.degree_u = 2
+    surf.degree_v = 2
+    surf.set_ctrlpts([[0.0, 0.0, 0.0, 1.0], [0.0, 0.5, 0.25, 0.5], [0.0, 2.0, 0.0, 1.0], [2.0, 0.0, 1.0, 2.0],
+                      [1.0, 1.0, 1.5, 1.0], [0.5, 1.0, 0.25, 0.5], [2.0, 0.0, 0.0, 1.0], [4.0, 2.0, 1.0, 2.0],
+                      [2.0, 2.2, 0.3, 1.0]], 3, 3)
+    surf.knotvector_u = [0.0, 0.0, 0.0, 1.0, 1.0, 1.0]
+    surf.knotvector_v = [0.0, 0.0, 0.0, 1.0, 1.0, 1.0]
+
+    # The closest points of these points are on the edges of the surface
+    points = [[2.135, 0.365, 0.43], [1.334, 3.087, 0.514], [1.919, 3.045, 1.052], [0.889, -0.547, 0.303]]
+    res_params, res_points, res_dists = operations.closest_point(surf, points)
+
+    # Compare with the closest points of a dense sample of the surface
+    surf.sample_size = 201
+    for pt, uv, dist in zip(points, res_params, res_dists):
+        assert uv[0] in (0.0, 1.0) or uv[1] in (0.0, 1.0)
+        dense_dist = min(utilities.point_distance(evalpt, pt) for evalpt in surf.evalpts)
+        assert dist <= dense_dist
+        assert dense_dist - dist < 10e-5
+
+
+def test_nurbs_surface_intersect_ray(nurbs_surface):
+    nurbs_surface.set_ctrlpts(CONTROL_POINTS2, 6, 6)
+    origins = [[-20.0, 10.0, 20.0], [0.0, 0.0, 20.0], [13.5, -7.25, 20.0], [24.0, 24.0, 20.0]]
+
+    params, points, normals = operations.intersect_ray(nurbs_surface, origins, (0.0, 0.0, -1.0))
+    for origin, uv, pt, nvec in zip(origins, params, points, normals):
+        res = nurbs_surface.evaluate_single(uv)
+        assert abs(origin[0] - res[0]) < GEOMDL_DELTA
+        assert abs(origin[1] - res[1]) < GEOMDL_DELTA
+        assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+        res_pt, res_vec = operations.normal(nurbs_surface, uv)
+        assert abs(nvec[0] - res_vec[0]) < GEOMDL_DELTA
+        assert abs(nvec[1] - res_vec[1]) < GEOMDL_DELTA
+        assert abs(nvec[2] - res_vec[2]) < GEOMDL_DELTA
+
+
+def test_nurbs_surface_intersect_ray_miss(nurbs_surface):
+    # Pointing away from the surface
+    assert operations.intersect_ray(nurbs_surface, [0.0, 0.0, 20.0], [0.0, 0.0, 1.0]) == (None, None, None)
+
+    # Outside the surface
+    params, points, normals = operations.intersect_ray(nurbs_surface, [[30.0, 0.0, 20.0], [0.0, 0.0, 20.0]],
+                                                       [0.0, 0.0, -1.0], t_max=100.0)
+    assert params[0] is None
+    assert params[1] is not None
+
+    # Limited ray parameter
+    assert operations.intersect_ray(nurbs_surface, [0.0, 0.0, 20.0], [0.0, 0.0, -1.0], t_max=10.0)[0] is None
+
+
+def test_nurbs_surface_intersect_ray_multi(nurbs_surface):
+    surf2 = copy.deepcopy(nurbs_surface)
+    surf2.ctrlpts = [[x, y, z + 20.0] for x, y, z in surf2.ctrlpts]
+    multi = Multi.MultiSurface()
+    multi.add(nurbs_surface)
+    multi.add(surf2)
+
+    # The nearest intersection is on the 2nd surface
+    params, points, normals = operations.intersect_ray(multi, [[5.0, 5.0, 50.0], [5.0, 5.0, 5.0]], [0.0, 0.0, -1.0])
+    assert params[0][0] == 1
+    assert params[1][0] == 0
+    assert abs(points[0][2] - points[1][2] - 20.0) < GEOMDL_DELTA
+
+    with pytest.raises(TypeError):
+        operations.intersect_ray([nurbs_surface], [0.0, 0.0, 20.0], [0.0, 0.0, -1.0])
@@ -0,0 +1,104 @@
+"""
+    Tests for the NURBS-Python package
+    Released under The MIT License. See LICENSE file for details.
+    Copyright (c) 2018 Onur Rauf Bingol
+
+    Tests geomdl.arrays module. Requires "pytest" to run.
+"""
+import copy
+import pickle
+import pytest
+from geomdl import arrays
+
+POINTS = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0], [10.0, 11.0, 12.0]]
+
+
+@pytest.fixture
+def point_array():
+    """ Creates a PointArray instance """
+    return arrays.PointArray(POINTS)
+
+
+def test_point_array_init(point_array):
+    assert len(point_array) == 4
+    assert point_array.dimension == 3
+    assert point_array.nbytes == 4 * 3 * 8
+    assert point_array.tolist() == POINTS
+
+
+def test_point_array_init_empty():
+    pts = arrays.PointArray([], dimension=2)
+    assert len(pts) == 0
+    assert pts.dimension == 2
+    assert pts.tolist() == []
+
+
+def test_point_array_init_fail():
+    with pytest.raises(ValueError):
+        arrays.PointArray([[1.0, 2.0], [3.0, 4.0, 5.0]])
+
+
+def test_point_array_getitem(point_array):
+    assert list(point_array[1]) == POINTS[1]
+    assert list(point_array[-1]) == POINTS[-1]
+    assert point_array[1:3] == POINTS[1:3]
+    with pytest.raises(IndexError):
+        point_array[4]
+
+
+def test_point_array_setitem(point_array):
+    # Views share the same buffer
+    pt = point_array[2]
+    point_array[2] = [0.0, 0.5, 1.0]
+    assert list(pt) == [0.0, 0.5, 1.0]
+    pt[0] = 2.0
+    assert list(point_array[2]) == [2.0, 0.5, 1.0]
+    with pytest.raises(ValueError):
+        point_array[0] = [0.0, 0.0]
+
+
+def test_point_array_eq(point_array):
+    assert point_array == POINTS
+    assert point_array == arrays.PointArray(POINTS)
+    assert point_array != POINTS[:-1]
+
+
+def test_point_array_reshape(point_array):
+    pts2d = point_array.reshape(2, 2)
+    assert len(pts2d) == 2
+    assert list(pts2d[1][0]) == POINTS[2]
+    pts2d[1][1] = [0.0, 0.0, 0.0]
+    assert list(point_array[3]) == [0.0, 0.0, 0.0]
+    with pytest.raises(ValueError):
+        point_array.reshape(3, 2)
+
+
+def test_point_array_column(point_array):
+    assert list(point_array.column(-1)) == [3.0, 6.0, 9.0, 12.0]
+    assert list(point_array.reshape(2, 2)[1].column(0)) == [7.0, 10.0]
+    point_array[0] = [1.0, 2.0, 0.5]
+    assert point_array.column(2)[0] == 0.5
+    with pytest.raises(IndexError):
+        point_array.column(3)
+
+
+def test_point_array_deepcopy(point_array):
+    pts2d = point_array.reshape(2, 2)
+    pts_copy, pts2d_copy = copy.deepcopy([point_array, pts2d])
+    assert pts_copy == POINTS
+    point_array[0] = [0.0, 0.0, 0.0]
+    assert list(pts_copy[0]) == POINTS[0]
+    pts_copy[3] = [0.0, 0.0, 0.0]
+    assert list(pts2d_copy[1][1]) == [0.0, 0.0, 0.0]
+
+
+def test_point_array_pickle(point_array):
+    pts = pickle.loads(pickle.dumps(point_array.reshape(2, 2)[1]))
+    assert pts == POINTS[2:]
+
+
+def test_point_array_typecode():
+    pts = arrays.PointArray([[0, 1, 2], [2, 1, 3]], typecode='i')
+    assert pts.data.typecode == 'i'
+    assert pts.nbytes == 2 * 3 * pts.data.itemsize
+    assert list(pts[1]) == [2, 1, 3]
@@ -0,0 +1,141 @@
+"""
+    Tests for the NURBS-Python package
+    Released under The MIT License. See LICENSE file for details.
+    Copyright (c) 2018 Onur Rauf Bingol
+
+    Tests geomdl.bvh module. Requires "pytest" to run.
+"""
+import pytest
+from geomdl import BSpline
+from geomdl import Multi
+from geomdl import bvh
+from geomdl import utilities
+
+GEOMDL_DELTA = 0.001
+KNOT_VECTOR = [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+
+
+def make_surface(offset):
+    """ Creates a B-Spline surface with 3x3 Bezier patches on the xy-plane, translated by the offset """
+    surf = BSpline.Surface()
+    surf.degree_u = 3
+    surf.degree_v = 3
+    surf.set_ctrlpts([[offset + (u * 10.0), v * 10.0, float((u + v) % 3)] for u in range(6) for v in range(6)], 6, 6)
+    surf.knotvector_u = KNOT_VECTOR
+    surf.knotvector_v = KNOT_VECTOR
+    return surf
+
+
+@pytest.fixture
+def multi_surface():
+    """ Creates a MultiSurface instance with 4 surfaces """
+    multi = Multi.MultiSurface()
+    for idx in range(4):
+        multi.add(make_surface(idx * 100.0))
+    return multi
+
+
+def test_bvh_init(multi_surface):
+    tree = bvh.BVH(multi_surface)
+    assert len(tree) == 36
+    assert len(tree.shapes) == 4
+    assert tree.patch_shape(0) == 0
+    assert tree.patch_shape(35) == 3
+    bbmin, bbmax = tree.bbox
+    assert bbmin == (0.0, 0.0, 0.0)
+    assert bbmax == (350.0, 50.0, 2.0)
+
+
+def test_bvh_init_error():
+    with pytest.raises(ValueError):
+        bvh.BVH([])
+    with pytest.raises(TypeError):
+        bvh.BVH([1, 2])
+
+
+def test_bvh_shape_params(multi_surface):
+    tree = bvh.BVH(multi_surface)
+    res = tree.shape_params(4, (0.5, 0.0))
+    assert abs(res[0] - 0.495) < GEOMDL_DELTA
+    assert abs(res[1] - 0.33) < GEOMDL_DELTA
+
+
+def test_bvh_query_box(multi_surface):
+    tree = bvh.BVH(multi_surface)
+    res = tree.query_box(((101.0, 1.0, -1.0), (102.0, 2.0, 1.0)))
+    assert res == [9]
+    assert tree.query_box(((500.0, 0.0, 0.0), (600.0, 10.0, 1.0))) == []
+
+
+def test_bvh_query_ray(multi_surface):
+    tree = bvh.BVH(multi_surface)
+    res = tree.query_ray((225.0, 25.0, 10.0), (0.0, 0.0, -1.0))
+    assert len(res) > 0
+    assert all(tree.patch_shape(idx) == 2 for _, idx in res)
+    assert res == sorted(res)
+    assert tree.query_ray((225.0, 25.0, 10.0), (0.0, 0.0, 1.0)) == []
+
+
+def test_bvh_closest_point(multi_surface):
+    tree = bvh.BVH(multi_surface)
+    point = (321.0, 13.0, 20.0)
+    shape_idx, uv, pt, dist = tree.closest_point(point)
+    assert shape_idx == 3
+
+    # Compare with the closest point of a dense sample of the surface
+    multi_surface[3].sample_size = 101
+    dense_dist = min(utilities.point_distance(evalpt, point) for evalpt in multi_surface[3].evalpts)
+    assert dist <= dense_dist
+    assert dense_dist - dist < 0.01
+    res = multi_surface[3].evaluate_single(uv)
+    assert abs(pt[0] - res[0]) < GEOMDL_DELTA
+    assert abs(pt[1] - res[1]) < GEOMDL_DELTA
+    assert abs(pt[2] - res[2]) < GEOMDL_DELTA
+
+
+def test_bvh_closest_point_dense():
+    # Create a B-Spline surface with 4x4 Bezier patches
+    surf = BSpline.Surface()
+    surf.degree_u = 3
+    surf.degree_v = 3
+    surf.set_ctrlpts([[float(u), float(v), float((u * v) % 3) - 1.0] for u in range(7) for v in range(7)], 7, 7)
+    surf.knotvector_u = [0.0, 0.0, 0.0, 0.0, 0.25, 0.5, 0.75, 1.0, 1.0, 1.0, 1.0]
+    surf.knotvector_v = [0.0, 0.0, 0.0, 0.0, 0.25, 0.5, 0.75, 1.0, 1.0, 1.0, 1.0]
+    tree = bvh.BVH(surf)
+
+    # Compare with the closest points of a dense sample of the surface
+    surf.sample_size = 201
+    for point in [(5.409, 0.184, -1.424), (0.342, 5.851, -1.431), (2.862, 5.192, -0.719), (4.703, 1.82, -0.07)]:
+        shape_idx, uv, pt, dist = tree.closest_point(point)
+        dense_dist = min(utilities.point_distance(evalpt, point) for evalpt in surf.evalpts)
+        assert shape_idx == 0
+        assert dist <= dense_dist
+        assert dense_dist - dist < 0.01
+
+
+def test_bvh_refit(multi_surface):
+    tree = bvh.BVH(multi_surface)
+    multi_surface[1].ctrlpts = [[x, y, z + 50.0] for x, y, z in multi_surface[1].ctrlpts]
+    tree.refit(1)
+    assert tree.bbox[1][2] == 52.0
+    assert tree.query_box(((101.0, 1.0, -1.0), (102.0, 2.0, 1.0))) == []
+
+    # Change the number of the Bezier patches
+    multi_surface[1].insert_knot(0.5, 0.5)
+    with pytest.raises(ValueError):
+        tree.refit(1)
+
+
+def test_bvh_curve():
+    curve = BSpline.Curve()
+    curve.degree = 2
+    curve.ctrlpts = [[0.0, 0.0], [1.0, 1.0], [2.0, 0.0], [3.0, 1.0]]
+    curve.knotvector = [0.0, 0.0, 0.0, 0.5, 1.0, 1.0, 1.0]
+    tree = bvh.BVH(curve)
+    assert len(tree) == 2
+    assert tree.query_ray((-1.0, 0.5), (1.0, 0.0)) == [(1.0, 0), (2.5, 1)]
+
+    shape_idx, u, pt, dist = tree.closest_point((3.0, 1.0))
+    assert shape_idx == 0
+    assert abs(u - 1.0) < GEOMDL_DELTA
+    assert dist < GEOMDL_DELTA
@@ -0,0 +1,71 @@
+"""
+    Tests for the NURBS-Python package
+    Released under The MIT License. See LICENSE file for details.
+    Copyright (c) 2018 Onur Rauf Bingol
+
+    Tests geomdl.elements module. Requires "pytest" to run.
+"""
+import pickle
+import pytest
+from geomdl import elements
+from geomdl import utilities
+
+POINTS = [[float(u), float(v), float(u * v)] for u in range(4) for v in range(3)]
+
+
+@pytest.fixture
+def triangle_mesh():
+    """ Creates a TriangleMesh instance """
+    vertices, triangles, vertices_uv = utilities.make_triangle_mesh(POINTS, 4, 3, index_array=True)
+    return elements.TriangleMesh(points=vertices, uvs=vertices_uv, triangles=triangles)
+
+
+def test_triangle_mesh_init(triangle_mesh):
+    assert len(triangle_mesh.points) == 12
+    assert len(triangle_mesh.uvs) == 12
+    assert len(triangle_mesh.triangle_indices) == 12
+    assert triangle_mesh.triangle_indices.data.typecode == 'i'
+
+
+def test_triangle_mesh_init_error():
+    with pytest.raises(ValueError):
+        elements.TriangleMesh(points=[[0.0, 0.0, 0.0]], uvs=[])
+
+
+def test_triangle_mesh_views(triangle_mesh):
+    vertices, triangles = utilities.make_triangle_mesh(POINTS, 4, 3)
+    assert len(triangle_mesh.vertices) == len(vertices)
+    assert len(triangle_mesh.triangles) == len(triangles)
+    for vertex, res in zip(triangle_mesh.vertices, vertices):
+        assert vertex.id == res.id
+        assert vertex.data == res.data
+        assert vertex.uv == pytest.approx(res.uv)
+    for tri, res in zip(triangle_mesh.triangles, triangles):
+        assert tri.vertex_ids == res.vertex_ids
+        assert tri.vertices_raw == res.vertices_raw
+
+
+def test_triangle_mesh_vertex_update(triangle_mesh):
+    vertex = triangle_mesh.vertices[-1]
+    vertex.data = [1.0, 2.0, 3.0]
+    vertex.inside = True
+    assert list(triangle_mesh.points[11]) == [1.0, 2.0, 3.0]
+    assert triangle_mesh.vertices[11].inside
+    assert triangle_mesh.triangles[-1].vertices[1].z == 3.0
+
+
+def test_triangle_mesh_from_elements(triangle_mesh):
+    vertices, triangles = utilities.make_triangle_mesh(POINTS, 4, 3)
+    triangles[0].inside = True
+    mesh = elements.TriangleMesh.from_elements(vertices, triangles)
+    assert mesh.points == triangle_mesh.points
+    assert mesh.triangle_indices == triangle_mesh.triangle_indices
+    assert mesh.triangles[0].inside
+    assert not mesh.triangles[1].inside
+
+
+def test_triangle_mesh_pickle(triangle_mesh):
+    mesh = pickle.loads(pickle.dumps(triangle_mesh, protocol=2))
+    assert mesh.points == triangle_mesh.points
+    assert mesh.uvs == triangle_mesh.uvs
+    assert mesh.triangle_indices == triangle_mesh.triangle_indices
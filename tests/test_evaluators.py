@@ -0,0 +1,281 @@
+"""
+    Tests for the NURBS-Python package
+    Released under The MIT License. See LICENSE file for details.
+    Copyright (c) 2018 Onur Rauf Bingol
+
+    Tests geomdl.evaluators module. Requires "pytest" to run.
+"""
+import pytest
+from geomdl import Abstract
+from geomdl import BSpline
+from geomdl import NURBS
+from geomdl import evaluators
+from geomdl import utilities
+from geomdl.elements import Vertex
+
+GEOMDL_DELTA = 10e-8
+CONTROL_POINTS = [[5.0, 15.0, 0.0], [10.0, 25.0, 5.0], [20.0, 20.0, 10.0], [15.0, -5.0, 15.0], [7.5, 10.0, 20.0],
+                  [12.5, 15.0, 25.0], [15.0, 0.0, 30.0], [5.0, -10.0, 35.0], [10.0, 15.0, 40.0], [5.0, 15.0, 30.0]]
+KNOT_VECTOR = [0.0, 0.0, 0.0, 0.0, 0.0, 0.1, 0.3, 0.5, 0.7, 0.9, 1.0, 1.0, 1.0, 1.0, 1.0]
+
+
+class CustomEvaluator(Abstract.Evaluator):
+    """ Evaluator which only implements the methods required by the Abstract.Evaluator """
+
+    def __init__(self, **kwargs):
+        super(CustomEvaluator, self).__init__(**kwargs)
+        self._base = evaluators.NURBSSurfaceEvaluator()
+
+    def evaluate_single(self, **kwargs):
+        return self._base.evaluate_single(**kwargs)
+
+    def evaluate(self, **kwargs):
+        return self._base.evaluate(**kwargs)
+
+    def derivatives_single(self, **kwargs):
+        return self._base.derivatives_single(**kwargs)
+
+    def derivatives(self, **kwargs):
+        return self._base.derivatives(**kwargs)
+
+
+class CustomSurfaceEvaluator(CustomEvaluator, Abstract.SurfaceEvaluator):
+    """ Surface evaluator which does not implement ``evaluate_list`` """
+
+    def insert_knot_u(self, **kwargs):
+        return self._base.insert_knot_u(**kwargs)
+
+    def insert_knot_v(self, **kwargs):
+        return self._base.insert_knot_v(**kwargs)
+
+
+@pytest.fixture
+def bspline_curve():
+    """ Creates a B-Spline curve instance """
+    curve = BSpline.Curve()
+    curve.degree = 4
+    curve.ctrlpts = CONTROL_POINTS
+    curve.knotvector = KNOT_VECTOR
+    curve.sample_size = 50
+    return curve
+
+
+@pytest.fixture
+def nurbs_curve():
+    """ Creates a NURBS curve instance """
+    curve = NURBS.Curve()
+    curve.degree = 4
+    curve.ctrlptsw = [[c * w for c in pt] + [w] for pt, w in
+                      zip(CONTROL_POINTS, [1.0, 0.5, 2.0, 1.0, 0.75, 1.0, 1.5, 1.0, 0.5, 1.0])]
+    curve.knotvector = KNOT_VECTOR
+    curve.sample_size = 50
+    return curve
+
+
+def test_curve_evaluator_numpy(bspline_curve):
+    np = pytest.importorskip("numpy")
+
+    # Evaluate with the default evaluator
+    res = bspline_curve.evalpts
+
+    # Switch to the vectorized evaluator
+    bspline_curve.evaluator = evaluators.CurveEvaluatorNumPy()
+    bspline_curve.evaluate()
+    to_check = bspline_curve.evalpts
+
+    assert isinstance(to_check, np.ndarray)
+    assert to_check.shape == (len(res), 3)
+    assert to_check.flags['C_CONTIGUOUS']
+    assert np.allclose(to_check, res, atol=GEOMDL_DELTA)
+
+
+def test_curve_evaluator_numpy_range(bspline_curve):
+    np = pytest.importorskip("numpy")
+
+    # Evaluate a segment with the default evaluator
+    bspline_curve.evaluate(start=0.15, stop=0.85)
+    res = bspline_curve.evalpts
+
+    # Switch to the vectorized evaluator
+    bspline_curve.evaluator = evaluators.CurveEvaluatorNumPy()
+    bspline_curve.evaluate(start=0.15, stop=0.85)
+
+    assert np.allclose(bspline_curve.evalpts, res, atol=GEOMDL_DELTA)
+
+
+def test_nurbs_curve_evaluator_numpy(nurbs_curve):
+    np = pytest.importorskip("numpy")
+
+    # Evaluate with the default evaluator
+    res = nurbs_curve.evalpts
+
+    # Switch to the vectorized evaluator
+    nurbs_curve.evaluator = evaluators.NURBSCurveEvaluatorNumPy()
+    nurbs_curve.evaluate()
+    to_check = nurbs_curve.evalpts
+
+    assert to_check.shape == (len(res), 3)
+    assert np.allclose(to_check, res, atol=GEOMDL_DELTA)
+
+
+def test_curve_evaluator_numpy_insert_knot(bspline_curve):
+    pytest.importorskip("numpy")
+
+    bspline_curve.evaluator = evaluators.CurveEvaluatorNumPy()
+    bspline_curve.evaluate()
+
+    # Knot insertion re-evaluates the curve using the same evaluator
+    bspline_curve.insert_knot(0.4)
+
+    assert len(bspline_curve.evalpts) == bspline_curve.sample_size
+
+
+@pytest.fixture
+def nurbs_surface():
+    """ Creates a NURBS surface instance """
+    surf = NURBS.Surface()
+    surf.degree_u = 3
+    surf.degree_v = 2
+    surf.set_ctrlpts([[float(i), float(j), float((i * j) % 3), 1.0 + 0.25 * ((i + j) % 2)]
+                      for i in range(6) for j in range(5)], 6, 5)
+    surf.knotvector_u = [0.0, 0.0, 0.0, 0.0, 0.33, 0.66, 1.0, 1.0, 1.0, 1.0]
+    surf.knotvector_v = [0.0, 0.0, 0.0, 0.4, 0.7, 1.0, 1.0, 1.0]
+    surf.sample_size = 15
+    return surf
+
+
+def test_surface_evaluate_single(nurbs_surface):
+    # Tensor product evaluation should be consistent with the single point evaluation
+    evalpts = nurbs_surface.evalpts
+    knots = utilities.linspace(0.0, 1.0, 15, decimals=6)
+    params = [(u, v) for u in knots for v in knots]
+
+    for idx in (0, 17, 112, 203, 224):
+        res = nurbs_surface.evaluate_single(params[idx])
+        assert abs(evalpts[idx][0] - res[0]) < GEOMDL_DELTA
+        assert abs(evalpts[idx][1] - res[1]) < GEOMDL_DELTA
+        assert abs(evalpts[idx][2] - res[2]) < GEOMDL_DELTA
+
+
+def test_surface_evaluator_numpy(nurbs_surface):
+    np = pytest.importorskip("numpy")
+
+    # Evaluate with the default evaluator
+    nurbs_surface.evaluate(start_u=0.1, stop_v=0.8)
+    res = nurbs_surface.evalpts
+
+    # Switch to the vectorized evaluator
+    nurbs_surface.evaluator = evaluators.NURBSSurfaceEvaluatorNumPy()
+    nurbs_surface.evaluate(start_u=0.1, stop_v=0.8)
+    to_check = nurbs_surface.evalpts
+
+    assert to_check.shape == (len(res), 3)
+    assert np.allclose(to_check, res, atol=GEOMDL_DELTA)
+
+
+def test_bspline_surface_evaluator_numpy():
+    np = pytest.importorskip("numpy")
+
+    surf = BSpline.Surface()
+    surf.degree_u = 2
+    surf.degree_v = 2
+    surf.set_ctrlpts([[0, 0, 0], [0, 1, 0], [0, 2, -3], [1, 0, 6], [1, 1, 0], [1, 2, 0], [2, 0, 0], [2, 1, 0],
+                      [2, 2, 3]], 3, 3)
+    surf.knotvector_u = [0, 0, 0, 1, 1, 1]
+    surf.knotvector_v = [0, 0, 0, 1, 1, 1]
+    surf.sample_size = 5
+    res = surf.evalpts
+
+    surf.evaluator = evaluators.SurfaceEvaluatorNumPy()
+    surf.evaluate()
+
+    assert np.allclose(surf.evalpts, res, atol=GEOMDL_DELTA)
+
+
+def test_curve_derivatives_list(bspline_curve):
+    params = [0.9, 0.05, 0.35, 0.35, 0.0, 1.0]
+    res = [bspline_curve.derivatives(u, 3) for u in params]
+
+    assert bspline_curve.derivatives_list(params, 3) == res
+
+
+def test_nurbs_curve_derivatives_list(nurbs_curve):
+    params = [0.9, 0.05, 0.35, 0.35, 0.0, 1.0]
+    res = [nurbs_curve.derivatives(u, 2) for u in params]
+
+    assert nurbs_curve.derivatives_list(params, 2) == res
+
+
+def test_curve_evaluator_derivatives_range(bspline_curve):
+    ders = bspline_curve.evaluator.derivatives(start_u=0.0, stop_u=1.0, sample_size=11, precision=6, deriv_order=1,
+                                               degree=bspline_curve.degree, knotvector=bspline_curve.knotvector,
+                                               ctrlpts=bspline_curve.ctrlpts, dimension=bspline_curve.dimension)
+
+    assert len(ders) == 11
+    assert ders[4] == bspline_curve.derivatives(0.4, 1)
+
+
+def test_nurbs_surface_derivatives_list(nurbs_surface):
+    params = [(0.2, 0.9), (0.0, 0.0), (1.0, 1.0), (0.5, 0.4), (0.2, 0.1)]
+    res = [nurbs_surface.derivatives(u, v, 2) for u, v in params]
+
+    assert nurbs_surface.derivatives_list(params, 2) == res
+
+
+def test_basis_cache(bspline_curve):
+    bspline_curve.evaluator = evaluators.CurveEvaluator(basis_cache_size=2)
+    bspline_curve.evaluate()
+    res = bspline_curve.evalpts
+
+    # Moving a control point keeps the knot vector and the parameter range, the cached basis should be reused
+    ctrlpts = list(bspline_curve.ctrlpts)
+    ctrlpts[3] = [15.0, -5.0, 10.0]
+    bspline_curve.ctrlpts = ctrlpts
+    bspline_curve.evaluate()
+
+    assert bspline_curve.evaluator.basis_cache_info == dict(hits=1, misses=1, size=1, maxsize=2)
+    assert bspline_curve.evalpts[0] == res[0]
+    assert bspline_curve.evalpts[25] != res[25]
+
+
+def test_basis_cache_eviction(bspline_curve):
+    bspline_curve.evaluator = evaluators.CurveEvaluator(basis_cache_size=2)
+    bspline_curve.evaluate(start=0.0)
+    bspline_curve.evaluate(start=0.1)
+    bspline_curve.evaluate(start=0.0)
+    bspline_curve.evaluate(start=0.2)  # evicts start=0.1
+    bspline_curve.evaluate(start=0.1)
+
+    assert bspline_curve.evaluator.basis_cache_info == dict(hits=1, misses=4, size=2, maxsize=2)
+
+    bspline_curve.evaluator.clear_basis_cache()
+    assert bspline_curve.evaluator.basis_cache_info == dict(hits=0, misses=0, size=0, maxsize=2)
+
+
+def test_basis_cache_disabled(bspline_curve):
+    bspline_curve.evaluator = evaluators.CurveEvaluator(basis_cache_size=0)
+    bspline_curve.evaluate()
+    bspline_curve.evaluate()
+
+    assert bspline_curve.evaluator.basis_cache_info == dict(hits=0, misses=2, size=0, maxsize=0)
+
+
+@pytest.mark.parametrize("evaluator", [CustomEvaluator, CustomSurfaceEvaluator])
+def test_surface_evaluator_custom_vertices(nurbs_surface, evaluator):
+    nurbs_surface.evaluator = evaluator()
+    nurbs_surface.evaluate()
+
+    # Vertices on and off the evaluation grid
+    vertices = []
+    for uv in [(0.0, 0.0), (0.5, 0.5), (0.2, 0.7), (0.33, 0.35), (1.0, 0.9)]:
+        vertex = Vertex()
+        vertex.uv = uv
+        vertices.append(vertex)
+    utilities._update_vertices(vertices, nurbs_surface.evalpts, nurbs_surface.evaluator,
+                               nurbs_surface._evaluate_args())
+
+    for vertex in vertices:
+        res = nurbs_surface.evaluate_single(vertex.uv)
+        assert abs(vertex.x - res[0]) < GEOMDL_DELTA
+        assert abs(vertex.y - res[1]) < GEOMDL_DELTA
+        assert abs(vertex.z - res[2]) < GEOMDL_DELTA
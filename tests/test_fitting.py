@@ -0,0 +1,208 @@
+"""
+    Tests for the NURBS-Python package
+    Released under The MIT License. See LICENSE file for details.
+    Copyright (c) 2018 Onur Rauf Bingol
+
+    Tests geomdl.fitting module. Requires "pytest" to run.
+"""
+import pytest
+from geomdl import BSpline
+from geomdl import fitting
+from geomdl import utilities
+
+GEOMDL_DELTA = 0.001
+POINTS_CURVE = [[0.0, 0.0], [3.0, 4.0], [-1.0, 4.0], [-4.0, 0.0], [-4.0, -3.0]]
+POINTS_SURFACE = [[float(u), float(v), float((u * v) % 3)] for u in range(5) for v in range(4)]
+
+
+def test_compute_params_curve():
+    uk = fitting.compute_params_curve(POINTS_CURVE)
+    assert uk == [0.0, 5.0 / 17.0, 9.0 / 17.0, 14.0 / 17.0, 1.0]
+
+    uk = fitting.compute_params_curve(POINTS_CURVE, centripetal=True)
+    assert abs(uk[1] - (5.0 ** 0.5) / (5.0 ** 0.5 + 2.0 + 5.0 ** 0.5 + 3.0 ** 0.5)) < GEOMDL_DELTA
+    assert uk[-1] == 1.0
+
+    with pytest.raises(ValueError):
+        fitting.compute_params_curve([[1.0, 1.0], [1.0, 1.0]])
+
+
+def test_compute_knot_vector():
+    kv = fitting.compute_knot_vector(3, 5, [0.0, 5.0 / 17.0, 9.0 / 17.0, 14.0 / 17.0, 1.0])
+    assert len(kv) == 9
+    assert kv[0:4] == [0.0, 0.0, 0.0, 0.0]
+    assert kv[5:] == [1.0, 1.0, 1.0, 1.0]
+    assert abs(kv[4] - (28.0 / 51.0)) < GEOMDL_DELTA
+
+
+@pytest.mark.parametrize("degree, centripetal", [(1, False), (2, False), (3, False), (4, False), (3, True)])
+def test_interpolate_curve(degree, centripetal):
+    curve = fitting.interpolate_curve(POINTS_CURVE, degree, centripetal=centripetal)
+    assert curve.degree == degree
+    assert len(curve.ctrlpts) == len(POINTS_CURVE)
+
+    # The curve passes through the data points
+    uk = fitting.compute_params_curve(POINTS_CURVE, centripetal=centripetal)
+    for u, pt in zip(uk, POINTS_CURVE):
+        res = curve.curvept(u)
+        assert abs(res[0] - pt[0]) < GEOMDL_DELTA
+        assert abs(res[1] - pt[1]) < GEOMDL_DELTA
+
+
+def test_interpolate_curve_error():
+    with pytest.raises(ValueError):
+        fitting.interpolate_curve(POINTS_CURVE, 0)
+    with pytest.raises(ValueError):
+        fitting.interpolate_curve(POINTS_CURVE, 5)
+
+
+def test_interpolate_surface():
+    surf = fitting.interpolate_surface(POINTS_SURFACE, 5, 4, 3, 2)
+    assert surf.degree_u == 3
+    assert surf.degree_v == 2
+    assert surf.ctrlpts_size_u == 5
+    assert surf.ctrlpts_size_v == 4
+
+    # The surface passes through the data points
+    uk, vl = fitting.compute_params_surface(POINTS_SURFACE, 5, 4)
+    for u in range(5):
+        for v in range(4):
+            res = surf.surfpt(uk[u], vl[v])
+            pt = POINTS_SURFACE[v + (4 * u)]
+            assert abs(res[0] - pt[0]) < GEOMDL_DELTA
+            assert abs(res[1] - pt[1]) < GEOMDL_DELTA
+            assert abs(res[2] - pt[2]) < GEOMDL_DELTA
+
+
+def test_interpolate_surface_error():
+    with pytest.raises(ValueError):
+        fitting.interpolate_surface(POINTS_SURFACE, 4, 4, 3, 2)
+    with pytest.raises(ValueError):
+        fitting.interpolate_surface(POINTS_SURFACE, 5, 4, 3, 4)
+
+
+@pytest.fixture
+def spline_curve():
+    """ Creates a B-Spline curve to be approximated """
+    curve = BSpline.Curve()
+    curve.degree = 3
+    curve.ctrlpts = [[0.0, 0.0, 0.0], [1.0, 2.0, 0.0], [3.0, 1.0, 1.0], [4.0, 3.0, 0.0], [6.0, 0.0, 2.0],
+                     [7.0, 1.0, 1.0]]
+    curve.knotvector = utilities.generate_knot_vector(3, 6)
+    return curve
+
+
+def test_compute_knot_vector_approx():
+    kv = fitting.compute_knot_vector_approx(2, 4, [0.0, 0.1, 0.3, 0.5, 0.6, 1.0])
+    assert kv == [0.0, 0.0, 0.0, 0.3, 1.0, 1.0, 1.0]
+
+    with pytest.raises(ValueError):
+        fitting.compute_knot_vector_approx(2, 4, [0.0, 0.5, 1.0])
+
+
+@pytest.mark.parametrize("fixed_ends", [True, False])
+def test_approximate_curve_reproduce(spline_curve, fixed_ends):
+    params = [float(i) / 99.0 for i in range(100)]
+    points = [spline_curve.curvept(u) for u in params]
+
+    # A curve in the approximation space is reproduced
+    curve = fitting.approximate_curve(points, 3, 6, params=params, knotvector=spline_curve.knotvector,
+                                      fixed_ends=fixed_ends)
+    for pt1, pt2 in zip(curve.ctrlpts, spline_curve.ctrlpts):
+        assert abs(pt1[0] - pt2[0]) < GEOMDL_DELTA
+        assert abs(pt1[1] - pt2[1]) < GEOMDL_DELTA
+        assert abs(pt1[2] - pt2[2]) < GEOMDL_DELTA
+
+
+def test_approximate_curve_iterator(spline_curve):
+    params = [float(i) / 99.0 for i in range(100)]
+    points = [spline_curve.curvept(u) for u in params]
+    curve1 = fitting.approximate_curve(points, 3, 8)
+
+    # The results do not depend on the chunks
+    curve2 = fitting.approximate_curve((pt for pt in points), 3, 8, params=iter(fitting.compute_params_curve(points)),
+                                       knotvector=curve1.knotvector, chunk_size=7)
+    for pt1, pt2 in zip(curve1.ctrlpts, curve2.ctrlpts):
+        assert abs(pt1[0] - pt2[0]) < GEOMDL_DELTA
+        assert abs(pt1[1] - pt2[1]) < GEOMDL_DELTA
+        assert abs(pt1[2] - pt2[2]) < GEOMDL_DELTA
+
+
+def test_approximate_curve_fixed_ends():
+    curve = fitting.approximate_curve(POINTS_CURVE, 2, 4)
+    assert curve.ctrlpts[0] == tuple(POINTS_CURVE[0])
+    assert curve.ctrlpts[-1] == tuple(POINTS_CURVE[-1])
+    assert len(curve.knotvector) == 7
+
+    curve = fitting.approximate_curve(POINTS_CURVE, 1, 2)
+    assert curve.ctrlpts == ((0.0, 0.0), (-4.0, -3.0))
+
+
+def test_approximate_curve_weights(spline_curve):
+    params = [float(i) / 99.0 for i in range(100)]
+    points = [spline_curve.curvept(u) for u in params]
+    uk = fitting.compute_params_curve(points)
+    weights = [1.0 for _ in range(100)]
+    weights[50] = 100.0
+
+    # A heavily weighted point attracts the curve
+    curve1 = fitting.approximate_curve(points, 2, 5, fixed_ends=False)
+    curve2 = fitting.approximate_curve(points, 2, 5, fixed_ends=False, weights=weights)
+    dist1 = utilities.point_distance(curve1.curvept(uk[50]), points[50])
+    dist2 = utilities.point_distance(curve2.curvept(uk[50]), points[50])
+    assert dist2 < dist1
+
+
+def test_approximate_curve_error():
+    with pytest.raises(ValueError):
+        fitting.approximate_curve(POINTS_CURVE, 0, 4)
+    with pytest.raises(ValueError):
+        fitting.approximate_curve(POINTS_CURVE, 3, 3)
+    with pytest.raises(ValueError):
+        fitting.approximate_curve(POINTS_CURVE, 2, 6, params=[0.0, 0.25, 0.5, 0.75, 1.0],
+                                  knotvector=utilities.generate_knot_vector(2, 6))
+    with pytest.raises(TypeError):
+        fitting.approximate_curve(iter(POINTS_CURVE), 2, 4)
+
+
+def test_approximate_surface():
+    surf = BSpline.Surface()
+    surf.degree_u = 3
+    surf.degree_v = 2
+    surf.set_ctrlpts(POINTS_SURFACE, 5, 4)
+    surf.knotvector_u = utilities.generate_knot_vector(3, 5)
+    surf.knotvector_v = utilities.generate_knot_vector(2, 4)
+    params = [(float(u) / 14.0, float(v) / 14.0) for u in range(15) for v in range(15)]
+    points = [surf.surfpt(u, v) for u, v in params]
+
+    # A surface in the approximation space is reproduced
+    res = fitting.approximate_surface(points, 3, 2, 5, 4, params=params, chunk_size=50)
+    assert res.ctrlpts_size_u == 5
+    assert res.ctrlpts_size_v == 4
+    for pt1, pt2 in zip(res.ctrlpts, POINTS_SURFACE):
+        assert abs(pt1[0] - pt2[0]) < GEOMDL_DELTA
+        assert abs(pt1[1] - pt2[1]) < GEOMDL_DELTA
+        assert abs(pt1[2] - pt2[2]) < GEOMDL_DELTA
+
+
+def test_approximate_surface_grid():
+    surf = fitting.approximate_surface(POINTS_SURFACE, 3, 2, 5, 4, size_u=5, size_v=4)
+
+    # The approximation of a data grid with equal size is the interpolation
+    uk, vl = fitting.compute_params_surface(POINTS_SURFACE, 5, 4)
+    for u in range(5):
+        for v in range(4):
+            res = surf.surfpt(uk[u], vl[v])
+            pt = POINTS_SURFACE[v + (4 * u)]
+            assert abs(res[0] - pt[0]) < GEOMDL_DELTA
+            assert abs(res[1] - pt[1]) < GEOMDL_DELTA
+            assert abs(res[2] - pt[2]) < GEOMDL_DELTA
+
+
+def test_approximate_surface_error():
+    with pytest.raises(ValueError):
+        fitting.approximate_surface(POINTS_SURFACE, 3, 2, 5, 4)
+    with pytest.raises(ValueError):
+        fitting.approximate_surface(POINTS_SURFACE, 3, 2, 3, 4, size_u=5, size_v=4)
+    with pytest.raises(ValueError):
+        fitting.approximate_surface(POINTS_SURFACE, 3, 2, 5, 4, size_u=4, size_v=4)
@@ -21,6 +21,30 @@ def test_find_span_binsearch():
 
 	assert to_check == result
 
+def test_find_span_bisect():
+	degree = 2
+	knot_vector = [0, 0, 0, 1, 2, 3, 4, 4, 5, 5, 5]
+	num_ctrlpts = len(knot_vector) - degree - 1
+
+	for knot in [0.0, 0.5, 1.0, 2.5, 4.0, 4.5, 5.0]:
+		to_check = helpers.find_span_bisect(degree, knot_vector, num_ctrlpts, knot)
+		result = helpers.find_span_linear(degree, knot_vector, num_ctrlpts, knot)
+		assert to_check == result
+
+	# Clamped end
+	assert helpers.find_span_bisect(degree, knot_vector, num_ctrlpts, 5.0) == num_ctrlpts - 1
+
+def test_find_spans():
+	degree = 2
+	knot_vector = [0, 0, 0, 1, 2, 3, 4, 4, 5, 5, 5]
+	num_ctrlpts = len(knot_vector) - degree - 1
+	knots = [0.0, 0.5, 1.0, 2.5, 4.0, 4.5, 5.0, 3.0, 0.2, 4.9]
+
+	to_check = helpers.find_spans(degree, knot_vector, num_ctrlpts, knots)
+	result = [helpers.find_span_linear(degree, knot_vector, num_ctrlpts, knot) for knot in knots]
+
+	assert to_check == result
+
 def test_basis_function():
 	degree = 2
 	knot_vector = [0, 0, 0, 1, 2, 3, 4, 4, 5, 5, 5]
@@ -7,6 +7,7 @@
 """
 
 import os
+import struct
 import pytest
 from geomdl import BSpline, NURBS
 from geomdl import exchange
@@ -176,6 +177,31 @@ def test_export_stl_single(nurbs_surface):
         os.remove(fname)
 
 
+# Tests the contents of the binary .stl file
+def test_export_stl_binary_single_triangles(nurbs_surface):
+    fname = FILE_NAME + ".stl"
+
+    nurbs_surface.sample_size = SAMPLE_SIZE
+    exchange.export_stl(nurbs_surface, fname, vertex_spacing=2)
+
+    with open(fname, 'rb') as fp:
+        data = fp.read()
+    num_triangles = struct.unpack('<i', data[80:84])[0]
+    assert num_triangles == 2 * 12 * 12
+    assert len(data) == 84 + (50 * num_triangles)
+
+    # Compare with the triangles generated by the tessellation component
+    nurbs_surface.tessellate(vertex_spacing=2)
+    for idx, tri in enumerate(nurbs_surface.tessellator.triangles):
+        record = struct.unpack('<12fH', data[84 + (50 * idx):84 + (50 * (idx + 1))])
+        for coord, coord_tri in zip(record[3:12], [c for vertex in tri.vertices for c in vertex.data]):
+            assert abs(coord - coord_tri) < 0.001
+
+    # Clean up temporary file if exists
+    if os.path.isfile(fname):
+        os.remove(fname)
+
+
 # Tests if the .stl file exists (ascii)
 def test_export_stl_ascii_single(nurbs_surface):
     fname = FILE_NAME + ".stl"
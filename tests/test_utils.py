@@ -335,3 +335,20 @@ def test_point_mid():
     result = (2.5, 3.5, 4.5)
     computed = utilities.point_mid((1, 2, 3), (4, 5, 6))
     assert result == computed
+
+
+def test_make_triangle_mesh_index_array():
+    points = [[float(u), float(v), 0.0] for u in range(5) for v in range(4)]
+    vertices, triangles = utilities.make_triangle_mesh(points, 5, 4)
+    verts, tris, uvs = utilities.make_triangle_mesh(points, 5, 4, index_array=True)
+    assert len(verts) == len(vertices)
+    assert len(uvs) == len(vertices)
+    assert [list(v) for v in verts] == [list(v.data) for v in vertices]
+    assert [list(t) for t in tris] == [list(t.vertex_ids_zero) for t in triangles]
+
+
+def test_make_triangle_mesh_vertex_spacing():
+    points = [[float(u), float(v), 0.0] for u in range(5) for v in range(5)]
+    vertices, triangles = utilities.make_triangle_mesh(points, 5, 5, vertex_spacing=3)
+    assert len(vertices) == 4
+    assert len(triangles) == 2